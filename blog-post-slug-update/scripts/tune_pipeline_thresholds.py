@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Tune Iteration Pipeline Thresholds
+
+Sweep the breakthrough detection thresholds against labeled historical
+scenarios and save the best set for IterationPipeline to load.
+
+Input is a JSON list of {"scenario": {...}, "breakthrough": true|false},
+where scenario has the shape taken by detect_breakthrough_potential.
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+# Add src to path for imports
+src_path = Path(__file__).parent.parent / "src"
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from evaluation.improvement.iteration_pipeline import PipelineThresholds, tune_breakthrough_thresholds
+
+
+def main():
+    """Tune thresholds from a labeled scenario file"""
+    parser = argparse.ArgumentParser(description='Tune breakthrough detection thresholds')
+    parser.add_argument('labeled_scenarios', help='JSON file of labeled breakthrough scenarios')
+    parser.add_argument('--output', '-o', default='thresholds.json', help='Where to save the tuned thresholds')
+    parser.add_argument('--base', help='Thresholds file to start from (defaults otherwise)')
+    args = parser.parse_args()
+
+    with open(args.labeled_scenarios, 'r', encoding='utf-8') as f:
+        labeled = [(item['scenario'], bool(item['breakthrough'])) for item in json.load(f)]
+
+    base = PipelineThresholds.from_file(args.base) if args.base else PipelineThresholds()
+    tuned = tune_breakthrough_thresholds(labeled, base)
+    tuned.to_file(args.output)
+
+    print(f"Tuned on {len(labeled)} scenarios -> {args.output}")
+    print(json.dumps(asdict(tuned), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -15,6 +15,18 @@ class SlugGeneratorConfig:
     OPENAI_MODEL = "gpt-4o-mini"
     MAX_TOKENS = 500
     TEMPERATURE = 0.3
+    MAX_CONCURRENCY = 20         # In-flight requests for async batch generation
+    MAX_REQUESTS_PER_MINUTE = 500      # Client-side RPM budget (gpt-4o-mini tier 1)
+    MAX_TOKENS_PER_MINUTE = 200000     # Client-side TPM budget (gpt-4o-mini tier 1)
+    RATE_LIMIT_PAUSE_SECONDS = 15.0    # Hold new launches after an HTTP 429
+    BATCH_POLL_INTERVAL = 30.0         # Seconds between Batch API status checks
+    HTTP_MAX_CONNECTIONS = 1024        # AsyncOpenAI connection pool size
+    HTTP_MAX_KEEPALIVE = 256           # Idle connections kept open between bursts
+    HTTP_KEEPALIVE_EXPIRY = 60.0       # Seconds an idle connection stays reusable
+    
+    # Response Cache (only used when TEMPERATURE == 0, i.e. deterministic output)
+    CACHE_ENABLED = False
+    CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "slug-generator")
     
     # Retry Configuration
     MAX_RETRIES = 3
@@ -181,6 +193,11 @@ class SlugGeneratorConfig:
             'openai_model': cls.OPENAI_MODEL,
             'max_tokens': cls.MAX_TOKENS,
             'temperature': cls.TEMPERATURE,
+            'max_concurrency': cls.MAX_CONCURRENCY,
+            'rate_limit_pause_seconds': cls.RATE_LIMIT_PAUSE_SECONDS,
+            'max_requests_per_minute': cls.MAX_REQUESTS_PER_MINUTE,
+            'max_tokens_per_minute': cls.MAX_TOKENS_PER_MINUTE,
+            'cache_enabled': cls.CACHE_ENABLED,
             'max_retries': cls.MAX_RETRIES,
             'retry_base_delay': cls.RETRY_BASE_DELAY,
             'api_content_limit': cls.API_CONTENT_LIMIT,
@@ -2,13 +2,14 @@
 
 from core.slug_generator import SlugGenerator
 from core.content_extractor import extract_title_and_content, is_url, fetch_url_content
-from core.validators import clean_slug, validate_slug
+from core.validators import check_slug, clean_slug, validate_slug
 
 __all__ = [
     'SlugGenerator',
     'extract_title_and_content',
     'is_url', 
     'fetch_url_content',
+    'check_slug',
     'clean_slug',
     'validate_slug'
 ]
\ No newline at end of file
@@ -62,6 +62,7 @@ class ComponentConfiguration:
     backup_enabled: bool = True
     checkpoint_interval: int = 100
     enable_recovery: bool = True
+    progress_persist_every: int = 50
 
 
 class ComponentFactory:
@@ -100,7 +101,8 @@ class ComponentFactory:
         # Progress tracker is not cached since it depends on total_count
         return SynchronizedProgressTracker(
             total_count=total_count,
-            output_dir=config.output_dir
+            output_dir=config.output_dir,
+            persist_every_n=config.progress_persist_every
         )
     
     def create_configuration_pipeline(self, config: ComponentConfiguration) -> Any:
@@ -8,7 +8,12 @@ import re
 import requests
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse
-from typing import Tuple
+from typing import Tuple, Union
+
+# Professional Practice #1: Always set a proper User-Agent
+REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Slug-Generator/1.0) AppleWebKit/537.36'
+}
 
 
 def fetch_url_content(url: str) -> str:
@@ -23,14 +28,9 @@ def fetch_url_content(url: str) -> str:
     5. Text extraction from HTML while preserving structure
     """
     
-    # Professional Practice #1: Always set a proper User-Agent
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Slug-Generator/1.0) AppleWebKit/537.36'
-    }
-    
     try:
         # Professional Practice #2: Set timeouts to prevent hanging
-        response = requests.get(url, headers=headers, timeout=(10, 30))
+        response = requests.get(url, headers=REQUEST_HEADERS, timeout=(10, 30))
         
         # Professional Practice #3: Check status code
         response.raise_for_status()
@@ -78,12 +78,8 @@ def extract_title_and_content(url: str) -> Tuple[str, str]:
     Extract title and content separately for better slug generation.
     Returns (title, content) tuple.
     """
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Slug-Generator/1.0) AppleWebKit/537.36'
-    }
-    
     try:
-        response = requests.get(url, headers=headers, timeout=(10, 30))
+        response = requests.get(url, headers=REQUEST_HEADERS, timeout=(10, 30))
         response.raise_for_status()
         
         content_type = response.headers.get('content-type', '').lower()
@@ -91,24 +87,7 @@ def extract_title_and_content(url: str) -> Tuple[str, str]:
             raise ValueError(f"URL does not contain HTML content. Content-Type: {content_type}")
         
         response.encoding = response.apparent_encoding or 'utf-8'
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Extract title
-        title = ""
-        if soup.title:
-            title = soup.title.get_text(strip=True)
-        elif soup.h1:
-            title = soup.h1.get_text(strip=True)
-        
-        # Remove unwanted elements for content
-        for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside']):
-            element.decompose()
-        
-        # Extract content
-        content = soup.get_text(separator=' ', strip=True)
-        content = re.sub(r'\s+', ' ', content).strip()
-        
-        return title, content
+        return parse_title_and_content(response.text)
         
     except Exception as e:
         # Fallback to basic fetch_url_content
@@ -116,6 +95,31 @@ def extract_title_and_content(url: str) -> Tuple[str, str]:
         return "", text
 
 
+def parse_title_and_content(html: Union[str, bytes]) -> Tuple[str, str]:
+    """
+    Parse title and readable content from an already-fetched HTML document.
+    Raw bytes are accepted and decoded by BeautifulSoup's encoding detection.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    
+    # Extract title
+    title = ""
+    if soup.title:
+        title = soup.title.get_text(strip=True)
+    elif soup.h1:
+        title = soup.h1.get_text(strip=True)
+    
+    # Remove unwanted elements for content
+    for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside']):
+        element.decompose()
+    
+    # Extract content
+    content = soup.get_text(separator=' ', strip=True)
+    content = re.sub(r'\s+', ' ', content).strip()
+    
+    return title, content
+
+
 def is_url(string: str) -> bool:
     """Check if a string is a valid HTTP/HTTPS URL."""
     try:
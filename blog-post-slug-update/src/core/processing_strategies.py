@@ -168,6 +168,8 @@ class StandardProcessingStrategy(ProcessingStrategy):
         """Process URLs sequentially"""
         start_time = time.time()
         result = self._create_base_result()
+        # Tracker created here (not injected by the caller), closed before returning
+        owned_tracker = None
         
         try:
             with self.context.processing_lock:
@@ -179,6 +181,7 @@ class StandardProcessingStrategy(ProcessingStrategy):
                     config = ComponentConfiguration(output_dir=self.context.output_dir)
                     progress_tracker = factory.create_progress_tracker(config, len(urls))
                     self.components['progress_tracker'] = progress_tracker
+                    owned_tracker = progress_tracker
                 
                 # Handle resume
                 start_index = self._handle_resume(resume, result)
@@ -210,6 +213,14 @@ class StandardProcessingStrategy(ProcessingStrategy):
                 result.success = False
                 result.error_classifications.append('CRITICAL_FAILURE')
         
+        finally:
+            # Write any batched progress and stop the tracker's writer thread,
+            # also when processing failed part-way
+            if owned_tracker is not None:
+                owned_tracker.close()
+                if self.components.get('progress_tracker') is owned_tracker:
+                    del self.components['progress_tracker']
+        
         return result
     
     def _handle_resume(self, resume: bool, result: ProcessingResult) -> int:
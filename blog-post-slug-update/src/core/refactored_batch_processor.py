@@ -217,6 +217,7 @@ class RefactoredBatchProcessor:
     def process_urls(self, urls: List[Dict[str, str]], resume: bool = False) -> ProcessingResult:
         """Process URLs using selected strategy"""
         # Set up progress tracker in components before strategy execution
+        owned_tracker = None
         if len(urls) > 0 and 'progress_tracker' not in self.context.components:
             factory = get_component_factory()
             config = ComponentConfiguration(output_dir=self.output_dir)
@@ -225,9 +226,18 @@ class RefactoredBatchProcessor:
             self.processing_context.components['progress_tracker'] = progress_tracker
             # Update backward compatibility reference
             self.progress_tracker = progress_tracker
+            owned_tracker = progress_tracker
         
         # Use strategy to process URLs
-        return self.strategy.process_urls(urls, resume)
+        try:
+            return self.strategy.process_urls(urls, resume)
+        finally:
+            # Write any batched progress and stop the tracker's writer thread
+            if owned_tracker is not None:
+                owned_tracker.close()
+                for components in (self.context.components, self.processing_context.components):
+                    if components.get('progress_tracker') is owned_tracker:
+                        del components['progress_tracker']
     
     def get_strategy_info(self) -> Dict[str, Any]:
         """Get information about current processing strategy"""
@@ -76,6 +76,9 @@ class RobustCheckpointManager:
         self.backup_file = f"{self.checkpoint_file}.backup"
         self.temp_file = f"{self.checkpoint_file}.tmp"
         self._lock = threading.Lock()
+        # Set when load_checkpoint served data from the backup; the next
+        # successful save_checkpoint rewrites the main file and clears it
+        self._needs_main_heal = False
         
         # Ensure directory exists using shared utility
         AtomicFileOperations.ensure_directory(self.checkpoint_file)
@@ -97,10 +100,16 @@ class RobustCheckpointManager:
             # Validate schema before saving
             self._validate_checkpoint_format(data)
             
-            # Use shared atomic backup and write operation
-            return AtomicFileOperations.atomic_backup_and_write(
-                self.checkpoint_file, data, backup_enabled=True, lock=self._lock
+            # Use shared atomic backup and write operation. While the main file
+            # still holds corrupt data, keep the known-good backup untouched.
+            saved = AtomicFileOperations.atomic_backup_and_write(
+                self.checkpoint_file, data,
+                backup_enabled=not self._needs_main_heal, lock=self._lock
             )
+            if saved:
+                # Main checkpoint is valid again after any backup recovery
+                self._needs_main_heal = False
+            return saved
             
         except CheckpointFormatError:
             # Re-raise format errors for caller to handle
@@ -168,9 +177,6 @@ class RobustCheckpointManager:
         Returns:
             dict: Recovered checkpoint data, or None if recovery failed
         """
-        if not os.path.exists(self.backup_file):
-            return None
-        
         try:
             with open(self.backup_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
@@ -178,9 +184,9 @@ class RobustCheckpointManager:
             # Validate backup data
             self._validate_checkpoint_format(data)
             
-            # Recovery successful - restore main checkpoint from backup
-            with open(self.checkpoint_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Recovery successful - serve backup directly and let the next
+            # save_checkpoint heal the main file instead of rewriting it here
+            self._needs_main_heal = True
             
             return data
             
@@ -191,7 +197,6 @@ class RobustCheckpointManager:
     def _cleanup_temp_file(self):
         """Clean up temporary file if it exists"""
         try:
-            if os.path.exists(self.temp_file):
-                os.remove(self.temp_file)
-        except:
+            os.remove(self.temp_file)
+        except (FileNotFoundError, OSError):
             pass
\ No newline at end of file
@@ -7,7 +7,13 @@ Refactored for clean separation of concerns and maintainability
 import os
 import json
 import time
-from typing import Dict, List, Optional
+import asyncio
+import hashlib
+import random
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 # Optional imports for graceful fallback in testing environments
 try:
@@ -25,8 +31,34 @@ except ImportError:
     # This allows testing of non-API functionality
     openai = None
 
-from core.content_extractor import extract_title_and_content, is_url
-from core.validators import clean_slug, validate_slug
+try:
+    import httpx
+except ImportError:
+    # Installed with openai; without it AsyncOpenAI keeps its default pool
+    httpx = None
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+try:
+    import aiohttp
+except ImportError:
+    # Optional transport for high-concurrency batch runs (use_aiohttp_transport)
+    aiohttp = None
+
+try:
+    import diskcache
+except ImportError:
+    # SlugCache falls back to one JSON file per entry
+    diskcache = None
+
+from core.content_extractor import (
+    extract_title_and_content, is_url, parse_title_and_content, REQUEST_HEADERS
+)
+from core.validators import check_slug, clean_slug, validate_slug
 from core.exceptions import (
     ErrorHandler, ConfigurationError, APIError, ContentError, 
     JSONFormatError, SlugValidationError
@@ -34,6 +66,213 @@ from core.exceptions import (
 from config.settings import SlugGeneratorConfig
 
 
+# Static request fragments shared by every OpenAI call
+_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are an SEO expert specializing in creating URL-friendly blog post slugs for cross-border e-commerce content."
+}
+_JSON_RESPONSE_FORMAT = {"type": "json_object"}  # Force JSON response
+_CHAT_COMPLETIONS_URL = "https://api.openai.com/v1/chat/completions"
+
+# The n parameter quoted in an error message or JSON body ('n', "n", `n`)
+_N_PARAM_RE = re.compile(r"""['"`]n['"`]""")
+
+
+@lru_cache(maxsize=16)
+def _read_prompt_file(path: str) -> str:
+    """Read and cache a prompt template; templates are static for the process lifetime"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read().strip()
+
+
+def _is_rate_limit_error(error: Exception) -> bool:
+    """Detect HTTP 429 responses from the OpenAI client or wrapped messages"""
+    if openai is not None and isinstance(error, openai.RateLimitError):
+        return True
+    message = str(error).lower()
+    return "rate limit" in message or "429" in message
+
+
+def _is_bad_request_error(error: Exception) -> bool:
+    """Detect HTTP 400 responses from the OpenAI client or the aiohttp transport"""
+    if openai is not None and isinstance(error, openai.BadRequestError):
+        return True
+    return str(error).startswith("OpenAI API error 400")
+
+
+def _is_auth_error(error: Exception) -> bool:
+    """Detect HTTP 401/403 responses (invalid key or missing model access)"""
+    if openai is not None and isinstance(error, (openai.AuthenticationError, openai.PermissionDeniedError)):
+        return True
+    return str(error).startswith(("OpenAI API error 401", "OpenAI API error 403"))
+
+
+def _is_n_unsupported_error(error: Exception) -> bool:
+    """
+    Detect a 400 rejecting the n parameter itself.
+    
+    Other 400s (context length, content policy, malformed input) concern
+    one request only and must not turn n off for the whole generator.
+    """
+    if not _is_bad_request_error(error):
+        return False
+    if getattr(error, "param", None) == "n":
+        return True
+    return _N_PARAM_RE.search(str(error)) is not None
+
+
+def _batch_request_index(custom_id: Optional[str]) -> int:
+    """Submission index encoded in a "req-{i}" Batch API custom_id (-1 if absent)"""
+    try:
+        return int(custom_id.rsplit("-", 1)[1])
+    except (AttributeError, IndexError, ValueError):
+        return -1
+
+
+class SlugCache:
+    """
+    Persistent exact-match cache of parsed slug suggestions.
+    
+    Keys are SHA-256 digests of every input that shapes the response (model,
+    prompt version, temperature, count, title and a content hash). Backed by
+    diskcache when installed, otherwise by one JSON file per key.
+    """
+    
+    def __init__(self, directory: str):
+        self.directory = directory
+        if diskcache is not None:
+            self._store = diskcache.Cache(directory)
+        else:
+            self._store = None
+            os.makedirs(directory, exist_ok=True)
+    
+    @staticmethod
+    def make_key(model: str, prompt_version: str, temperature: float,
+                 title: str, content: str, count: int) -> str:
+        """Build the cache key for one generation request"""
+        return hashlib.sha256(json.dumps({
+            "model": model,
+            "prompt_version": prompt_version,
+            "temperature": temperature,
+            "count": count,
+            "title": title,
+            "content_hash": hashlib.sha1((content or "").encode("utf-8")).hexdigest()
+        }, sort_keys=True).encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> Optional[List[Dict]]:
+        """Return cached slug data, or None on a miss"""
+        if self._store is not None:
+            return self._store.get(key)
+        
+        try:
+            with open(os.path.join(self.directory, f"{key}.json"), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+    
+    def set(self, key: str, value: List[Dict]) -> None:
+        """Store slug data under key"""
+        if self._store is not None:
+            self._store.set(key, value)
+            return
+        
+        # Write-then-rename so concurrent readers never see a partial entry
+        path = os.path.join(self.directory, f"{key}.json")
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(value, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+
+
+class RateLimitedDispatcher:
+    """
+    Client-side request/token rate limiter for concurrent OpenAI calls.
+    
+    Follows the OpenAI cookbook api_request_parallel_processor pattern: two
+    capacity buckets (requests and tokens per minute) refill linearly with
+    elapsed time, a request launches only when both can cover it, and an
+    HTTP 429 pauses new launches without cancelling in-flight requests.
+    HTTP 400/401/403 errors are raised at once; other failures are retried
+    after exponential backoff with jitter.
+    """
+    
+    def __init__(self, max_requests_per_minute: float, max_tokens_per_minute: float,
+                 max_attempts: int = 4, rate_limit_pause: float = 15.0,
+                 retry_delay: float = 1.0):
+        self.max_requests_per_minute = max_requests_per_minute
+        self.max_tokens_per_minute = max_tokens_per_minute
+        self.max_attempts = max_attempts
+        self.rate_limit_pause = rate_limit_pause
+        self.retry_delay = retry_delay
+        
+        self.available_request_capacity = max_requests_per_minute
+        self.available_token_capacity = max_tokens_per_minute
+        self._last_update_time = time.monotonic()
+        self._paused_until = 0.0
+    
+    def _refill(self, now: float) -> None:
+        """Replenish both buckets for the time elapsed since the last refill"""
+        elapsed = now - self._last_update_time
+        self.available_request_capacity = min(
+            self.available_request_capacity + elapsed * self.max_requests_per_minute / 60.0,
+            self.max_requests_per_minute
+        )
+        self.available_token_capacity = min(
+            self.available_token_capacity + elapsed * self.max_tokens_per_minute / 60.0,
+            self.max_tokens_per_minute
+        )
+        self._last_update_time = now
+    
+    async def _acquire(self, token_estimate: int) -> None:
+        """Wait until both buckets can cover one request of token_estimate tokens"""
+        # Requests larger than the whole token budget would otherwise wait forever
+        token_estimate = min(token_estimate, self.max_tokens_per_minute)
+        
+        while True:
+            # No await between check and decrement, so this is atomic on the event loop
+            now = time.monotonic()
+            self._refill(now)
+            # Seconds until the pause ends and both buckets have refilled enough
+            wait = max(
+                self._paused_until - now,
+                (1 - self.available_request_capacity) * 60.0 / self.max_requests_per_minute,
+                (token_estimate - self.available_token_capacity) * 60.0 / self.max_tokens_per_minute
+            )
+            if wait <= 0:
+                self.available_request_capacity -= 1
+                self.available_token_capacity -= token_estimate
+                return
+            # Re-checked after waking, since a 429 elsewhere may extend the pause
+            await asyncio.sleep(wait)
+    
+    async def submit(self, request_fn, *args, token_estimate: int = 0):
+        """
+        Run request_fn(*args) once capacity allows, retrying failed attempts.
+        
+        Args:
+            request_fn: Coroutine function performing the API call
+            token_estimate: Prompt + completion tokens charged against the TPM bucket
+        """
+        for attempt in range(self.max_attempts):
+            await self._acquire(token_estimate)
+            try:
+                return await request_fn(*args)
+            except Exception as e:
+                if _is_bad_request_error(e) or _is_auth_error(e):
+                    # Retrying can't fix a rejected request or an invalid key
+                    raise
+                if attempt == self.max_attempts - 1:
+                    raise Exception(f"Failed after {self.max_attempts} attempts: {str(e)}")
+                
+                if _is_rate_limit_error(e):
+                    # The pause holds every launch, including this request's retry
+                    self._paused_until = time.monotonic() + self.rate_limit_pause
+                else:
+                    # 5xx, timeouts and unparseable responses: back off so attempts aren't spent at once
+                    delay = self.retry_delay * (2 ** attempt)
+                    await asyncio.sleep(delay + random.uniform(0, delay / 4))
+
+
 class SlugGenerator:
     """
     AI-powered blog post slug generator using OpenAI.
@@ -42,7 +281,8 @@ class SlugGenerator:
     
     def __init__(self, api_key: Optional[str] = None, config: SlugGeneratorConfig = None, 
                  max_retries: int = None, retry_delay: float = None, prompt_version: str = None,
-                 enable_validation: bool = True, dev_mode: bool = False):
+                 enable_validation: bool = True, dev_mode: bool = False,
+                 use_aiohttp_transport: bool = False):
         """
         Initialize the SlugGenerator with centralized configuration.
         
@@ -54,6 +294,8 @@ class SlugGenerator:
             prompt_version: Prompt version to use (e.g., 'v7', 'current', 'v8')
             enable_validation: Enable pre-flight validation (default: True)
             dev_mode: Enable development mode with enhanced error reporting (default: False)
+            use_aiohttp_transport: POST async requests directly via aiohttp instead of
+                the AsyncOpenAI client, which throttles above ~100 concurrent requests
         """
         # Store prompt version and development mode for use throughout the class
         self.prompt_version = prompt_version
@@ -87,11 +329,56 @@ class SlugGenerator:
         # Initialize OpenAI client with graceful fallback
         if openai is not None:
             self.client = openai.OpenAI(api_key=self.api_key)
+            self.async_client = openai.AsyncOpenAI(
+                api_key=self.api_key, http_client=self._build_async_http_client()
+            )
         else:
             self.client = None
+            self.async_client = None
             if dev_mode:
                 print("⚠️  OpenAI package not available - API functionality disabled")
         
+        # Event loop the async transports are bound to (set on first async use)
+        self._async_loop = None
+        
+        # Direct aiohttp transport for async requests; session is created lazily
+        # inside the running event loop on first use
+        if use_aiohttp_transport and aiohttp is None:
+            raise ConfigurationError(
+                "aiohttp package is required for use_aiohttp_transport",
+                version=prompt_version,
+                config_issue="missing_dependency"
+            )
+        self.use_aiohttp_transport = use_aiohttp_transport
+        self._http_session = None
+        
+        # Exact-match response cache; only deterministic (temperature 0) output is reused
+        if self.config.CACHE_ENABLED and self.config.TEMPERATURE == 0:
+            self.cache = SlugCache(self.config.CACHE_DIR)
+        else:
+            self.cache = None
+        
+        # Base prompt + BLOG POST INFORMATION block as a str.format template,
+        # built on first use by _create_slug_prompt
+        self._prompt_template = None
+        
+        # Cleared if the endpoint rejects n>1; later calls then ask for a slug list
+        self._supports_n = True
+        
+        # URLs skipped by the last generate_slugs_via_batch call, with reasons
+        self.batch_extraction_errors: Dict[str, str] = {}
+        # URL of each custom_id in submitted Batch API jobs by batch id, until collected
+        self._pending_batches: Dict[str, Dict[str, str]] = {}
+        
+        # Shared RPM/TPM budget for all async requests made by this generator
+        self.dispatcher = RateLimitedDispatcher(
+            max_requests_per_minute=self.config.MAX_REQUESTS_PER_MINUTE,
+            max_tokens_per_minute=self.config.MAX_TOKENS_PER_MINUTE,
+            max_attempts=self.config.MAX_RETRIES + 1,
+            rate_limit_pause=self.config.RATE_LIMIT_PAUSE_SECONDS,
+            retry_delay=self.config.RETRY_BASE_DELAY
+        )
+        
         # Backward compatibility properties
         self.max_retries = self.config.MAX_RETRIES
         self.retry_delay = self.config.RETRY_BASE_DELAY
@@ -325,22 +612,8 @@ class SlugGenerator:
             # Generate slug using OpenAI with retry logic
             slug_data = self._generate_with_openai_retry(title, content, count)
             
-            # Validate and clean suggestions
-            cleaned_suggestions = []
-            for slug_info in slug_data:
-                cleaned = clean_slug(slug_info['slug'])
-                if cleaned and self.is_valid_slug(cleaned):
-                    cleaned_suggestions.append(cleaned)
-            
-            if not cleaned_suggestions:
-                raise Exception("No valid slugs generated")
-            
-            result = {
-                'primary': cleaned_suggestions[0],
-                'alternatives': cleaned_suggestions[1:] if len(cleaned_suggestions) > 1 else [],
-                'url': url,
-                'title': title
-            }
+            result = self._build_slug_result(slug_data, title)
+            result['url'] = url
             
             return result
             
@@ -350,14 +623,270 @@ class SlugGenerator:
             else:
                 raise Exception(f"Error generating slug for URL {url}: {str(e)}")
     
+    async def agenerate_slug(self, url: str, count: int = 1) -> Dict:
+        """
+        Async counterpart of generate_slug using the AsyncOpenAI client.
+        
+        HTML fetching and parsing run in a worker thread so they don't
+        block the event loop.
+        """
+        if not is_url(url):
+            raise ValueError(f"Invalid URL format: {url}")
+        
+        try:
+            title, content = await self._extract_async(url)
+            return await self._agenerate_from_content(url, title, content, count)
+            
+        except Exception as e:
+            raise Exception(f"Error generating slug for URL {url}: {str(e)}")
+    
+    async def _agenerate_from_content(self, url: str, title: str, content: str, count: int) -> Dict:
+        """LLM stage of agenerate_slug for an already-extracted page"""
+        slug_data = await self._agenerate_with_openai_retry(title, content, count)
+        
+        result = self._build_slug_result(slug_data, title)
+        result['url'] = url
+        
+        return result
+    
+    async def _extract_async(self, url: str, session=None) -> Tuple[str, str]:
+        """
+        Fetch a page through a shared aiohttp session and parse it in a
+        worker thread. Without a session, or if the async fetch fails, the
+        blocking extractor (with its plain-text fallback) runs in a thread.
+        """
+        if session is not None:
+            try:
+                async with session.get(url, headers=REQUEST_HEADERS) as resp:
+                    resp.raise_for_status()
+                    if 'text/html' in resp.headers.get('content-type', '').lower():
+                        html = await resp.read()
+                        return await asyncio.to_thread(parse_title_and_content, html)
+            except Exception:
+                pass
+        
+        return await asyncio.to_thread(extract_title_and_content, url)
+    
+    async def generate_slugs_batch(self, urls: List[str], count: int = 1,
+                                   max_concurrency: int = None) -> List[Dict]:
+        """
+        Generate slugs for many URLs concurrently.
+        
+        Pages are fetched through one shared aiohttp session (when aiohttp is
+        installed) so HTML fetching overlaps with the LLM stage. Both stages
+        are bounded by max_concurrency, and a fetched page keeps its fetch
+        slot until it enters the LLM stage, so at most twice max_concurrency
+        pages are held at once. Each page is reduced to its title and content
+        as soon as it is fetched.
+        
+        Args:
+            urls: Blog post URLs to process
+            count: Number of slug suggestions per URL
+            max_concurrency: Maximum in-flight requests (default: config.MAX_CONCURRENCY)
+            
+        Returns:
+            List of results in input order. Failed URLs yield
+            {'url': url, 'error': message} instead of raising.
+        """
+        limit = max_concurrency or self.config.MAX_CONCURRENCY
+        fetch_semaphore = asyncio.Semaphore(limit)
+        semaphore = asyncio.Semaphore(limit)
+        session = None
+        if aiohttp is not None:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=limit),
+                timeout=aiohttp.ClientTimeout(total=40, connect=10)
+            )
+        
+        async def _one(url: str) -> Dict:
+            if not is_url(url):
+                return {'url': url, 'error': f"Invalid URL format: {url}"}
+            try:
+                async with fetch_semaphore:
+                    title, content = await self._extract_async(url, session)
+                    # Hand over to the LLM stage before freeing the fetch slot
+                    await semaphore.acquire()
+                try:
+                    return await self._agenerate_from_content(url, title, content, count)
+                finally:
+                    semaphore.release()
+            except Exception as e:
+                return {'url': url, 'error': f"Error generating slug for URL {url}: {str(e)}"}
+        
+        try:
+            return await asyncio.gather(*[_one(url) for url in urls])
+        finally:
+            if session is not None:
+                await session.close()
+    
+    def generate_slugs_via_batch(self, urls: List[str], count: int = 1) -> str:
+        """
+        Submit slug generation for many URLs as one OpenAI Batch API job.
+        
+        Batch jobs complete within 24h at half the price of synchronous calls
+        and use a separate rate-limit pool, which suits archive-scale runs.
+        URLs whose content cannot be extracted are skipped and recorded in
+        self.batch_extraction_errors. URL i gets custom_id "req-{i}", so
+        duplicate URLs stay separate requests.
+        
+        Args:
+            urls: Blog post URLs to process
+            count: Number of slug suggestions per URL
+            
+        Returns:
+            Batch ID to pass to collect_batch()
+        """
+        for url in urls:
+            if not is_url(url):
+                raise ValueError(f"Invalid URL format: {url}")
+        
+        def _extract(url: str):
+            try:
+                return extract_title_and_content(url), None
+            except Exception as e:
+                return None, str(e)
+        
+        # Overlap the HTML fetches; they are network-bound
+        with ThreadPoolExecutor(max_workers=self.config.MAX_CONCURRENCY) as executor:
+            extracted = list(executor.map(_extract, urls))
+        
+        self.batch_extraction_errors = {}
+        lines = []
+        urls_by_id = {}
+        for i, (url, (title_content, error)) in enumerate(zip(urls, extracted)):
+            if error is not None:
+                self.batch_extraction_errors[url] = error
+                continue
+            
+            title, content = title_content
+            analysis_content = content[:self.config.API_CONTENT_LIMIT] if content else ""
+            prompt = self._create_slug_prompt(title, analysis_content, count)
+            custom_id = f"req-{i}"
+            urls_by_id[custom_id] = url
+            lines.append(json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._completion_params(prompt)
+            }, ensure_ascii=False))
+        
+        if not lines:
+            raise Exception("No URLs could be extracted for batch submission")
+        
+        if self.dev_mode and self.batch_extraction_errors:
+            print(f"⚠️  Skipped {len(self.batch_extraction_errors)} URLs with extraction errors")
+        
+        batch_input = self.client.files.create(
+            file=("slug_batch.jsonl", "\n".join(lines).encode('utf-8')),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_input.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        self._pending_batches[batch.id] = urls_by_id
+        return batch.id
+    
+    def collect_batch(self, batch_id: str, count: int = 1, poll_interval: float = None,
+                      urls: Optional[List[str]] = None) -> List[Dict]:
+        """
+        Wait for a Batch API job and turn its output into slug results.
+        
+        Args:
+            batch_id: ID returned by generate_slugs_via_batch()
+            count: Number of slug suggestions requested per URL
+            poll_interval: Seconds between status checks (default: config.BATCH_POLL_INTERVAL)
+            urls: The list passed to generate_slugs_via_batch(), needed only
+                when the batch was submitted by another SlugGenerator
+            
+        Returns:
+            One result per submitted URL, in submission order, with 'primary',
+            'alternatives' and 'url', or {'url': url, 'error': message} for
+            requests that failed
+        """
+        poll_interval = self.config.BATCH_POLL_INTERVAL if poll_interval is None else poll_interval
+        urls_by_id = self._pending_batches.pop(batch_id, None)
+        if urls_by_id is None:
+            urls_by_id = {f"req-{i}": url for i, url in enumerate(urls or [])}
+        
+        while True:
+            batch = self.client.batches.retrieve(batch_id)
+            if batch.status == "completed":
+                break
+            if batch.status in ("failed", "expired", "cancelled"):
+                raise Exception(f"Batch {batch_id} ended with status: {batch.status}")
+            time.sleep(poll_interval)
+        
+        records = []
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            for line in self.client.files.content(file_id).text.splitlines():
+                if line.strip():
+                    records.append(json.loads(line))
+        
+        # Output files are not ordered; restore the order of the submitted URLs
+        records.sort(key=lambda record: _batch_request_index(record.get("custom_id")))
+        return [self._parse_batch_record(record, count, urls_by_id) for record in records]
+    
+    def _parse_batch_record(self, record: Dict, count: int, urls_by_id: Dict[str, str]) -> Dict:
+        """Convert one Batch API output line into a slug result or error entry"""
+        custom_id = record.get("custom_id")
+        url = urls_by_id.get(custom_id, custom_id)
+        try:
+            if record.get("error"):
+                raise Exception(record["error"].get("message", "Batch request failed"))
+            
+            response = record["response"]
+            if response.get("status_code") != 200:
+                raise Exception(f"OpenAI API error {response.get('status_code')}")
+            
+            content = response["body"]["choices"][0]["message"]["content"]
+            result = self._build_slug_result(self._parse_slug_response(content, count))
+            result['url'] = url
+            return result
+            
+        except Exception as e:
+            return {'url': url, 'error': str(e)}
+    
+    def _build_slug_result(self, slug_data: List[Dict], title: str = None) -> Dict:
+        """Clean and validate raw suggestions into the public result shape."""
+        cleaned_suggestions = []
+        for slug_info in slug_data:
+            cleaned = clean_slug(slug_info['slug'])
+            if cleaned and self.is_valid_slug(cleaned):
+                cleaned_suggestions.append(cleaned)
+        
+        if not cleaned_suggestions:
+            raise Exception("No valid slugs generated")
+        
+        result = {
+            'primary': cleaned_suggestions[0],
+            'alternatives': cleaned_suggestions[1:] if len(cleaned_suggestions) > 1 else []
+        }
+        if title is not None:
+            result['title'] = title
+        
+        return result
+    
     def _generate_with_openai_retry(self, title: str, content: str, count: int = 1) -> List[Dict]:
         """
         Use OpenAI to generate intelligent slug suggestions with retry logic.
         Uses manual retry with configuration.
         """
+        cache_key = self._cache_key(title, content, count)
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         for attempt in range(self.config.MAX_RETRIES + 1):
             try:
-                return self._generate_with_openai(title, content, count)
+                slug_data = self._generate_with_openai(title, content, count)
+                if cache_key is not None:
+                    self.cache.set(cache_key, slug_data)
+                return slug_data
             except Exception as e:
                 if attempt == self.config.MAX_RETRIES:
                     raise Exception(f"Failed after {self.config.MAX_RETRIES} retry attempts: {str(e)}")
@@ -373,29 +902,274 @@ class SlugGenerator:
                 time.sleep(delay)
                 continue
     
+    async def _agenerate_with_openai_retry(self, title: str, content: str, count: int = 1) -> List[Dict]:
+        """
+        Async counterpart of _generate_with_openai_retry. Instead of blind
+        backoff, requests go through the rate-limited dispatcher so batch
+        runs stay within the configured RPM/TPM budget.
+        """
+        cache_key = self._cache_key(title, content, count)
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        analysis_content = content[:self.config.API_CONTENT_LIMIT] if content else ""
+        
+        slug_data = None
+        if count > 1 and self._supports_n:
+            prompt = self._create_slug_prompt(title, analysis_content, 1)
+            slug_data = await self.dispatcher.submit(
+                self._arequest_slug_choices, prompt, count,
+                token_estimate=self._token_estimate(prompt)
+            )
+        
+        if slug_data is None or len(slug_data) < count:
+            # No n support, or the choices repeated each other: one list completion fills in
+            prompt = self._create_slug_prompt(title, analysis_content, count)
+            try:
+                extra = await self.dispatcher.submit(
+                    self._arequest_slugs, prompt, count,
+                    token_estimate=self._token_estimate(prompt)
+                )
+            except Exception:
+                if not slug_data:
+                    raise
+                extra = []
+            slug_data = self._top_up_slugs(slug_data, extra, count)
+        
+        if cache_key is not None:
+            self.cache.set(cache_key, slug_data)
+        return slug_data
+    
+    def _token_estimate(self, prompt: str) -> int:
+        """
+        Rough TPM charge for one request: ~4 chars per prompt token plus the
+        completion budget. n single-slug choices together produce about one
+        list completion's output, so the budget is charged once.
+        """
+        return len(prompt) // 4 + self.config.MAX_TOKENS
+    
+    def _cache_key(self, title: str, content: str, count: int) -> Optional[str]:
+        """Cache key for a request, or None when caching is disabled"""
+        if self.cache is None:
+            return None
+        return SlugCache.make_key(
+            self.config.OPENAI_MODEL,
+            self.prompt_version or self.config.DEFAULT_PROMPT_VERSION,
+            self.config.TEMPERATURE, title, content, count
+        )
+    
     def _generate_with_openai(self, title: str, content: str, count: int = 1) -> List[Dict]:
         """
         Use OpenAI to generate intelligent slug suggestions.
+        
+        For count > 1 the server produces count independent completions
+        (n=count) of the single-slug prompt. If those choices leave fewer
+        than count distinct slugs (likely at low temperature), one list
+        completion tops the result up; deployments that reject n get the
+        list completion alone.
         """
         # Prepare content for analysis with configured limits
         analysis_content = content[:self.config.API_CONTENT_LIMIT] if content else ""
         
+        slug_data = None
+        if count > 1 and self._supports_n:
+            prompt = self._create_slug_prompt(title, analysis_content, 1)
+            try:
+                response = self.client.chat.completions.create(**self._completion_params(prompt, n=count))
+                slug_data = self._parse_slug_choices([c.message.content for c in response.choices], count)
+            except Exception as e:
+                if not _is_n_unsupported_error(e):
+                    raise
+                self._supports_n = False
+            if slug_data is not None and len(slug_data) >= count:
+                return slug_data
+        
         # Create prompt for OpenAI
         prompt = self._create_slug_prompt(title, analysis_content, count)
         
-        response = self.client.chat.completions.create(
-            model=self.config.OPENAI_MODEL,
-            messages=[
-                {"role": "system", "content": "You are an SEO expert specializing in creating URL-friendly blog post slugs for cross-border e-commerce content."},
-                {"role": "user", "content": prompt}
-            ],
-            max_tokens=self.config.MAX_TOKENS,
-            temperature=self.config.TEMPERATURE,
-            response_format={"type": "json_object"}  # Force JSON response
+        try:
+            response = self.client.chat.completions.create(**self._completion_params(prompt))
+            extra = self._parse_slug_response(response.choices[0].message.content, count)
+        except Exception:
+            if not slug_data:
+                raise
+            extra = []
+        
+        return self._top_up_slugs(slug_data, extra, count)
+    
+    async def _arequest_slug_choices(self, prompt: str, count: int) -> Optional[List[Dict]]:
+        """
+        Request count choices (n=count) of a single-slug prompt and merge them.
+        
+        Returns None, and stops using n, if the endpoint rejects the parameter.
+        """
+        try:
+            contents = await self._acomplete(prompt, count)
+        except Exception as e:
+            if not _is_n_unsupported_error(e):
+                raise
+            self._supports_n = False
+            return None
+        
+        return self._parse_slug_choices(contents, count)
+    
+    async def _arequest_slugs(self, prompt: str, count: int) -> List[Dict]:
+        """Send a prepared slug list prompt through the configured async transport"""
+        contents = await self._acomplete(prompt)
+        return self._parse_slug_response(contents[0], count)
+    
+    async def _acomplete(self, prompt: str, n: int = 1) -> List[str]:
+        """Return the message content of every choice for one async completion"""
+        payload = self._completion_params(prompt, n=n)
+        self._bind_async_loop()
+        
+        if self.use_aiohttp_transport:
+            return await self._apost_chat_completion(payload)
+        
+        response = await self.async_client.chat.completions.create(**payload)
+        return [choice.message.content for choice in response.choices]
+    
+    async def _apost_chat_completion(self, payload: Dict) -> List[str]:
+        """POST a chat completion directly with aiohttp and return each choice's content"""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=0, limit_per_host=1024),
+                timeout=aiohttp.ClientTimeout(total=120),
+                headers={"Authorization": f"Bearer {self.api_key}"}
+            )
+        
+        async with self._http_session.post(_CHAT_COMPLETIONS_URL, json=payload) as resp:
+            if resp.status >= 400:
+                body = await resp.text()
+                raise Exception(f"OpenAI API error {resp.status}: {body[:200]}")
+            data = await resp.json()
+        
+        return [choice["message"]["content"] for choice in data["choices"]]
+    
+    def _bind_async_loop(self) -> None:
+        """
+        Bind the async transports to the running event loop.
+        
+        Pooled connections belong to the loop that opened them, so when a
+        later asyncio.run() drives this generator the AsyncOpenAI client and
+        aiohttp session are rebuilt instead of reusing connections bound to
+        the previous, closed loop.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is self._async_loop:
+            return
+        
+        if self._async_loop is not None:
+            # The old loop is gone, so its transports can't be closed from here
+            self._http_session = None
+            if openai is not None:
+                self.async_client = openai.AsyncOpenAI(
+                    api_key=self.api_key, http_client=self._build_async_http_client()
+                )
+        self._async_loop = loop
+    
+    def _build_async_http_client(self):
+        """
+        httpx client for AsyncOpenAI sized for batch bursts: a large keep-alive
+        pool (so bursts reuse TLS sessions instead of handshaking) and HTTP/2
+        multiplexing when the h2 package is installed.
+        """
+        if httpx is None:
+            return None
+        
+        return httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=self.config.HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=self.config.HTTP_MAX_KEEPALIVE,
+                keepalive_expiry=self.config.HTTP_KEEPALIVE_EXPIRY
+            ),
+            http2=_HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(60.0, connect=5.0)
         )
+    
+    async def awarm_up(self) -> None:
+        """
+        Open a connection to the API ahead of a burst so the first batch
+        requests skip the TLS handshake. Failures are ignored; the real
+        requests will surface any connectivity problem.
+        """
+        try:
+            self._bind_async_loop()
+            await self.async_client.models.list()
+        except Exception:
+            pass
+    
+    async def aclose(self) -> None:
+        """
+        Release async transport resources (aiohttp session, AsyncOpenAI pool).
+        Must run on the event loop that used them.
+        """
+        self._bind_async_loop()
+        if self._http_session is not None and not self._http_session.closed:
+            await self._http_session.close()
+        self._http_session = None
+        if self.async_client is not None:
+            await self.async_client.close()
+    
+    def _completion_params(self, prompt: str, n: int = 1) -> Dict:
+        """Chat completion request parameters shared by every transport"""
+        params = {
+            "model": self.config.OPENAI_MODEL,
+            "messages": [_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
+            "max_tokens": self.config.MAX_TOKENS,
+            "temperature": self.config.TEMPERATURE,
+            "response_format": _JSON_RESPONSE_FORMAT
+        }
+        if n > 1:
+            params["n"] = n
+        return params
+    
+    def _parse_slug_choices(self, contents: List[str], count: int) -> List[Dict]:
+        """
+        Merge suggestions from several completions (n > 1) into one ranked list.
+        
+        Slugs are interleaved by rank (every choice's best slug, then every
+        second-best, ...) with duplicates dropped, so when choices repeat the
+        same top slug the list is filled up to count from lower ranks. Choices that fail to parse
+        are ignored unless every choice fails.
+        """
+        per_choice = []
+        first_error = None
+        for content in contents:
+            try:
+                per_choice.append(self._parse_slug_response(content, count))
+            except Exception as e:
+                first_error = first_error or e
+        
+        if not per_choice:
+            raise first_error or Exception("No slugs in response")
+        
+        merged = []
+        seen = set()
+        for rank in range(max(len(slugs) for slugs in per_choice)):
+            for slugs in per_choice:
+                if rank < len(slugs) and slugs[rank].get('slug') not in seen:
+                    seen.add(slugs[rank].get('slug'))
+                    merged.append(slugs[rank])
         
-        # Parse JSON response
-        response_text = response.choices[0].message.content.strip()
+        return merged[:count]
+    
+    @staticmethod
+    def _top_up_slugs(slug_data: Optional[List[Dict]], extra: List[Dict], count: int) -> List[Dict]:
+        """slug_data followed by the slugs from extra it doesn't already hold, up to count"""
+        if not slug_data:
+            return extra[:count]
+        
+        seen = {slug_info.get('slug') for slug_info in slug_data}
+        return (slug_data + [slug_info for slug_info in extra if slug_info.get('slug') not in seen])[:count]
+    
+    def _parse_slug_response(self, response_text: str, count: int) -> List[Dict]:
+        """
+        Parse a JSON-mode completion into slug suggestions filtered by confidence.
+        """
+        response_text = response_text.strip()
         
         try:
             slug_data = json.loads(response_text)
@@ -439,8 +1213,7 @@ class SlugGenerator:
         prompt_path = self.config.get_prompt_path(version)
         
         try:
-            with open(prompt_path, 'r', encoding='utf-8') as f:
-                return f.read().strip()
+            return _read_prompt_file(prompt_path)
         except FileNotFoundError:
             raise FileNotFoundError(f"Prompt file not found: {prompt_path}")
     
@@ -448,22 +1221,26 @@ class SlugGenerator:
         """
         Create a well-structured prompt for OpenAI slug generation using external template.
         """
-        # Load base prompt template with version support
-        base_prompt = self._load_prompt(self.prompt_version)
+        # Load base prompt once per instance and escape its literal braces
+        # (JSON examples) so only the per-post fields are substituted
+        if self._prompt_template is None:
+            base_prompt = self._load_prompt(self.prompt_version)
+            self._prompt_template = (
+                base_prompt.replace("{", "{{").replace("}", "}}")
+                + "\n\nBLOG POST INFORMATION:\nTitle: {title}\nContent: {content}\n\n"
+                "Generate {count} different slug options with confidence scores and reasoning."
+            )
         
-        # Prepare content with configured preview limit
-        content_preview = content[:self.config.PROMPT_PREVIEW_LIMIT] if content else ""
+        # Prepare content with configured preview limit (skip the copy when it already fits)
+        limit = self.config.PROMPT_PREVIEW_LIMIT
+        if not content:
+            content_preview = ""
+        elif len(content) <= limit:
+            content_preview = content
+        else:
+            content_preview = content[:limit]
         
-        # Build the complete prompt
-        prompt = f"""{base_prompt}
-
-BLOG POST INFORMATION:
-Title: {title}
-Content: {content_preview}
-
-Generate {count} different slug options with confidence scores and reasoning.
-"""
-        return prompt.strip()
+        return self._prompt_template.format(title=title, content=content_preview, count=count)
     
     def generate_slug_from_content(self, title: str, content: str, count: int = 1) -> Dict:
         """
@@ -473,23 +1250,7 @@ Generate {count} different slug options with confidence scores and reasoning.
             # Generate slug using OpenAI with retry logic
             slug_data = self._generate_with_openai_retry(title, content, count)
             
-            # Validate and clean suggestions
-            cleaned_suggestions = []
-            for slug_info in slug_data:
-                cleaned = clean_slug(slug_info['slug'])
-                if cleaned and self.is_valid_slug(cleaned):
-                    cleaned_suggestions.append(cleaned)
-            
-            if not cleaned_suggestions:
-                raise Exception("No valid slugs generated")
-            
-            result = {
-                'primary': cleaned_suggestions[0],
-                'alternatives': cleaned_suggestions[1:] if len(cleaned_suggestions) > 1 else [],
-                'title': title
-            }
-            
-            return result
+            return self._build_slug_result(slug_data, title)
             
         except Exception as e:
             if "No valid slugs" in str(e):
@@ -501,8 +1262,7 @@ Generate {count} different slug options with confidence scores and reasoning.
         """
         Check if a slug meets validation criteria using the generator's configuration.
         """
-        validation = validate_slug(slug, self.config)
-        return validation['is_valid']
+        return check_slug(slug, self.config).is_valid
     
     def get_slug_validation(self, slug: str) -> Dict:
         """
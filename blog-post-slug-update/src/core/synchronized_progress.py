@@ -6,10 +6,19 @@ Refactored to use shared file operation utilities.
 """
 
 import json
+import mmap
 import os
+import queue
+import struct
 import time
 import threading
-from typing import Dict, Any
+from typing import Dict, Any, Optional, TypedDict
+
+try:
+    import orjson
+except ImportError:
+    # Stdlib fallback; orjson only speeds up the progress-file codec
+    orjson = None
 
 # Handle both relative and absolute imports for test compatibility
 try:
@@ -28,6 +37,66 @@ except ImportError:
     AtomicFileOperations = file_ops_module.AtomicFileOperations
 
 
+class ProgressFile(TypedDict):
+    """Schema of live_progress.json (and of read_live_slot results)"""
+    processed: int
+    failed: int
+    current_index: int
+    percent: float
+    timestamp: float
+
+
+# Counters restored from a progress file on recovery
+_RECOVERED_FIELDS = ('processed', 'failed', 'current_index')
+
+# Fixed-layout live slot shared with monitors:
+# processed, failed, current_index, percent, timestamp
+_SLOT = struct.Struct("<qqqdd")
+_SLOT_SUFFIX = '.mm'
+
+
+def read_live_slot(live_progress_file: str) -> Optional[ProgressFile]:
+    """
+    Read the memory-mapped progress slot written alongside live_progress.json.
+    
+    The slot is updated on every update_progress call, so it is never behind
+    the JSON file even when file writes are batched.
+    
+    Returns:
+        dict: Progress snapshot, or None if no slot exists
+    """
+    try:
+        with open(live_progress_file + _SLOT_SUFFIX, 'rb') as f:
+            raw = f.read(_SLOT.size)
+    except OSError:
+        return None
+    if len(raw) < _SLOT.size:
+        return None
+    
+    processed, failed, current_index, percent, timestamp = _SLOT.unpack(raw)
+    return {
+        'processed': processed,
+        'failed': failed,
+        'current_index': current_index,
+        'percent': percent,
+        'timestamp': timestamp
+    }
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Encode progress data to JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+
+def _loads(raw: bytes) -> Any:
+    """Decode JSON bytes from a progress file"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 class ProgressSyncError(BaseTimestampedException):
     """Custom exception for progress synchronization errors"""
     
@@ -46,22 +115,38 @@ class SynchronizedProgressTracker:
     processing succeeds.
     """
     
-    def __init__(self, total_count: int, output_dir: str):
+    def __init__(self, total_count: int, output_dir: str,
+                 persist_every_n: int = 1, persist_interval_s: float = 1.0):
         """
         Initialize synchronized progress tracker.
         
         Args:
             total_count: Total number of items to process
             output_dir: Directory for progress files
+            persist_every_n: Write the progress file every N updates (1 = every update)
+            persist_interval_s: With persist_every_n > 1, maximum seconds the file
+                may lag behind memory
+        
+        With persist_every_n > 1 all file writes move to a single background
+        writer thread fed through a one-slot queue, so bursts of updates
+        collapse into one write of the latest snapshot.
         """
         self.total_count = total_count
         self.output_dir = output_dir
+        self.persist_every_n = max(1, persist_every_n)
+        self.persist_interval_s = persist_interval_s
         self._memory_state = {
             'processed': 0,
             'failed': 0,
             'current_index': 0
         }
         self._lock = threading.Lock()
+        # Serializes file writers only; counter updates never wait on disk I/O
+        self._io_lock = threading.Lock()
+        self._snapshot_seq = 0
+        self._written_seq = 0
+        self._dirty = False
+        self._last_persist = time.monotonic()
         
         # Initialize live progress file immediately
         self.live_progress_file = os.path.join(output_dir, 'live_progress.json')
@@ -71,18 +156,34 @@ class SynchronizedProgressTracker:
         
         # Try to recover from existing file first, then persist if no recovery
         if not self._try_auto_recovery():
-            self._persist_to_file()
+            self._persist_to_file(*self._take_snapshot())
+        
+        self._mm = None
+        self._open_live_slot()
+        
+        # Throttled trackers hand snapshots to one writer thread; the queue only
+        # ever holds the latest snapshot (None is the shutdown sentinel)
+        self._snapshot_q = queue.Queue(maxsize=1)
+        self._writer_thread = None
+        if self.persist_every_n > 1:
+            self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+            self._writer_thread.start()
     
     def update_progress(self, success: bool, current_index: int) -> Dict[str, Any]:
         """
-        Update progress with immediate file persistence.
+        Update progress and persist it to file.
+        
+        The file is written on every update unless the tracker was created
+        with persist_every_n > 1, in which case writes are batched and the
+        final item is always flushed.
         
         Args:
             success: Whether the current operation succeeded
             current_index: Current processing index
             
         Returns:
-            dict: Current progress state
+            dict: Current processed/failed/current_index counters. Use the
+            percent property (or the progress file) for the completion percentage.
         """
         with self._lock:
             # Update memory state
@@ -91,40 +192,155 @@ class SynchronizedProgressTracker:
                 self._memory_state['failed'] += 1
             self._memory_state['current_index'] = current_index
             
-            # CRITICAL: Immediately persist to file for monitor threads
-            self._persist_to_file()
+            # The mmap slot is always current; the JSON file may be batched
+            self._write_live_slot()
+            
+            # CRITICAL: Persist to file for monitor threads (batched when throttled).
+            # Only the snapshot is taken under the lock; the write happens after.
+            self._dirty = True
+            processed = self._memory_state['processed']
+            snapshot = None
+            if (processed % self.persist_every_n == 0
+                    or processed == self.total_count
+                    or time.monotonic() - self._last_persist > self.persist_interval_s):
+                snapshot = self._take_snapshot()
+                if self._writer_thread is not None:
+                    # Offered under the lock so the queue always holds the newest snapshot
+                    self._offer_snapshot(snapshot)
+                    snapshot = None
             
-            # Return copy of current state with computed fields
-            percent = (self._memory_state['processed'] / self.total_count * 100) if self.total_count > 0 else 0
             result = self._memory_state.copy()
-            result['percent'] = percent
-            return result
+        
+        if snapshot is not None:
+            self._persist_to_file(*snapshot)
+        return result
+    
+    @property
+    def percent(self) -> float:
+        """Completion percentage, computed on demand"""
+        return (self._memory_state['processed'] / self.total_count * 100) if self.total_count > 0 else 0
     
-    def _persist_to_file(self):
+    def _take_snapshot(self):
         """
-        Write current state to file for monitor threads.
+        Copy the current state for persistence (caller holds the lock).
+        
+        Returns:
+            tuple: (sequence number, progress data)
+        """
+        percent = (self._memory_state['processed'] / self.total_count * 100) if self.total_count > 0 else 0
+        
+        self._snapshot_seq += 1
+        self._dirty = False
+        self._last_persist = time.monotonic()
+        return self._snapshot_seq, {
+            **self._memory_state,
+            'percent': percent,
+            'timestamp': time.time()
+        }
+    
+    def _persist_to_file(self, seq: int, progress_data: Dict[str, Any]):
+        """
+        Write a progress snapshot to file for monitor threads.
         This is critical for preventing progress tracking desynchronization.
+        
+        Args:
+            seq: Snapshot sequence number; older snapshots than the last one
+                written are dropped so concurrent writers never regress the file
+            progress_data: Snapshot from _take_snapshot
         """
         try:
-            # Calculate additional fields for monitoring
-            percent = (self._memory_state['processed'] / self.total_count * 100) if self.total_count > 0 else 0
-            
-            progress_data = {
-                **self._memory_state,
-                'percent': percent,
-                'timestamp': time.time()
-            }
-            
-            # Use shared atomic write operation (don't pass lock as we're already in lock context)
-            AtomicFileOperations.atomic_write_json(
-                self.live_progress_file, progress_data, lock=None
-            )
+            with self._io_lock:
+                if seq <= self._written_seq:
+                    return
+                
+                # Temp file + rename keeps readers from seeing a partial write. No
+                # fsync: this is a live monitor snapshot, not a durability checkpoint
+                temp_path = f"{self.live_progress_file}.tmp"
+                with open(temp_path, 'wb') as f:
+                    f.write(_dumps(progress_data))
+                os.replace(temp_path, self.live_progress_file)
+                self._written_seq = seq
             
         except Exception as e:
             # Progress sync error - could raise ProgressSyncError for serious failures
             # For minimal implementation, we'll just continue (graceful degradation)
             pass
     
+    def _open_live_slot(self):
+        """Map the fixed-size live slot file; monitors fall back to JSON if this fails"""
+        try:
+            fd = os.open(self.live_progress_file + _SLOT_SUFFIX, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                os.ftruncate(fd, _SLOT.size)
+                self._mm = mmap.mmap(fd, _SLOT.size)
+            finally:
+                os.close(fd)
+        except (OSError, ValueError):
+            self._mm = None
+            return
+        
+        self._write_live_slot()
+    
+    def _write_live_slot(self):
+        """Pack the current state into the mapped slot (caller holds the lock)"""
+        if self._mm is None:
+            return
+        
+        state = self._memory_state
+        percent = (state['processed'] / self.total_count * 100) if self.total_count > 0 else 0
+        _SLOT.pack_into(self._mm, 0, state['processed'], state['failed'],
+                        state['current_index'], percent, time.time())
+    
+    def flush(self):
+        """Persist any updates not yet written to the progress file"""
+        with self._lock:
+            if not self._dirty:
+                return
+            snapshot = self._take_snapshot()
+        self._persist_to_file(*snapshot)
+    
+    def close(self):
+        """Stop the writer thread and write the final state"""
+        if self._writer_thread is not None:
+            with self._lock:
+                self._offer_snapshot(None)
+            self._writer_thread.join()
+            self._writer_thread = None
+        
+        # A snapshot replaced by the shutdown sentinel is rewritten here
+        with self._lock:
+            snapshot = None
+            if self._dirty or self._written_seq < self._snapshot_seq:
+                snapshot = self._take_snapshot()
+        if snapshot is not None:
+            self._persist_to_file(*snapshot)
+        
+        with self._lock:
+            if self._mm is not None:
+                self._mm.close()
+                self._mm = None
+    
+    def _offer_snapshot(self, snapshot):
+        """Replace any queued snapshot with this one (caller holds the lock)"""
+        try:
+            self._snapshot_q.get_nowait()
+        except queue.Empty:
+            pass
+        self._snapshot_q.put_nowait(snapshot)
+    
+    def _writer_loop(self):
+        """Single consumer writing queued snapshots; flushes stragglers every persist_interval_s"""
+        while True:
+            try:
+                snapshot = self._snapshot_q.get(timeout=self.persist_interval_s)
+            except queue.Empty:
+                self.flush()
+                continue
+            
+            if snapshot is None:
+                return
+            self._persist_to_file(*snapshot)
+    
     def recover_from_file(self) -> Dict[str, Any]:
         """
         Recover progress state from file (for restart scenarios).
@@ -132,20 +348,12 @@ class SynchronizedProgressTracker:
         Returns:
             dict: Recovered progress state, or current state if recovery fails
         """
-        # Use shared safe read operation
-        file_data = AtomicFileOperations.safe_read_json(self.live_progress_file, lock=None)
+        file_data = self._read_progress_file()
         
-        if file_data is not None:
-            with self._lock:
-                # Update memory state from file
-                self._memory_state['processed'] = file_data.get('processed', 0)
-                self._memory_state['failed'] = file_data.get('failed', 0)
-                self._memory_state['current_index'] = file_data.get('current_index', 0)
-                
-                # Return the recovered state
-                return self._memory_state.copy()
-        
-        return self._memory_state.copy()
+        with self._lock:
+            if file_data is not None:
+                self._apply_recovered(file_data)
+            return self._memory_state.copy()
     
     def _try_auto_recovery(self) -> bool:
         """
@@ -154,14 +362,35 @@ class SynchronizedProgressTracker:
         Returns:
             bool: True if recovery succeeded, False if no file or recovery failed
         """
-        # Use shared safe read operation (no lock needed for auto-recovery)
-        file_data = AtomicFileOperations.safe_read_json(self.live_progress_file, lock=None)
+        # No lock needed for auto-recovery
+        file_data = self._read_progress_file()
         
-        if file_data is not None:
-            # Update memory state from file
-            self._memory_state['processed'] = file_data.get('processed', 0)
-            self._memory_state['failed'] = file_data.get('failed', 0)
-            self._memory_state['current_index'] = file_data.get('current_index', 0)
-            return True
+        # A batched JSON file can lag the live slot after a crash; prefer the newer one
+        slot_data = read_live_slot(self.live_progress_file)
+        if slot_data is not None and file_data is not None and slot_data['processed'] > file_data.get('processed', 0):
+            file_data = slot_data
         
-        return False
\ No newline at end of file
+        return file_data is not None and self._apply_recovered(file_data)
+    
+    def _apply_recovered(self, file_data: ProgressFile) -> bool:
+        """
+        Restore counters from a progress snapshot.
+        
+        Returns:
+            bool: False (memory untouched) if the snapshot is missing a counter
+        """
+        try:
+            recovered = {key: file_data[key] for key in _RECOVERED_FIELDS}
+        except KeyError:
+            return False
+        self._memory_state.update(recovered)
+        return True
+    
+    def _read_progress_file(self) -> Optional[ProgressFile]:
+        """Read the progress file, or None if it is missing or unreadable"""
+        try:
+            with open(self.live_progress_file, 'rb') as f:
+                data = _loads(f.read())
+        except (OSError, ValueError):
+            return None
+        return data if isinstance(data, dict) else None
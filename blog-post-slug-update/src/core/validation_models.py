@@ -5,7 +5,8 @@ Extracted from Phase 2 components for consistency and maintainability.
 """
 
 import time
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -18,7 +19,7 @@ class ValidationStatus(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Standardized validation result structure"""
     passed: bool
@@ -60,7 +61,7 @@ class ValidationResult:
         return result
 
 
-@dataclass 
+@dataclass(slots=True, frozen=True)
 class ConfigurationSpec:
     """Configuration specification for version-aware settings"""
     version: str
@@ -69,40 +70,44 @@ class ConfigurationSpec:
     description: str = ""
     
     @classmethod
-    def get_specifications(cls) -> Dict[str, 'ConfigurationSpec']:
-        """Get all configuration specifications"""
-        return {
-            'v6': cls(
-                version='v6',
-                max_slug_words=6,
-                max_slug_chars=60,
-                description="Standard constraints for V6 Cultural Enhanced"
-            ),
-            'v8': cls(
-                version='v8', 
-                max_slug_words=8,
-                max_slug_chars=70,
-                description="Enhanced constraints for V8 breakthrough (multi-brand)"
-            ),
-            'v10': cls(
-                version='v10',
-                max_slug_words=10, 
-                max_slug_chars=90,
-                description="Competitive constraints for V10 production deployment"
-            )
-        }
+    def get_specifications(cls) -> Mapping[str, 'ConfigurationSpec']:
+        """Get all configuration specifications (shared, read-only)"""
+        return _SPECIFICATIONS
     
     @classmethod
     def for_version(cls, version: str) -> 'ConfigurationSpec':
         """Get configuration specification for version"""
-        specs = cls.get_specifications()
-        if version not in specs:
-            available = ', '.join(specs.keys())
-            raise ValueError(f"Invalid version '{version}'. Available: {available}")
-        return specs[version]
+        try:
+            return _SPECIFICATIONS[version]
+        except KeyError:
+            available = ', '.join(_SPECIFICATIONS.keys())
+            raise ValueError(f"Invalid version '{version}'. Available: {available}") from None
+
 
+# Specifications are constant, so they are built once at import time
+_SPECIFICATIONS: Mapping[str, ConfigurationSpec] = MappingProxyType({
+    'v6': ConfigurationSpec(
+        version='v6',
+        max_slug_words=6,
+        max_slug_chars=60,
+        description="Standard constraints for V6 Cultural Enhanced"
+    ),
+    'v8': ConfigurationSpec(
+        version='v8', 
+        max_slug_words=8,
+        max_slug_chars=70,
+        description="Enhanced constraints for V8 breakthrough (multi-brand)"
+    ),
+    'v10': ConfigurationSpec(
+        version='v10',
+        max_slug_words=10, 
+        max_slug_chars=90,
+        description="Competitive constraints for V10 production deployment"
+    )
+})
 
-@dataclass
+
+@dataclass(slots=True)
 class ValidationSuite:
     """Collection of validation results with aggregation"""
     name: str
@@ -135,14 +140,26 @@ class ValidationSuite:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary format for backward compatibility"""
+        # Single pass over results instead of one per derived property
+        passed_count = 0
+        failed_checks = []
+        results = {}
+        for name, result in self.results.items():
+            if result.passed:
+                passed_count += 1
+            else:
+                failed_checks.append(name)
+            results[name] = result.to_dict()
+        
+        overall_passed = not failed_checks
         return {
-            'overall_passed': self.overall_passed,
-            'recommendation': self.get_recommendation(),
-            'results': {name: result.to_dict() for name, result in self.results.items()},
+            'overall_passed': overall_passed,
+            'recommendation': "PROCEED" if overall_passed else "FIX_ISSUES",
+            'results': results,
             'summary': {
                 'total_checks': len(self.results),
-                'passed': len(self.passed_checks),
-                'failed': len(self.failed_checks),
-                'failed_checks': self.failed_checks
+                'passed': passed_count,
+                'failed': len(failed_checks),
+                'failed_checks': failed_checks
             }
         }
\ No newline at end of file
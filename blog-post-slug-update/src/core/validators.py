@@ -5,7 +5,10 @@ SEO-compliant validation rules for URL slugs
 """
 
 import re
-from typing import Dict
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Final, List, Optional, Tuple
 
 # Handle imports for both direct execution and package import
 try:
@@ -13,26 +16,76 @@ try:
 except ImportError:
     from config.settings import SlugGeneratorConfig
 
+# Fixed failure reasons, interned so callers can compare them by identity
+_R_EMPTY: Final[str] = sys.intern("Slug is empty")
+_R_BAD_CHARS: Final[str] = sys.intern("Contains invalid characters (only lowercase letters, numbers, and hyphens allowed)")
+_R_CONSEC: Final[str] = sys.intern("Contains consecutive hyphens")
+_R_EDGE: Final[str] = sys.intern("Starts or ends with hyphen")
+
+# Templates for reasons that embed a configured bound
+_BOUND_REASONS: Final[Dict[str, str]] = {
+    'too_short': "Too short (less than {} words)",
+    'too_long': "Too long (more than {} words)",
+    'too_many_chars': "Too many characters (over {})",
+    'below_system_min': "Below system minimum ({} words)",
+    'above_system_max': "Exceeds system maximum ({} words)",
+    'above_system_chars': "Exceeds system character limit ({} chars)",
+}
+
+
+@lru_cache(maxsize=32)
+def _bound_reason(kind: str, bound: int) -> str:
+    """Format a bound-dependent reason once per (kind, bound) pair"""
+    return _BOUND_REASONS[kind].format(bound)
+
+
+# Inputs longer than this multiple of the character limit are rejected on
+# length alone, without scanning them for words or format problems
+_SCAN_LIMIT_FACTOR: Final[int] = 4
+
+# Shared default for validate_slug calls without an explicit config
+_DEFAULT_CONFIG: Final[SlugGeneratorConfig] = SlugGeneratorConfig()
+
+# Precompiled patterns for the hot validation path
+_NON_ALNUM: Final[re.Pattern] = re.compile(r'[^a-z0-9]+')
+# Well-formed slug: allowed characters only, no leading/trailing/consecutive hyphens
+_SLUG_SHAPE: Final[re.Pattern] = re.compile(r'^[a-z0-9]+(?:-[a-z0-9]+)*\Z')
+
+# Translation table deleting every allowed slug character; anything left over is invalid
+_DELETE_ALLOWED: Final[Dict[int, Any]] = str.maketrans('', '', 'abcdefghijklmnopqrstuvwxyz0123456789-')
+
+
+# Results are pure functions of their arguments, so repeat inputs are memoized
+_MEMO_SIZE: Final[int] = 4096
+
+# Longer clean_slug inputs are not memoized, so oversized text is neither
+# hashed for a lookup nor kept alive by the cache
+_CLEAN_MEMO_MAX_CHARS: Final[int] = 1024
+
 
 def clean_slug(text: str) -> str:
     """
     Clean and format text into a URL-safe slug.
     - Convert to lowercase
-    - Replace spaces and special characters with hyphens
-    - Remove consecutive hyphens
+    - Replace each run of spaces and special characters with one hyphen
     - Strip leading/trailing hyphens
     """
     if not text:
         return ""
+    if len(text) > _CLEAN_MEMO_MAX_CHARS:
+        return _clean_slug(text)
+    return _clean_slug_memo(text)
+
+
+def _clean_slug(text: str) -> str:
+    """clean_slug for non-empty text"""
     
     # Convert to lowercase and replace spaces with hyphens
     slug = text.lower()
     
-    # Replace any non-alphanumeric characters with hyphens
-    slug = re.sub(r'[^a-z0-9]+', '-', slug)
-    
-    # Remove consecutive hyphens
-    slug = re.sub(r'-+', '-', slug)
+    # Replace each run of non-alphanumeric characters (hyphens included)
+    # with a single hyphen, so no separate consecutive-hyphen pass is needed
+    slug = _NON_ALNUM.sub('-', slug)
     
     # Strip leading and trailing hyphens
     slug = slug.strip('-')
@@ -40,7 +93,43 @@ def clean_slug(text: str) -> str:
     return slug
 
 
-def validate_slug(slug: str, config: SlugGeneratorConfig = None) -> Dict[str, any]:
+_clean_slug_memo = lru_cache(maxsize=_MEMO_SIZE)(_clean_slug)
+
+
+@dataclass(frozen=True, slots=True)
+class SlugValidation:
+    """Immutable result of validating one slug"""
+    is_valid: bool
+    reasons: Tuple[str, ...]
+    word_count: int
+    character_count: int
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dict shape returned by validate_slug"""
+        return {
+            'is_valid': self.is_valid,
+            'reasons': list(self.reasons),
+            'word_count': self.word_count,
+            'character_count': self.character_count
+        }
+
+
+# Reason kinds reported by each validator for (too few words, too many words, too many chars)
+_CONFIG_BOUND_KINDS: Final[Tuple[str, str, str]] = ('too_short', 'too_long', 'too_many_chars')
+_SYSTEM_BOUND_KINDS: Final[Tuple[str, str, str]] = ('below_system_min', 'above_system_max', 'above_system_chars')
+
+
+def check_slug(slug: str, config: Optional[SlugGeneratorConfig] = None) -> SlugValidation:
+    """
+    Validate a slug like validate_slug, returning a SlugValidation instead of a dict.
+    Preferred on hot paths that only need the outcome.
+    """
+    if config is None:
+        config = _DEFAULT_CONFIG
+    return _validate_bounds(slug, config.MIN_WORDS, config.MAX_WORDS, config.MAX_CHARS, _CONFIG_BOUND_KINDS)
+
+
+def validate_slug(slug: str, config: Optional[SlugGeneratorConfig] = None) -> Dict[str, Any]:
     """
     Validate a slug against SEO best practices with configurable constraints.
     Returns validation result with is_valid boolean and reasons.
@@ -49,100 +138,114 @@ def validate_slug(slug: str, config: SlugGeneratorConfig = None) -> Dict[str, an
         slug: The slug to validate
         config: Configuration with constraint settings (uses defaults if None)
     """
-    if config is None:
-        config = SlugGeneratorConfig()
-    result = {
-        'is_valid': True,
-        'reasons': [],
-        'word_count': 0,
-        'character_count': len(slug)
-    }
+    return check_slug(slug, config).to_dict()
+
+
+def validate_slug_system_bounds(slug: str) -> Dict[str, Any]:
+    """
+    Validate a slug against absolute system-wide bounds (1-20 words, 1-300 chars).
+    This is used for pre-validation before any prompt-specific constraints.
+    """
+    return _validate_bounds(
+        slug,
+        SlugGeneratorConfig.SYSTEM_MIN_WORDS,
+        SlugGeneratorConfig.SYSTEM_MAX_WORDS,
+        SlugGeneratorConfig.SYSTEM_MAX_CHARS,
+        _SYSTEM_BOUND_KINDS
+    ).to_dict()
+
+
+def _validate_bounds(
+    slug: str,
+    min_words: int,
+    max_words: int,
+    max_chars: int,
+    kinds: Tuple[str, str, str]
+) -> SlugValidation:
+    """
+    Shared validation for both validators, parameterized by bounds and reason kinds.
+    
+    Inputs far over the character limit fail here on length alone, before
+    they are hashed for the memo, so only bounded-length slugs reach the
+    cached _check_bounds.
+    """
+    character_count = len(slug)
+    if character_count > max_chars * _SCAN_LIMIT_FACTOR:
+        # Hyphens + 1 is one C-level count, without the split or shape regex
+        return SlugValidation(
+            False, (_bound_reason(kinds[2], max_chars),), slug.count('-') + 1, character_count
+        )
+    return _check_bounds(slug, min_words, max_words, max_chars, kinds)
+
+
+@lru_cache(maxsize=_MEMO_SIZE)
+def _check_bounds(
+    slug: str,
+    min_words: int,
+    max_words: int,
+    max_chars: int,
+    kinds: Tuple[str, str, str]
+) -> SlugValidation:
+    """
+    Full validation of a slug within _SCAN_LIMIT_FACTOR times the character limit.
+    Memoized: SlugValidation is immutable, so cached results are safe to share.
+    """
+    character_count = len(slug)
     
     if not slug:
-        result['is_valid'] = False
-        result['reasons'].append("Slug is empty")
-        return result
+        return SlugValidation(False, (_R_EMPTY,), 0, character_count)
     
-    # Count words (split by hyphens)
-    words = [w for w in slug.split('-') if w]
-    result['word_count'] = len(words)
+    word_count, well_formed = _count_words(slug)
+    too_few = word_count < min_words
+    too_many = word_count > max_words
+    too_long = character_count > max_chars
     
-    # Check length constraints using configuration
-    if len(words) < config.MIN_WORDS:
-        result['is_valid'] = False
-        result['reasons'].append(f"Too short (less than {config.MIN_WORDS} words)")
+    # Common case: valid slugs share the empty reasons tuple, no list is built
+    if well_formed and not (too_few or too_many or too_long):
+        return SlugValidation(True, (), word_count, character_count)
     
-    if len(words) > config.MAX_WORDS:
-        result['is_valid'] = False
-        result['reasons'].append(f"Too long (more than {config.MAX_WORDS} words)")
+    reasons = []
     
-    if len(slug) > config.MAX_CHARS:
-        result['is_valid'] = False
-        result['reasons'].append(f"Too many characters (over {config.MAX_CHARS})")
+    # Check length constraints
+    if too_few:
+        reasons.append(_bound_reason(kinds[0], min_words))
     
-    # Check character validity
-    if not re.match(r'^[a-z0-9-]+$', slug):
-        result['is_valid'] = False
-        result['reasons'].append("Contains invalid characters (only lowercase letters, numbers, and hyphens allowed)")
+    if too_many:
+        reasons.append(_bound_reason(kinds[1], max_words))
     
-    # Check for consecutive hyphens
-    if '--' in slug:
-        result['is_valid'] = False
-        result['reasons'].append("Contains consecutive hyphens")
+    if too_long:
+        reasons.append(_bound_reason(kinds[2], max_chars))
     
-    # Check for leading/trailing hyphens
-    if slug.startswith('-') or slug.endswith('-'):
-        result['is_valid'] = False
-        result['reasons'].append("Starts or ends with hyphen")
+    # Basic format validation
+    if not well_formed:
+        _check_format(slug, reasons)
     
-    return result
+    return SlugValidation(not reasons, tuple(reasons), word_count, character_count)
 
 
-def validate_slug_system_bounds(slug: str) -> Dict[str, any]:
+def _count_words(slug: str) -> Tuple[int, bool]:
     """
-    Validate a slug against absolute system-wide bounds (1-20 words, 1-300 chars).
-    This is used for pre-validation before any prompt-specific constraints.
-    """
-    result = {
-        'is_valid': True,
-        'reasons': [],
-        'word_count': 0,
-        'character_count': len(slug)
-    }
-    
-    if not slug:
-        result['is_valid'] = False
-        result['reasons'].append("Slug is empty")
-        return result
-    
-    # Count words (split by hyphens)
-    words = [w for w in slug.split('-') if w]
-    result['word_count'] = len(words)
-    
-    # Check system-wide absolute bounds
-    if len(words) < SlugGeneratorConfig.SYSTEM_MIN_WORDS:
-        result['is_valid'] = False
-        result['reasons'].append(f"Below system minimum ({SlugGeneratorConfig.SYSTEM_MIN_WORDS} words)")
-    
-    if len(words) > SlugGeneratorConfig.SYSTEM_MAX_WORDS:
-        result['is_valid'] = False
-        result['reasons'].append(f"Exceeds system maximum ({SlugGeneratorConfig.SYSTEM_MAX_WORDS} words)")
-    
-    if len(slug) > SlugGeneratorConfig.SYSTEM_MAX_CHARS:
-        result['is_valid'] = False
-        result['reasons'].append(f"Exceeds system character limit ({SlugGeneratorConfig.SYSTEM_MAX_CHARS} chars)")
+    Count hyphen-separated words and report whether the slug is well formed.
     
-    # Basic format validation (same as regular validation)
-    if not re.match(r'^[a-z0-9-]+$', slug):
-        result['is_valid'] = False
-        result['reasons'].append("Contains invalid characters (only lowercase letters, numbers, and hyphens allowed)")
+    Well-formed slugs (one shape regex match) have no empty segments, so the
+    count is hyphens + 1 without building a list; malformed slugs fall back
+    to a filtered split.
+    """
+    if _SLUG_SHAPE.match(slug):
+        return slug.count('-') + 1, True
+    return len([w for w in slug.split('-') if w]), False
+
+
+def _check_format(slug: str, reasons: List[str]) -> None:
+    """Record character and hyphen-placement violations shared by both validators"""
+    # Check character validity
+    if slug.translate(_DELETE_ALLOWED):
+        reasons.append(_R_BAD_CHARS)
     
+    # Check for consecutive hyphens
     if '--' in slug:
-        result['is_valid'] = False
-        result['reasons'].append("Contains consecutive hyphens")
+        reasons.append(_R_CONSEC)
     
+    # Check for leading/trailing hyphens
     if slug.startswith('-') or slug.endswith('-'):
-        result['is_valid'] = False
-        result['reasons'].append("Starts or ends with hyphen")
-    
-    return result
\ No newline at end of file
+        reasons.append(_R_EDGE)
\ No newline at end of file
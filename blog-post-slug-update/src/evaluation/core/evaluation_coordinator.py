@@ -5,12 +5,25 @@ Combines rule-based quantitative analysis with LLM qualitative evaluation.
 Provides graceful degradation when LLM unavailable.
 """
 
-from typing import Dict, List, Any, Optional
+import asyncio
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple
 from .rule_based_analyzer import RuleBasedAnalyzer
 from .seo_evaluator_clean import SEOEvaluator
 from ..utils.exceptions import LLMUnavailableError, InvalidAPIKeyError
 from ..utils.retry_logic import RetryConfig
 
+# Title character sets used by _analyze_complexity
+_SPECIAL_PUNCT = frozenset('！？、。／＆')
+_ENTITY_SEPARATORS = frozenset('/&、')
+
+# Quantitative dimensions paired with their qualitative counterparts
+_META_DIMENSIONS = (
+    ('technical_seo', 'technical_seo'),
+    ('brand_hierarchy', 'brand_hierarchy'),
+    ('cultural_preservation', 'cultural_authenticity'),
+)
+
 
 class EvaluationCoordinator:
     """Orchestrate both quantitative and qualitative analysis"""
@@ -49,6 +62,17 @@ class EvaluationCoordinator:
                 self.llm_available = True
             except InvalidAPIKeyError:
                 self.llm_available = False
+        
+        # Capabilities are fixed once the evaluators are set up. Results embed
+        # one shared JSON-safe copy; get_analysis_capabilities returns the
+        # read-only mapping for callers that might modify it
+        self._capabilities = self._build_capabilities()
+        self._capabilities_json = self._capabilities_dict()
+        
+        # Without an LLM every evaluation is quantitative only, so bind the
+        # specialized path once instead of re-checking availability per call
+        if not (self.llm_available and self.qualitative_evaluator):
+            self.evaluate_comprehensive = self._evaluate_quantitative_only
 
     def evaluate_comprehensive(self, slug: str, title: str, content: str) -> Dict[str, Any]:
         """
@@ -80,6 +104,66 @@ class EvaluationCoordinator:
         # Combine results
         return self._combine_analyses(quantitative_result, qualitative_result, llm_error)
 
+    def _evaluate_quantitative_only(self, slug: str, title: str, content: str) -> Dict[str, Any]:
+        """evaluate_comprehensive for coordinators without an LLM evaluator"""
+        
+        return {
+            'quantitative_analysis': self.quantitative_analyzer.analyze_slug(slug, title, content),
+            'qualitative_insights': None,
+            'analysis_type': 'quantitative_only',
+            'llm_available': False,
+            'capabilities': self._capabilities_json
+        }
+
+    async def evaluate_comprehensive_batch(
+        self,
+        items: List[Tuple[str, str, str]],
+        max_concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Evaluate many slugs, overlapping LLM requests with quantitative analysis
+        
+        Args:
+            items: (slug, title, content) tuples to evaluate
+            max_concurrency: Maximum number of LLM evaluations in flight
+            
+        Returns:
+            List of evaluate_comprehensive results in input order
+        """
+        
+        # Quantitative analysis runs in one worker thread while LLM calls wait on the network
+        quantitative_task = asyncio.to_thread(self._analyze_quantitative_batch, items)
+        
+        if not (self.llm_available and self.qualitative_evaluator):
+            quantitative_results = await quantitative_task
+            return [self._combine_analyses(result, None, None) for result in quantitative_results]
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def evaluate_qualitative(item: Tuple[str, str, str]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+            async with semaphore:
+                try:
+                    result = await asyncio.to_thread(self.qualitative_evaluator.evaluate_slug, *item)
+                    return result, None
+                except LLMUnavailableError as e:
+                    # Don't fail - continue with quantitative only for this item
+                    return None, str(e)
+        
+        quantitative_results, qualitative_results = await asyncio.gather(
+            quantitative_task,
+            asyncio.gather(*(evaluate_qualitative(item) for item in items))
+        )
+        
+        return [
+            self._combine_analyses(quantitative, qualitative, llm_error)
+            for quantitative, (qualitative, llm_error) in zip(quantitative_results, qualitative_results)
+        ]
+
+    def _analyze_quantitative_batch(self, items: List[Tuple[str, str, str]]) -> List[Dict[str, Any]]:
+        """Run rule-based analysis over a batch of (slug, title, content) items"""
+        slugs, titles, contents = zip(*items) if items else ((), (), ())
+        return self.quantitative_analyzer.analyze_slugs(list(slugs), list(titles), list(contents))
+
     def evaluate_failure_case(self, title: str, content: str, failure_reason: str) -> Dict[str, Any]:
         """
         Evaluate failure cases using available analysis methods
@@ -115,36 +199,51 @@ class EvaluationCoordinator:
         
         return failure_analysis
 
-    def get_analysis_capabilities(self) -> Dict[str, Any]:
+    def get_analysis_capabilities(self) -> Mapping[str, Any]:
         """
         Get information about available analysis capabilities
         
         Returns:
-            Dict describing what analysis types are available
+            Read-only mapping describing what analysis types are available
         """
         
-        return {
+        return self._capabilities
+
+    def _build_capabilities(self) -> Mapping[str, Any]:
+        """Build the read-only capabilities mapping for this coordinator"""
+        
+        return MappingProxyType({
             'quantitative_analysis': True,  # Always available
             'qualitative_analysis': self.llm_available,
             'llm_model': self.qualitative_evaluator.model if self.qualitative_evaluator else None,
-            'analysis_dimensions': {
-                'quantitative': [
+            'analysis_dimensions': MappingProxyType({
+                'quantitative': (
                     'technical_seo',
                     'brand_hierarchy', 
                     'cultural_preservation',
                     'structure_analysis',
                     'seo_compliance'
-                ],
-                'qualitative': [
+                ),
+                'qualitative': (
                     'user_intent_match',
                     'brand_hierarchy',
                     'cultural_authenticity', 
                     'click_through_potential',
                     'competitive_differentiation',
                     'technical_seo'
-                ] if self.llm_available else []
-            }
+                ) if self.llm_available else ()
+            })
+        })
+
+    def _capabilities_dict(self) -> Dict[str, Any]:
+        """JSON-serializable copy of the capabilities, built once for embedding in results"""
+        
+        capabilities = dict(self._capabilities)
+        capabilities['analysis_dimensions'] = {
+            kind: list(dimensions)
+            for kind, dimensions in self._capabilities['analysis_dimensions'].items()
         }
+        return capabilities
 
     def _combine_analyses(
         self, 
@@ -160,7 +259,7 @@ class EvaluationCoordinator:
             'qualitative_insights': qualitative,
             'analysis_type': 'complete' if qualitative else 'quantitative_only',
             'llm_available': qualitative is not None,
-            'capabilities': self.get_analysis_capabilities()
+            'capabilities': self._capabilities_json
         }
         
         # Add error information if LLM failed
@@ -187,8 +286,14 @@ class EvaluationCoordinator:
     ) -> Dict[str, Any]:
         """Generate recommendation combining both analysis types"""
         
+        # Read every score used below once
+        dimension_scores = qualitative['dimension_scores']
         quant_score = quantitative['overall_score']
         qual_score = qualitative['overall_score']
+        quant_technical = quantitative['technical_seo']['score']
+        qual_technical = dimension_scores['technical_seo']
+        quant_brand = quantitative['brand_hierarchy']['score']
+        qual_brand = dimension_scores['brand_hierarchy']
         
         # Weighted combination (favor qualitative insights slightly)
         combined_score = (quant_score * 0.4) + (qual_score * 0.6)
@@ -197,14 +302,10 @@ class EvaluationCoordinator:
         convergent_insights = []
         
         # Technical SEO convergence
-        quant_technical = quantitative['technical_seo']['score']
-        qual_technical = qualitative['dimension_scores']['technical_seo']
         if abs(quant_technical - qual_technical) < 0.2:
             convergent_insights.append('Technical SEO assessment converges between analyses')
         
         # Brand hierarchy convergence
-        quant_brand = quantitative['brand_hierarchy']['score']
-        qual_brand = qualitative['dimension_scores']['brand_hierarchy']
         if abs(quant_brand - qual_brand) < 0.2:
             convergent_insights.append('Brand hierarchy assessment shows strong agreement')
         
@@ -232,29 +333,27 @@ class EvaluationCoordinator:
     ) -> Dict[str, Any]:
         """Calculate meta-analysis combining both approaches"""
         
-        # Dimension-by-dimension comparison
+        # Dimension-by-dimension comparison over the overlapping dimensions
         dimension_comparison = {}
+        qual_scores = qualitative['dimension_scores']
+        agreements = 0
         
-        # Map overlapping dimensions
-        dimension_mapping = {
-            'technical_seo': 'technical_seo',
-            'brand_hierarchy': 'brand_hierarchy',
-            'cultural_preservation': 'cultural_authenticity'
-        }
-        
-        for quant_dim, qual_dim in dimension_mapping.items():
+        for quant_dim, qual_dim in _META_DIMENSIONS:
             quant_score = quantitative[quant_dim]['score']
-            qual_score = qualitative['dimension_scores'][qual_dim]
+            qual_score = qual_scores[qual_dim]
+            difference = abs(quant_score - qual_score)
+            agreement = difference < 0.2
+            agreements += agreement
             
             dimension_comparison[quant_dim] = {
                 'quantitative_score': quant_score,
                 'qualitative_score': qual_score,
-                'agreement': abs(quant_score - qual_score) < 0.2,
-                'difference': abs(quant_score - qual_score)
+                'agreement': agreement,
+                'difference': difference
             }
         
         # Overall meta-insights
-        avg_agreement = sum(1 for comp in dimension_comparison.values() if comp['agreement']) / len(dimension_comparison)
+        avg_agreement = agreements / len(_META_DIMENSIONS)
         
         return {
             'dimension_comparison': dimension_comparison,
@@ -283,25 +382,45 @@ class EvaluationCoordinator:
     def _analyze_complexity(self, title: str, content: str) -> List[str]:
         """Analyze complexity factors that might cause generation failures"""
         
+        # Collect every title feature in a single pass over the characters
+        has_cjk = has_latin = has_special = has_entities = False
+        word_count = 0
+        in_word = False
+        for ch in title:
+            if ch.isspace():
+                in_word = False
+                continue
+            if not in_word:
+                word_count += 1
+                in_word = True
+            if '一' <= ch <= '龯':
+                has_cjk = True
+            elif 'a' <= ch <= 'z' or 'A' <= ch <= 'Z':
+                has_latin = True
+            else:
+                if ch in _SPECIAL_PUNCT:
+                    has_special = True
+                if ch in _ENTITY_SEPARATORS:
+                    has_entities = True
+        
         complexity_factors = []
         
         if len(title) > 100:
             complexity_factors.append('very_long_title')
         
-        if len(title.split()) > 20:
+        if word_count > 20:
             complexity_factors.append('high_word_count')
         
         # Multi-language content
-        import re
-        if re.search(r'[一-龯]', title) and re.search(r'[a-zA-Z]', title):
+        if has_cjk and has_latin:
             complexity_factors.append('mixed_language_content')
         
         # Special characters
-        if re.search(r'[！？、。／＆]', title):
+        if has_special:
             complexity_factors.append('special_punctuation')
         
         # Multiple brands/entities
-        if '/' in title or '&' in title or '、' in title:
+        if has_entities:
             complexity_factors.append('multiple_entities')
         
         return complexity_factors
\ No newline at end of file
@@ -5,18 +5,144 @@ Extracts actionable improvement suggestions and cultural feedback
 from slug comparison analyses.
 """
 
+import asyncio
+import io
 import json
-from typing import Dict, List, Any, Optional
-from openai import OpenAI
+import re
+import time
+from collections import ChainMap
+from typing import Dict, List, Any, Optional, Tuple
+from openai import AsyncOpenAI, OpenAI
+
+from ..utils.json_utils import aread_json_stream, loads
+from ..utils.openai_client import BATCH_TERMINAL_STATES, new_async_http_client, shared_http_client
+from ..utils.response_cache import ResponseCache
+from ..utils.retry_logic import RetryConfig
+from ..utils.tokens import estimate_prompt_tokens
+
+# System prompts for the two extraction tasks
+IMPROVEMENT_SYSTEM_PROMPT = "You are an expert prompt engineer specializing in SEO slug optimization. Analyze slug comparisons to provide actionable improvement insights."
+CULTURAL_SYSTEM_PROMPT = "You are a cultural localization expert specializing in Asian e-commerce terminology. Analyze cultural term preservation in SEO slugs."
+
+# Prompt templates, filled with str.format_map from the comparison dict;
+# missing keys fall back to the matching defaults below
+IMPROVEMENT_PROMPT_TEMPLATE = """
+Analyze this slug comparison to extract actionable improvement insights:
+
+SLUG A: "{slug_a}"
+SLUG B: "{slug_b}"
+TITLE: "{title}"
+CONTENT: "{content}..."
+WINNER: {winner}
+SCORE DIFFERENCE: {score_difference}
+
+Provide detailed analysis for prompt optimization:
+
+1. STRENGTHS: What makes the winning slug better?
+2. WEAKNESSES: What are the losing slug's key problems?
+3. SPECIFIC_IMPROVEMENTS: Actionable changes for future slugs
+4. PATTERN_INSIGHTS: Broader patterns for prompt enhancement
+
+Focus on insights that can improve prompt engineering and slug generation.
+
+Return JSON format:
+{{
+    "strengths": ["strength1", "strength2", ...],
+    "weaknesses": ["weakness1", "weakness2", ...],
+    "specific_improvements": ["improvement1", "improvement2", ...],
+    "pattern_insights": ["insight1", "insight2", ...]
+}}
+"""
+
+CULTURAL_PROMPT_TEMPLATE = """
+Analyze cultural term preservation in these slugs:
+
+SLUG A: "{slug_a}"
+SLUG B: "{slug_b}" 
+TITLE: "{title}"
+CONTENT: "{content}..."
+WINNER: {winner}
+CULTURAL TERMS: {cultural_terms}
+
+Evaluate cultural awareness:
+
+1. CULTURAL_PRESERVATION: How well are cultural terms preserved? (0.0-1.0)
+2. AUTHENTICITY_SCORE: Overall cultural authenticity (0.0-1.0)  
+3. CULTURAL_INSIGHTS: Specific observations about cultural handling
+
+Focus on Asian e-commerce terminology, brand names, and cultural context.
+
+Return JSON format:
+{{
+    "cultural_preservation": 0.0-1.0,
+    "authenticity_score": 0.0-1.0,
+    "cultural_insights": ["insight1", "insight2", ...]
+}}
+"""
+
+_IMPROVEMENT_PROMPT_DEFAULTS = {
+    'slug_a': 'N/A', 'slug_b': 'N/A', 'title': 'N/A', 'winner': 'unknown', 'score_difference': 0.0
+}
+_CULTURAL_PROMPT_DEFAULTS = {
+    'slug_a': 'N/A', 'slug_b': 'N/A', 'title': 'N/A', 'winner': 'unknown'
+}
+
+# List fields every improvement suggestion result carries
+IMPROVEMENT_FIELDS = ('strengths', 'weaknesses', 'specific_improvements', 'pattern_insights')
+
+# Sentinel for absent result fields (None is a value the model can return)
+_MISSING = object()
+
+# Output caps sized to the fixed JSON schemas; a truncated response is
+# retried once with twice the cap
+IMPROVEMENT_MAX_TOKENS = 400
+CULTURAL_MAX_TOKENS = 250
+
+# Below this many comparisons the Batch API's turnaround isn't worth it
+BATCH_API_MIN_ITEMS = 8
+
+# Estimated prompt tokens per Batch API job; larger jobs are split
+BATCH_TOKEN_BUDGET = 90_000
+
+# Default number of concurrent requests for extract_many
+DEFAULT_MAX_CONCURRENCY = 20
+
+# Brands credited in heuristic fallback suggestions, matched anywhere in the
+# winning slug with a single precompiled scan
+_FALLBACK_BRANDS = frozenset({'jojo', 'skinniydip', 'daikoku', 'rakuten'})
+_FALLBACK_BRAND_RE = re.compile('|'.join(sorted(_FALLBACK_BRANDS)))
+
+
+def _with_doubled_max_tokens(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a chat completion request with its output cap doubled"""
+    return {**request, 'max_tokens': request['max_tokens'] * 2}
 
 
 class FeedbackExtractor:
     """Extract qualitative insights and improvement suggestions from evaluations"""
     
-    def __init__(self, api_key: str, model: str = "gpt-4o-mini"):
-        """Initialize feedback extractor with OpenAI client"""
-        self.client = OpenAI(api_key=api_key)
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4o-mini",
+        retry_config: Optional[RetryConfig] = None,
+        cache_dir: Optional[str] = None
+    ):
+        """
+        Initialize feedback extractor with OpenAI client
+        
+        Args:
+            api_key: OpenAI API key
+            model: OpenAI model for extraction
+            retry_config: Retry configuration for concurrent extraction
+            cache_dir: Directory for the persistent response cache (disabled if None)
+        """
+        self.client = OpenAI(api_key=api_key, http_client=shared_http_client())
+        self.api_key = api_key
         self.model = model
+        # Retries for the concurrent path, where rate limits are likely
+        self.retry_config = retry_config or RetryConfig()
+        self.cache = ResponseCache(cache_dir) if cache_dir else None
 
     def extract_improvement_suggestions(self, comparison_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -29,27 +155,19 @@ class FeedbackExtractor:
             Dict with strengths, weaknesses, specific_improvements, pattern_insights
         """
         
-        prompt = self._create_improvement_prompt(comparison_data)
+        request = self._improvement_request(comparison_data)
+        key = self._cache_key(request)
         
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert prompt engineer specializing in SEO slug optimization. Analyze slug comparisons to provide actionable improvement insights."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.4
-            )
+            raw = self._cached_content(key)
+            cached = raw is not None
+            if not cached:
+                raw = self._complete(request)
             
-            result = json.loads(response.choices[0].message.content)
-            return self._validate_improvement_suggestions(result)
+            suggestions = self._validate_improvement_suggestions(loads(raw))
+            if key is not None and not cached:
+                self.cache.set(key, raw)
+            return suggestions
             
         except Exception as e:
             return self._create_fallback_suggestions(comparison_data, str(e))
@@ -65,104 +183,381 @@ class FeedbackExtractor:
             Dict with cultural_preservation, authenticity_score, cultural_insights
         """
         
-        prompt = self._create_cultural_prompt(cultural_comparison)
+        request = self._cultural_request(cultural_comparison)
+        key = self._cache_key(request)
         
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system", 
-                        "content": "You are a cultural localization expert specializing in Asian e-commerce terminology. Analyze cultural term preservation in SEO slugs."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.3
-            )
+            raw = self._cached_content(key)
+            cached = raw is not None
+            if not cached:
+                raw = self._complete(request)
             
-            result = json.loads(response.choices[0].message.content)
-            return self._validate_cultural_feedback(result, cultural_comparison)
+            feedback = self._validate_cultural_feedback(loads(raw), cultural_comparison)
+            if key is not None and not cached:
+                self.cache.set(key, raw)
+            return feedback
             
         except Exception as e:
             return self._create_fallback_cultural_feedback(cultural_comparison, str(e))
 
-    def _create_improvement_prompt(self, comparison_data: Dict) -> str:
-        """Create prompt for improvement suggestion extraction"""
+    def extract_many(
+        self,
+        comparisons: List[Dict[str, Any]],
+        cultural_comparisons: Optional[List[Dict[str, Any]]] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Run many extractions concurrently from synchronous code
         
-        return f"""
-Analyze this slug comparison to extract actionable improvement insights:
+        Args:
+            comparisons: Comparison dicts for improvement suggestions
+            cultural_comparisons: Comparison dicts for cultural feedback
+            max_concurrency: Maximum number of requests in flight
+            
+        Returns:
+            Dict with improvement_suggestions and cultural_feedback lists in input order
+        """
+        
+        return asyncio.run(self.aextract_many(comparisons, cultural_comparisons, max_concurrency))
 
-SLUG A: "{comparison_data.get('slug_a', 'N/A')}"
-SLUG B: "{comparison_data.get('slug_b', 'N/A')}"
-TITLE: "{comparison_data.get('title', 'N/A')}"
-CONTENT: "{comparison_data.get('content', 'N/A')[:300]}..."
-WINNER: {comparison_data.get('winner', 'unknown')}
-SCORE DIFFERENCE: {comparison_data.get('score_difference', 0.0)}
+    async def aextract_many(
+        self,
+        comparisons: List[Dict[str, Any]],
+        cultural_comparisons: Optional[List[Dict[str, Any]]] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Async version of extract_many; all requests share one semaphore"""
+        
+        cultural_comparisons = cultural_comparisons or []
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        # The async client is scoped to this call so its connections never outlive the event loop
+        async with AsyncOpenAI(api_key=self.api_key, http_client=new_async_http_client()) as client:
+            async def complete(request: Dict[str, Any], validate) -> Dict[str, Any]:
+                # Only responses that decode and validate are cached
+                key = self._cache_key(request)
+                raw = self._cached_content(key)
+                cached = raw is not None
+                if not cached:
+                    async with semaphore:
+                        raw = await self.retry_config.aexecute_with_retry(
+                            lambda: self._astream_content(client, request)
+                        )
+                
+                result = validate(loads(raw))
+                if key is not None and not cached:
+                    self.cache.set(key, raw)
+                return result
+            
+            async def improvement(comparison: Dict[str, Any]) -> Dict[str, Any]:
+                try:
+                    return await complete(
+                        self._improvement_request(comparison), self._validate_improvement_suggestions
+                    )
+                except Exception as e:
+                    return self._create_fallback_suggestions(comparison, str(e))
+            
+            async def cultural(comparison: Dict[str, Any]) -> Dict[str, Any]:
+                try:
+                    return await complete(
+                        self._cultural_request(comparison),
+                        lambda result: self._validate_cultural_feedback(result, comparison)
+                    )
+                except Exception as e:
+                    return self._create_fallback_cultural_feedback(comparison, str(e))
+            
+            results = await asyncio.gather(
+                *(improvement(c) for c in comparisons),
+                *(cultural(c) for c in cultural_comparisons)
+            )
+        
+        return {
+            'improvement_suggestions': list(results[:len(comparisons)]),
+            'cultural_feedback': list(results[len(comparisons):])
+        }
 
-Provide detailed analysis for prompt optimization:
+    def extract_improvement_suggestions_batch(
+        self,
+        comparisons: List[Dict[str, Any]],
+        poll_interval: float = 10.0
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract improvement suggestions for many comparisons in one Batch API job
+        
+        Args:
+            comparisons: List of comparison dicts as for extract_improvement_suggestions
+            poll_interval: Seconds between batch status checks
+            
+        Returns:
+            List of suggestion dicts in input order
+        """
+        
+        if len(comparisons) < BATCH_API_MIN_ITEMS:
+            return self.extract_many(comparisons)['improvement_suggestions']
+        
+        try:
+            contents, fresh_keys = self._run_batch(
+                [self._improvement_request(c) for c in comparisons], 'imp', poll_interval
+            )
+        except Exception:
+            # Batch submission unavailable - fall back to one request per comparison
+            return [self.extract_improvement_suggestions(c) for c in comparisons]
+        
+        results = []
+        for comparison, content, key in zip(comparisons, contents, fresh_keys):
+            try:
+                if content is None:
+                    raise ValueError("Batch request produced no output")
+                results.append(self._validate_improvement_suggestions(loads(content)))
+                if key is not None:
+                    self.cache.set(key, content)
+            except Exception as e:
+                results.append(self._create_fallback_suggestions(comparison, str(e)))
+        return results
 
-1. STRENGTHS: What makes the winning slug better?
-2. WEAKNESSES: What are the losing slug's key problems?
-3. SPECIFIC_IMPROVEMENTS: Actionable changes for future slugs
-4. PATTERN_INSIGHTS: Broader patterns for prompt enhancement
+    def extract_cultural_feedback_batch(
+        self,
+        cultural_comparisons: List[Dict[str, Any]],
+        poll_interval: float = 10.0
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract cultural feedback for many comparisons in one Batch API job
+        
+        Args:
+            cultural_comparisons: List of comparison dicts as for extract_cultural_feedback
+            poll_interval: Seconds between batch status checks
+            
+        Returns:
+            List of cultural feedback dicts in input order
+        """
+        
+        if len(cultural_comparisons) < BATCH_API_MIN_ITEMS:
+            return self.extract_many([], cultural_comparisons)['cultural_feedback']
+        
+        try:
+            contents, fresh_keys = self._run_batch(
+                [self._cultural_request(c) for c in cultural_comparisons], 'cul', poll_interval
+            )
+        except Exception:
+            # Batch submission unavailable - fall back to one request per comparison
+            return [self.extract_cultural_feedback(c) for c in cultural_comparisons]
+        
+        results = []
+        for comparison, content, key in zip(cultural_comparisons, contents, fresh_keys):
+            try:
+                if content is None:
+                    raise ValueError("Batch request produced no output")
+                results.append(self._validate_cultural_feedback(loads(content), comparison))
+                if key is not None:
+                    self.cache.set(key, content)
+            except Exception as e:
+                results.append(self._create_fallback_cultural_feedback(comparison, str(e)))
+        return results
 
-Focus on insights that can improve prompt engineering and slug generation.
+    def _improvement_request(self, comparison_data: Dict) -> Dict[str, Any]:
+        """Chat completion arguments for improvement suggestion extraction"""
+        
+        return {
+            'model': self.model,
+            'messages': [
+                {"role": "system", "content": IMPROVEMENT_SYSTEM_PROMPT},
+                {"role": "user", "content": self._create_improvement_prompt(comparison_data)}
+            ],
+            'response_format': {"type": "json_object"},
+            'temperature': 0.4,
+            'max_tokens': IMPROVEMENT_MAX_TOKENS,
+            'seed': 0
+        }
 
-Return JSON format:
-{{
-    "strengths": ["strength1", "strength2", ...],
-    "weaknesses": ["weakness1", "weakness2", ...],
-    "specific_improvements": ["improvement1", "improvement2", ...],
-    "pattern_insights": ["insight1", "insight2", ...]
-}}
-"""
+    def _cultural_request(self, cultural_comparison: Dict) -> Dict[str, Any]:
+        """Chat completion arguments for cultural feedback extraction"""
+        
+        return {
+            'model': self.model,
+            'messages': [
+                {"role": "system", "content": CULTURAL_SYSTEM_PROMPT},
+                {"role": "user", "content": self._create_cultural_prompt(cultural_comparison)}
+            ],
+            'response_format': {"type": "json_object"},
+            'temperature': 0.3,
+            'max_tokens': CULTURAL_MAX_TOKENS,
+            'seed': 0
+        }
 
-    def _create_cultural_prompt(self, cultural_comparison: Dict) -> str:
-        """Create prompt for cultural feedback extraction"""
+    @staticmethod
+    async def _astream_content(client: AsyncOpenAI, request: Dict[str, Any]) -> str:
+        """
+        Stream one completion, closing the stream as soon as the JSON object
+        is complete. A response cut off by max_tokens is requested once more
+        with twice the cap.
+        """
         
-        cultural_terms = cultural_comparison.get('cultural_terms', [])
-        terms_str = ', '.join(cultural_terms) if cultural_terms else 'None specified'
+        for attempt_request in (request, _with_doubled_max_tokens(request)):
+            stream = await client.chat.completions.create(**attempt_request, stream=True)
+            content, finish_reason = await aread_json_stream(stream)
+            if finish_reason != 'length':
+                break
+        return content
+
+    def _complete(self, request: Dict[str, Any]) -> str:
+        """Return the message content for one request"""
         
-        return f"""
-Analyze cultural term preservation in these slugs:
+        content, finish_reason = self._create_completion(request)
+        if finish_reason == 'length':
+            # Output hit max_tokens mid-JSON; one retry with a larger cap
+            content, _ = self._create_completion(_with_doubled_max_tokens(request))
+        
+        return content
 
-SLUG A: "{cultural_comparison.get('slug_a', 'N/A')}"
-SLUG B: "{cultural_comparison.get('slug_b', 'N/A')}" 
-TITLE: "{cultural_comparison.get('title', 'N/A')}"
-CONTENT: "{cultural_comparison.get('content', 'N/A')[:300]}..."
-WINNER: {cultural_comparison.get('winner', 'unknown')}
-CULTURAL TERMS: {terms_str}
+    def _create_completion(self, request: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+        """Return (content, finish_reason) for one chat completion"""
+        
+        choice = self.client.chat.completions.create(**request).choices[0]
+        return choice.message.content, choice.finish_reason
 
-Evaluate cultural awareness:
+    def _cache_key(self, request: Dict[str, Any]) -> Optional[str]:
+        """Cache key for a request, or None when caching is disabled"""
+        return ResponseCache.make_key(request) if self.cache is not None else None
 
-1. CULTURAL_PRESERVATION: How well are cultural terms preserved? (0.0-1.0)
-2. AUTHENTICITY_SCORE: Overall cultural authenticity (0.0-1.0)  
-3. CULTURAL_INSIGHTS: Specific observations about cultural handling
+    def _cached_content(self, key: Optional[str]) -> Optional[str]:
+        """Cached raw response content for key, or None on a miss"""
+        return self.cache.get(key) if key is not None else None
 
-Focus on Asian e-commerce terminology, brand names, and cultural context.
+    def _run_batch(
+        self,
+        bodies: List[Dict[str, Any]],
+        prefix: str,
+        poll_interval: float
+    ) -> Tuple[List[Optional[str]], List[Optional[str]]]:
+        """
+        Answer chat completion bodies from the cache or one Batch API job.
+        
+        Returns message contents in input order, with None for requests
+        that produced no successful output, and the cache key of each
+        content fetched by the job (None for cached or uncacheable ones).
+        The caller stores a fresh content only once it has validated it.
+        """
+        
+        keys = [self._cache_key(body) for body in bodies]
+        contents = {}
+        for i, key in enumerate(keys):
+            cached = self._cached_content(key)
+            if cached is not None:
+                contents[f"{prefix}-{i}"] = cached
+        
+        pending = [i for i in range(len(bodies)) if f"{prefix}-{i}" not in contents]
+        if pending:
+            # Create every job before waiting, so sub-batches run side by side
+            batches = [
+                self._create_batch_job(bodies, group, f"{prefix}-{n}", prefix)
+                for n, group in enumerate(self._pack_by_tokens(bodies, pending))
+            ]
+            for batch in batches:
+                contents.update(self._collect_batch(batch, poll_interval))
+        
+        pending_set = set(pending)
+        fresh_keys = [keys[i] if i in pending_set else None for i in range(len(bodies))]
+        return [contents.get(f"{prefix}-{i}") for i in range(len(bodies))], fresh_keys
 
-Return JSON format:
-{{
-    "cultural_preservation": 0.0-1.0,
-    "authenticity_score": 0.0-1.0,
-    "cultural_insights": ["insight1", "insight2", ...]
-}}
-"""
+    def _pack_by_tokens(self, bodies: List[Dict[str, Any]], indices: List[int]) -> List[List[int]]:
+        """
+        Group request indices into sub-batches of at most BATCH_TOKEN_BUDGET
+        estimated tokens each.
+        
+        Indices are sorted by size first, so each job holds requests of
+        similar length. A single request above the budget gets its own job.
+        """
+        
+        sized = sorted((estimate_prompt_tokens(bodies[i]), i) for i in indices)
+        groups = []
+        group, group_tokens = [], 0
+        for tokens, i in sized:
+            if group and group_tokens + tokens > BATCH_TOKEN_BUDGET:
+                groups.append(group)
+                group, group_tokens = [], 0
+            group.append(i)
+            group_tokens += tokens
+        if group:
+            groups.append(group)
+        return groups
+
+    def _create_batch_job(
+        self,
+        bodies: List[Dict[str, Any]],
+        indices: List[int],
+        name: str,
+        prefix: str
+    ) -> Any:
+        """Upload the bodies at indices as one Batch API job and return the batch"""
+        
+        lines = [
+            json.dumps({
+                "custom_id": f"{prefix}-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": bodies[i]
+            }, ensure_ascii=False)
+            for i in indices
+        ]
+        batch_file = io.BytesIO('\n'.join(lines).encode('utf-8'))
+        uploaded = self.client.files.create(file=(f"{name}-batch.jsonl", batch_file), purpose="batch")
+        
+        return self.client.batches.create(
+            input_file_id=uploaded.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+
+    def _collect_batch(self, batch: Any, poll_interval: float) -> Dict[str, str]:
+        """Wait for a batch to finish; returns contents by custom_id"""
+        
+        while batch.status not in BATCH_TERMINAL_STATES:
+            time.sleep(poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+        
+        contents = {}
+        if batch.status == 'completed' and batch.output_file_id:
+            output = self.client.files.content(batch.output_file_id).text
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+                record = loads(line)
+                response = record.get('response') or {}
+                if response.get('status_code') == 200:
+                    contents[record['custom_id']] = response['body']['choices'][0]['message']['content']
+        
+        return contents
+
+    def _create_improvement_prompt(self, comparison_data: Dict) -> str:
+        """Create prompt for improvement suggestion extraction"""
+        
+        return IMPROVEMENT_PROMPT_TEMPLATE.format_map(ChainMap(
+            {'content': comparison_data.get('content', 'N/A')[:300]},
+            comparison_data,
+            _IMPROVEMENT_PROMPT_DEFAULTS
+        ))
+
+    def _create_cultural_prompt(self, cultural_comparison: Dict) -> str:
+        """Create prompt for cultural feedback extraction"""
+        
+        cultural_terms = cultural_comparison.get('cultural_terms', [])
+        terms_str = ', '.join(cultural_terms) if cultural_terms else 'None specified'
+        
+        return CULTURAL_PROMPT_TEMPLATE.format_map(ChainMap(
+            {'content': cultural_comparison.get('content', 'N/A')[:300], 'cultural_terms': terms_str},
+            cultural_comparison,
+            _CULTURAL_PROMPT_DEFAULTS
+        ))
 
     def _validate_improvement_suggestions(self, result: Dict) -> Dict:
         """Validate and ensure required fields in improvement suggestions"""
         
-        required_fields = ['strengths', 'weaknesses', 'specific_improvements', 'pattern_insights']
-        
-        for field in required_fields:
-            if field not in result:
+        for field in IMPROVEMENT_FIELDS:
+            value = result.get(field, _MISSING)
+            if value is _MISSING:
                 result[field] = []
-            elif not isinstance(result[field], list):
-                result[field] = [str(result[field])]
+            elif not isinstance(value, list):
+                result[field] = [str(value)]
         
         # Ensure minimum content
         if len(result['specific_improvements']) < 2:
@@ -182,7 +577,8 @@ Return JSON format:
             cultural_terms = comparison_data.get('cultural_terms', [])
             winner_slug = comparison_data.get(comparison_data.get('winner', 'slug_b'), '')
             
-            preserved_count = sum(1 for term in cultural_terms if term in winner_slug.lower())
+            winner_slug_lc = winner_slug.lower()
+            preserved_count = sum(1 for term in cultural_terms if term in winner_slug_lc)
             result['cultural_preservation'] = preserved_count / max(1, len(cultural_terms))
         
         if 'authenticity_score' not in result:
@@ -216,7 +612,8 @@ Return JSON format:
             strengths.append('More concise word count')
             improvements.append('Optimize for conciseness')
         
-        if any(brand in winner_slug.lower() for brand in ['jojo', 'skinniydip', 'daikoku', 'rakuten']):
+        winner_slug_lc = winner_slug.lower()
+        if _FALLBACK_BRAND_RE.search(winner_slug_lc):
             strengths.append('Contains recognizable brand names')
             improvements.append('Prioritize brand name inclusion')
         
@@ -245,8 +642,9 @@ Return JSON format:
         
         # Rule-based cultural scoring
         if cultural_terms and winner_slug:
+            winner_slug_lc = winner_slug.lower()
             preserved_count = sum(1 for term in cultural_terms 
-                                if any(part in winner_slug.lower() for part in term.lower().split()))
+                                if any(part in winner_slug_lc for part in term.lower().split()))
             preservation_score = preserved_count / len(cultural_terms)
         else:
             preservation_score = 0.5
@@ -0,0 +1,194 @@
+"""
+Rate-Limited Evaluator - Quota-aware concurrent SEO evaluation
+
+Dispatches SEOEvaluator requests as fast as configured requests-per-minute
+and tokens-per-minute limits allow, retrying rate-limited requests with
+exponential backoff instead of failing them.
+"""
+
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, List, Tuple
+
+from openai import AsyncOpenAI, RateLimitError
+
+from .seo_evaluator import SEOEvaluator
+from ..utils.openai_client import new_async_http_client
+from ..utils.tokens import estimate_prompt_tokens
+
+# Default account limits; set these to the organisation's actual quota
+DEFAULT_MAX_RPM = 500
+DEFAULT_MAX_TPM = 200_000
+
+# Completion tokens assumed per evaluation when reserving token capacity
+COMPLETION_TOKEN_ESTIMATE = 500
+
+
+class AsyncRateLimitedEvaluator:
+    """
+    Evaluate many slugs concurrently without overshooting API rate limits.
+    
+    Request and token capacity refill linearly up to one minute's worth.
+    An item is dispatched only when both cover its estimated cost. A
+    rate-limited request is queued again after base_delay * 2**attempt,
+    and dispatching pauses for that long so the quota can recover.
+    """
+
+    def __init__(
+        self,
+        evaluator: SEOEvaluator,
+        max_rpm: float = DEFAULT_MAX_RPM,
+        max_tpm: float = DEFAULT_MAX_TPM,
+        max_attempts: int = 5,
+        base_delay: float = 1.0
+    ):
+        """
+        Initialize dispatcher around an evaluator
+        
+        Args:
+            evaluator: SEOEvaluator providing prompts, validation and fallbacks
+            max_rpm: Requests per minute to stay under
+            max_tpm: Tokens per minute to stay under
+            max_attempts: Attempts per item before falling back to rule-based scoring
+            base_delay: Initial backoff after a rate limit error (seconds)
+        """
+        self.evaluator = evaluator
+        self.max_rpm = max_rpm
+        self.max_tpm = max_tpm
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        
+        self.available_request_capacity = max_rpm
+        self.available_token_capacity = max_tpm
+        self.last_update_time = time.monotonic()
+        self._paused_until = 0.0
+
+    def evaluate_all_sync(self, items: List[Tuple[str, str, str]]) -> List[Dict[str, Any]]:
+        """Run evaluate_all from synchronous code"""
+        return asyncio.run(self.evaluate_all(items))
+
+    async def evaluate_all(self, items: List[Tuple[str, str, str]]) -> List[Dict[str, Any]]:
+        """
+        Evaluate (slug, title, content) items
+        
+        Returns:
+            List of evaluate_slug-style results in input order
+        """
+        
+        results = [None] * len(items)
+        async for index, result in self.evaluate_stream(items):
+            results[index] = result
+        return results
+
+    async def evaluate_stream(self, items: List[Tuple[str, str, str]]) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Evaluate items, yielding (index, result) pairs in completion order
+        """
+        
+        completed = asyncio.Queue()
+        dispatcher = asyncio.create_task(self._dispatch(items, completed))
+        try:
+            for _ in range(len(items)):
+                getter = asyncio.ensure_future(completed.get())
+                await asyncio.wait({getter, dispatcher}, return_when=asyncio.FIRST_COMPLETED)
+                if not getter.done():
+                    # The dispatcher stopped early; surface its exception
+                    getter.cancel()
+                    dispatcher.result()
+                yield getter.result()
+        finally:
+            dispatcher.cancel()
+            await asyncio.gather(dispatcher, return_exceptions=True)
+
+    async def _dispatch(self, items: List[Tuple[str, str, str]], completed: asyncio.Queue) -> None:
+        """Feed items to the API as capacity allows, putting final results on completed"""
+        
+        evaluator = self.evaluator
+        pending = asyncio.Queue()
+        for index in range(len(items)):
+            pending.put_nowait((index, 0))
+        remaining = len(items)
+        tasks = set()
+        
+        def finish(index: int, result: Dict[str, Any]) -> None:
+            nonlocal remaining
+            remaining -= 1
+            completed.put_nowait((index, result))
+            if not remaining:
+                # Wake the dispatcher waiting on pending so it can return
+                pending.put_nowait(None)
+        
+        async def run(client: AsyncOpenAI, index: int, attempt: int, request: Dict[str, Any]) -> None:
+            slug, title, content = items[index]
+            try:
+                response = await client.chat.completions.create(**request)
+                result = evaluator.parse_evaluation_response(
+                    response.choices[0].message.content, request, slug, title, content
+                )
+            except RateLimitError as e:
+                if attempt + 1 < self.max_attempts:
+                    delay = self.base_delay * 2 ** attempt
+                    self._paused_until = max(self._paused_until, time.monotonic() + delay)
+                    await asyncio.sleep(delay)
+                    pending.put_nowait((index, attempt + 1))
+                    return
+                result = evaluator.fallback_evaluation(slug, title, content, str(e))
+            except Exception as e:
+                result = evaluator.fallback_evaluation(slug, title, content, str(e))
+            finish(index, result)
+        
+        async with AsyncOpenAI(api_key=evaluator.api_key, http_client=new_async_http_client()) as client:
+            while remaining:
+                item = await pending.get()
+                if item is None:
+                    break
+                index, attempt = item
+                slug, title, content = items[index]
+                request = evaluator.build_evaluation_request(slug, title, content)
+                
+                cached = evaluator.cached_evaluation(request, slug, title, content)
+                if cached is not None:
+                    # Cache hits cost no quota
+                    finish(index, cached)
+                    continue
+                
+                # Never reserve more than a full minute's tokens, or the item could never be sent
+                await self._reserve_capacity(min(self._estimate_tokens(request), self.max_tpm))
+                task = asyncio.create_task(run(client, index, attempt, request))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+
+    async def _reserve_capacity(self, tokens: float) -> None:
+        """Sleep until no backoff pause is active and capacity covers one request of tokens, then take it"""
+        
+        while True:
+            self._replenish()
+            # Seconds until the pause ends and each bucket has refilled enough
+            wait = max(
+                self._paused_until - self.last_update_time,
+                (1 - self.available_request_capacity) * 60.0 / self.max_rpm,
+                (tokens - self.available_token_capacity) * 60.0 / self.max_tpm
+            )
+            if wait <= 0:
+                self.available_request_capacity -= 1
+                self.available_token_capacity -= tokens
+                return
+            # Re-checked after waking, since a rate limit error may extend the pause
+            await asyncio.sleep(wait)
+
+    def _replenish(self) -> None:
+        """Refill request and token capacity for the time since the last update"""
+        
+        now = time.monotonic()
+        elapsed = now - self.last_update_time
+        self.available_request_capacity = min(
+            self.available_request_capacity + elapsed * self.max_rpm / 60.0, self.max_rpm
+        )
+        self.available_token_capacity = min(
+            self.available_token_capacity + elapsed * self.max_tpm / 60.0, self.max_tpm
+        )
+        self.last_update_time = now
+
+    def _estimate_tokens(self, request: Dict[str, Any]) -> int:
+        """Estimated prompt plus completion tokens for one request"""
+        return estimate_prompt_tokens(request) + COMPLETION_TOKEN_ESTIMATE
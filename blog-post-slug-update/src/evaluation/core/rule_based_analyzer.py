@@ -6,7 +6,90 @@ NO qualitative feedback - only structured data and numerical scores.
 """
 
 import re
-from typing import Dict, List, Any, Optional
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Iterable, List, Any, NamedTuple, Optional, Pattern, Set, Tuple
+
+
+# Translation tables deleting allowed slug characters and ASCII digits
+_DELETE_SLUG_CHARS = str.maketrans('', '', 'abcdefghijklmnopqrstuvwxyz0123456789-')
+_DELETE_ASCII_DIGITS = str.maketrans('', '', '0123456789')
+
+# Well-formed slugs: lowercase alphanumeric words joined by single hyphens,
+# starting with a letter. Such a slug can have no special characters, no
+# edge or doubled hyphens and is lowercase, so only digits need checking
+_WELL_FORMED_SLUG = re.compile(r'[a-z][a-z0-9]*(?:-[a-z0-9]+)*')
+
+# Number of checks scored by _analyze_seo_compliance
+_COMPLIANCE_CHECK_COUNT = 8
+
+# (slug, title) pairs whose metrics each analyzer keeps memoized
+ANALYSIS_CACHE_SIZE = 4096
+
+
+class _SlugFlags(NamedTuple):
+    """Character-level facts about a slug shared by several rule groups"""
+    has_numbers: bool
+    has_special_chars: bool
+    lowercase_only: bool
+    hyphen_at_edge: bool
+    consecutive_hyphens: bool
+
+
+def _slug_flags(slug: str) -> _SlugFlags:
+    """
+    Classify a slug's characters once for every rule group that needs them.
+    
+    Special characters are whatever survives deleting [a-z0-9-]. Digits are
+    any Unicode decimal digit, as regex \\d matches: ASCII digits are detected
+    by a length change after deleting them, others can only be among the
+    special characters.
+    """
+    if _WELL_FORMED_SLUG.fullmatch(slug):
+        return _SlugFlags(len(slug.translate(_DELETE_ASCII_DIGITS)) != len(slug), False, True, False, False)
+    
+    special = slug.translate(_DELETE_SLUG_CHARS)
+    has_numbers = len(slug.translate(_DELETE_ASCII_DIGITS)) != len(slug) or any(
+        ch.isdecimal() for ch in special
+    )
+    return _SlugFlags(
+        has_numbers,
+        bool(special),
+        slug.islower(),
+        slug.startswith('-') or slug.endswith('-'),
+        '--' in slug
+    )
+
+
+@lru_cache(maxsize=1)
+def _timestamp_for_second(second: int) -> str:
+    """ISO timestamp of the first request within a given wall-clock second"""
+    return datetime.now().isoformat()
+
+
+def _compile_term_scanner(terms: Iterable[str]) -> Tuple[Pattern, List[Tuple[str, ...]]]:
+    """
+    Build a single-pass scanner for literal substring terms.
+    
+    Every term is a group inside one lookahead alternation, so finditer
+    visits each position once and reports occurrences even when terms
+    overlap. Longer terms are tried first; the shorter terms they start
+    with are implied by the match, so nothing is lost at a shared start.
+    """
+    ordered = sorted(set(terms), key=len, reverse=True)
+    pattern = re.compile('(?=' + '|'.join(f'({re.escape(term)})' for term in ordered) + ')')
+    implied = [tuple(other for other in ordered if term.startswith(other)) for term in ordered]
+    return pattern, implied
+
+
+def _scan_terms(scanner: Tuple[Pattern, List[Tuple[str, ...]]], text: str) -> Set[str]:
+    """Return the set of scanner terms that occur in text"""
+    pattern, implied = scanner
+    found = set()
+    for match in pattern.finditer(text):
+        found.update(implied[match.lastindex - 1])
+    return found
 
 
 class RuleBasedAnalyzer:
@@ -31,6 +114,14 @@ class RuleBasedAnalyzer:
             r'verish'
         ]
         
+        # All brand patterns in one regex. Each pattern is its own group inside a
+        # lookahead, so a single pass finds every (even overlapping) occurrence
+        # and lastindex identifies which pattern matched
+        self._brand_re = re.compile(
+            '(?=' + '|'.join(f'({pattern})' for pattern in self.brand_patterns) + ')',
+            re.IGNORECASE
+        )
+        
         # Cultural term mappings for preservation detection
         self.cultural_terms = {
             '一番賞': 'ichiban-kuji',
@@ -48,6 +139,22 @@ class RuleBasedAnalyzer:
             'merchandise', 'products', 'items', 'goods', 'stuff',
             'things', 'collection', 'selection'
         ]
+        
+        # (original, english, lowercased english) triples in mapping order
+        self._cultural_items = tuple(
+            (original_term, english_term, english_term.lower())
+            for original_term, english_term in self.cultural_terms.items()
+        )
+        
+        # One scan of the title finds every original cultural term; one scan of
+        # the lowercased slug finds every English mapping and generic term
+        self._title_term_scanner = _compile_term_scanner(self.cultural_terms.keys())
+        self._slug_term_scanner = _compile_term_scanner(
+            [english_lc for _, _, english_lc in self._cultural_items] + self.generic_terms
+        )
+        
+        # The rules depend only on slug and title, so repeat pairs reuse their metrics
+        self._cached_metrics = lru_cache(maxsize=ANALYSIS_CACHE_SIZE)(self._compute_metrics)
 
     def analyze_slug(self, slug: str, title: str, content: str) -> Dict[str, Any]:
         """
@@ -62,20 +169,74 @@ class RuleBasedAnalyzer:
             Dict with quantitative metrics only - NO qualitative feedback
         """
         
+        return self._analyze(slug, title, self._get_timestamp())
+
+    def analyze_slugs(
+        self,
+        slugs: List[str],
+        titles: List[str],
+        contents: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Quantitative analysis for a batch of slugs
+        
+        Args:
+            slugs: Slugs to analyze
+            titles: Original titles, aligned with slugs
+            contents: Original contents, aligned with slugs (unused by the rules)
+            
+        Returns:
+            List of analyze_slug results in input order, sharing one analysis timestamp
+        """
+        
+        timestamp = self._get_timestamp()
+        analyze = self._analyze
+        return [analyze(slug, title, timestamp) for slug, title in zip(slugs, titles)]
+
+    def _analyze(self, slug: str, title: str, timestamp: str) -> Dict[str, Any]:
+        """Shared body of analyze_slug and analyze_slugs"""
+        
+        overall_score, metrics, word_count = self._cached_metrics(slug, title)
+        technical_metrics, brand_metrics, cultural_metrics, structure_metrics, compliance_metrics = metrics
+        
+        # Fresh top-level dicts per call so callers can't alter cached metrics by assignment
+        return {
+            'analysis_type': 'quantitative_only',
+            'overall_score': overall_score,
+            'technical_seo': dict(technical_metrics),
+            'brand_hierarchy': dict(brand_metrics),
+            'cultural_preservation': dict(cultural_metrics),
+            'structure_analysis': dict(structure_metrics),
+            'seo_compliance': dict(compliance_metrics),
+            'metadata': {
+                'analyzer_version': '1.0',
+                'slug_length': len(slug),
+                'word_count': word_count,
+                'analysis_timestamp': timestamp
+            }
+        }
+
+    def _compute_metrics(self, slug: str, title: str) -> Tuple[float, Tuple[Dict[str, Any], ...], int]:
+        """Run every rule for one (slug, title) pair; memoized per analyzer as _cached_metrics"""
+        
+        # Split and classify characters once; several metrics share the results
+        words = slug.split('-')
+        flags = _slug_flags(slug)
+        
         # Technical SEO metrics
-        technical_metrics = self._analyze_technical_seo(slug)
+        technical_metrics = self._analyze_technical_seo(slug, words, flags)
         
         # Brand detection metrics
         brand_metrics = self._analyze_brand_hierarchy(slug, title)
         
         # Cultural preservation metrics
-        cultural_metrics = self._analyze_cultural_preservation(slug, title)
+        cultural_metrics = self._analyze_cultural_preservation(slug, title, slug.lower())
         
         # Length and structure metrics
-        structure_metrics = self._analyze_structure(slug)
+        structure_metrics = self._analyze_structure(slug, words)
         
         # SEO compliance metrics
-        compliance_metrics = self._analyze_seo_compliance(slug)
+        compliance_metrics = self._analyze_seo_compliance(slug, flags)
         
         # Overall quantitative score
         overall_score = self._calculate_overall_score([
@@ -86,26 +247,18 @@ class RuleBasedAnalyzer:
             compliance_metrics['score']
         ])
         
-        return {
-            'analysis_type': 'quantitative_only',
-            'overall_score': overall_score,
-            'technical_seo': technical_metrics,
-            'brand_hierarchy': brand_metrics,
-            'cultural_preservation': cultural_metrics,
-            'structure_analysis': structure_metrics,
-            'seo_compliance': compliance_metrics,
-            'metadata': {
-                'analyzer_version': '1.0',
-                'slug_length': len(slug),
-                'word_count': len(slug.split('-')),
-                'analysis_timestamp': self._get_timestamp()
-            }
-        }
+        metrics = (technical_metrics, brand_metrics, cultural_metrics, structure_metrics, compliance_metrics)
+        return overall_score, metrics, len(words)
 
-    def _analyze_technical_seo(self, slug: str) -> Dict[str, Any]:
+    def _analyze_technical_seo(
+        self,
+        slug: str,
+        words: Optional[List[str]] = None,
+        flags: Optional[_SlugFlags] = None
+    ) -> Dict[str, Any]:
         """Analyze technical SEO factors with quantitative scoring"""
         
-        word_count = len(slug.split('-'))
+        word_count = len(words if words is not None else slug.split('-'))
         char_count = len(slug)
         
         # Optimal scoring around 4-6 words, 30-60 characters
@@ -113,9 +266,11 @@ class RuleBasedAnalyzer:
         char_score = max(0.0, 1.0 - max(0, char_count - 50) * 0.02)
         
         # Structure quality
-        has_numbers = bool(re.search(r'\d', slug))
-        has_special_chars = bool(re.search(r'[^a-z0-9\-]', slug))
-        proper_format = slug.islower() and not slug.startswith('-') and not slug.endswith('-')
+        if flags is None:
+            flags = _slug_flags(slug)
+        has_numbers = flags.has_numbers
+        has_special_chars = flags.has_special_chars
+        proper_format = flags.lowercase_only and not flags.hyphen_at_edge
         
         structure_score = 1.0
         if has_numbers:
@@ -144,12 +299,14 @@ class RuleBasedAnalyzer:
     def _analyze_brand_hierarchy(self, slug: str, title: str) -> Dict[str, Any]:
         """Analyze brand detection and positioning"""
         
-        # Count detected brands in slug
-        detected_brands = []
-        for pattern in self.brand_patterns:
-            if re.search(pattern, slug, re.IGNORECASE):
-                detected_brands.append(pattern)
+        # First occurrence of each brand pattern, found in one scan of the slug
+        first_positions = {}
+        for match in self._brand_re.finditer(slug):
+            first_positions.setdefault(match.lastindex - 1, match.start())
         
+        # Keep brand_patterns order for detected brands and their positions
+        pattern_indices = sorted(first_positions)
+        detected_brands = [self.brand_patterns[i] for i in pattern_indices]
         brands_count = len(detected_brands)
         
         # Score based on brand detection
@@ -162,13 +319,8 @@ class RuleBasedAnalyzer:
         else:
             score = 0.3   # No brands detected
         
-        # Brand positioning analysis
-        brand_positions = []
-        for brand in detected_brands:
-            match = re.search(brand, slug, re.IGNORECASE)
-            if match:
-                position = match.start() / len(slug)  # Relative position (0-1)
-                brand_positions.append(position)
+        # Brand positioning analysis - relative position (0-1) of each brand's first match
+        brand_positions = [first_positions[i] / len(slug) for i in pattern_indices]
         
         avg_brand_position = sum(brand_positions) / len(brand_positions) if brand_positions else 0
         
@@ -181,20 +333,20 @@ class RuleBasedAnalyzer:
             'multi_brand_handling': brands_count >= 2
         }
 
-    def _analyze_cultural_preservation(self, slug: str, title: str) -> Dict[str, Any]:
-        """Analyze cultural term preservation quantitatively"""
+    def _analyze_cultural_preservation(self, slug: str, title: str, slug_lc: Optional[str] = None) -> Dict[str, Any]:
+        """Analyze cultural term preservation quantitatively (slug_lc: precomputed slug.lower())"""
         
-        # Find cultural terms in original title
-        original_cultural_terms = []
-        for original_term, english_term in self.cultural_terms.items():
-            if original_term in title:
-                original_cultural_terms.append((original_term, english_term))
+        title_terms = _scan_terms(self._title_term_scanner, title)
+        slug_terms = _scan_terms(self._slug_term_scanner, slug_lc if slug_lc is not None else slug.lower())
         
-        # Find preserved terms in slug
+        # Find cultural terms in original title, and which of them the slug preserves
+        original_cultural_terms = []
         preserved_terms = []
-        for original_term, english_term in original_cultural_terms:
-            if english_term.lower() in slug.lower():
-                preserved_terms.append(english_term)
+        for original_term, english_term, english_lc in self._cultural_items:
+            if original_term in title_terms:
+                original_cultural_terms.append(original_term)
+                if english_lc in slug_terms:
+                    preserved_terms.append(english_term)
         
         # Calculate preservation rate
         if original_cultural_terms:
@@ -203,7 +355,7 @@ class RuleBasedAnalyzer:
             preservation_rate = 1.0  # No cultural terms to preserve
         
         # Check for generic dilution
-        generic_dilution = any(term in slug.lower() for term in self.generic_terms)
+        generic_dilution = any(term in slug_terms for term in self.generic_terms)
         
         # Calculate cultural authenticity score
         base_score = preservation_rate
@@ -213,16 +365,17 @@ class RuleBasedAnalyzer:
         return {
             'score': base_score,
             'preservation_rate': preservation_rate,
-            'original_cultural_terms': [term[0] for term in original_cultural_terms],
+            'original_cultural_terms': original_cultural_terms,
             'preserved_terms': preserved_terms,
             'generic_dilution': generic_dilution,
             'cultural_terms_count': len(original_cultural_terms)
         }
 
-    def _analyze_structure(self, slug: str) -> Dict[str, Any]:
+    def _analyze_structure(self, slug: str, words: Optional[List[str]] = None) -> Dict[str, Any]:
         """Analyze slug structure and readability"""
         
-        words = slug.split('-')
+        if words is None:
+            words = slug.split('-')
         word_count = len(words)
         
         # Word length distribution
@@ -254,29 +407,49 @@ class RuleBasedAnalyzer:
             'readability_score': readability_score
         }
 
-    def _analyze_seo_compliance(self, slug: str) -> Dict[str, Any]:
+    def _analyze_seo_compliance(self, slug: str, flags: Optional[_SlugFlags] = None) -> Dict[str, Any]:
         """Analyze SEO best practices compliance"""
         
-        compliance_checks = {
-            'uses_hyphens': '-' in slug and '_' not in slug,
-            'lowercase_only': slug.islower(),
-            'no_special_chars': not bool(re.search(r'[^a-z0-9\-]', slug)),
-            'reasonable_length': 10 <= len(slug) <= 60,
-            'starts_with_letter': slug and slug[0].isalpha(),
-            'ends_with_alphanumeric': slug and slug[-1].isalnum(),
-            'no_consecutive_hyphens': '--' not in slug,
-            'no_leading_trailing_hyphens': not slug.startswith('-') and not slug.endswith('-')
-        }
-        
-        # Calculate compliance score
-        passed_checks = sum(1 for passed in compliance_checks.values() if passed)
-        compliance_score = passed_checks / len(compliance_checks)
+        if flags is None:
+            flags = _slug_flags(slug)
+        has_special_chars = flags.has_special_chars
+        
+        uses_hyphens = '-' in slug and '_' not in slug
+        lowercase_only = flags.lowercase_only
+        reasonable_length = 10 <= len(slug) <= 60
+        starts_with_letter = slug and slug[0].isalpha()
+        ends_with_alphanumeric = slug and slug[-1].isalnum()
+        no_consecutive_hyphens = not flags.consecutive_hyphens
+        no_leading_trailing_hyphens = not flags.hyphen_at_edge
+        
+        # One bit per passed check; the popcount is the number of passed checks
+        passed_flags = (
+            bool(uses_hyphens)
+            | bool(lowercase_only) << 1
+            | (not has_special_chars) << 2
+            | bool(reasonable_length) << 3
+            | bool(starts_with_letter) << 4
+            | bool(ends_with_alphanumeric) << 5
+            | bool(no_consecutive_hyphens) << 6
+            | bool(no_leading_trailing_hyphens) << 7
+        )
+        passed_checks = passed_flags.bit_count()
+        compliance_score = passed_checks / _COMPLIANCE_CHECK_COUNT
         
         return {
             'score': compliance_score,
-            'compliance_checks': compliance_checks,
+            'compliance_checks': {
+                'uses_hyphens': uses_hyphens,
+                'lowercase_only': lowercase_only,
+                'no_special_chars': not has_special_chars,
+                'reasonable_length': reasonable_length,
+                'starts_with_letter': starts_with_letter,
+                'ends_with_alphanumeric': ends_with_alphanumeric,
+                'no_consecutive_hyphens': no_consecutive_hyphens,
+                'no_leading_trailing_hyphens': no_leading_trailing_hyphens
+            },
             'passed_checks': passed_checks,
-            'total_checks': len(compliance_checks),
+            'total_checks': _COMPLIANCE_CHECK_COUNT,
             'compliance_percentage': compliance_score * 100
         }
 
@@ -287,9 +460,8 @@ class RuleBasedAnalyzer:
         return sum(scores) / len(scores) if scores else 0.0
 
     def _get_timestamp(self) -> str:
-        """Get current timestamp for metadata"""
-        from datetime import datetime
-        return datetime.now().isoformat()
+        """Get current timestamp for metadata, shared by analyses within the same second"""
+        return _timestamp_for_second(int(time.time()))
 
     def get_analysis_summary(self, analysis_result: Dict) -> str:
         """
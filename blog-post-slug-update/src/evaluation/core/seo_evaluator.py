@@ -5,15 +5,19 @@ Provides comprehensive evaluation of slug quality across multiple
 SEO dimensions with qualitative feedback generation.
 """
 
+import asyncio
+import io
 import json
 import time
 import re
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 import sys
+from functools import lru_cache
+from operator import itemgetter
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 # Add src to path for imports
 src_path = Path(__file__).parent.parent.parent
@@ -22,25 +26,159 @@ if str(src_path) not in sys.path:
 
 from config.evaluation_prompt_manager import EvaluationPromptManager
 from config.constants import DEFAULT_SCORING_DIMENSIONS, DEFAULT_EVALUATION_PROMPT_VERSION, DEFAULT_MODEL
+from ..utils.response_cache import ResponseCache
+from ..utils.retry_logic import RetryConfig
+from ..utils.exceptions import APIRateLimitError, TemporaryAPIError, classify_api_error
+from ..utils.json_utils import loads
+from ..utils.openai_client import BATCH_TERMINAL_STATES, shared_http_client
+from ..utils.tokens import get_encoding
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# System prompt shared by every evaluation request
+EVALUATION_SYSTEM_PROMPT = "You are an expert SEO analyst specializing in cross-border e-commerce and Asian market awareness. Provide detailed multi-dimensional slug evaluation."
+
+# Default number of evaluations in flight for evaluate_batch
+DEFAULT_BATCH_CONCURRENCY = 10
+
+# Single-dimension and summary prompts for evaluate_slug_parallel_dims
+DIMENSION_PROMPT_TEMPLATE = """
+Evaluate one dimension of this SEO slug:
+
+SLUG: "{slug}"
+ORIGINAL TITLE: "{title}"
+CONTENT PREVIEW: "{content}"
+
+DIMENSION: {dimension}
+
+Rate only this dimension from 0.0-1.0 and briefly explain the rating.
+
+Return JSON format:
+{{
+    "score": 0.0-1.0,
+    "rationale": "one or two sentences"
+}}
+"""
+
+SUMMARY_PROMPT_TEMPLATE = """
+Assess this SEO slug overall:
+
+SLUG: "{slug}"
+ORIGINAL TITLE: "{title}"
+CONTENT PREVIEW: "{content}"
+
+Provide detailed qualitative feedback explaining strengths, weaknesses, and specific improvements.
+
+Return JSON format:
+{{
+    "qualitative_feedback": "detailed analysis...",
+    "confidence": 0.0-1.0
+}}
+"""
+
+# Several slugs per request for evaluate_slugs_marshaled
+MARSHALED_PROMPT_TEMPLATE = """
+Evaluate each of these SEO slugs across multiple dimensions:
+
+{rows}
+
+Rate each of these dimensions from 0.0-1.0 for every slug: {dimensions}
+
+Give each slug its own overall score, short qualitative feedback and confidence.
+
+Return JSON format with one entry per slug, echoing its id:
+{{
+    "results": [
+        {{
+            "id": 0,
+            "dimension_scores": {{"<dimension>": 0.0-1.0, ...}},
+            "overall_score": 0.0-1.0,
+            "qualitative_feedback": "analysis...",
+            "confidence": 0.0-1.0
+        }}
+    ]
+}}
+"""
+
+# Slugs per marshaled request; latency grows with rows and gains flatten past ~10
+DEFAULT_ROWS_PER_CALL = 10
+
+# Characters of content shown per row in marshaled prompts
+MARSHALED_CONTENT_CHARS = 300
+MARSHALED_CONTENT_TOKENS = 90
+
+# Characters of content shown in evaluation prompts
+CONTENT_PREVIEW_CHARS = 500
+
+# Tokens of content shown in evaluation prompts when tiktoken is installed;
+# CJK text costs several times more tokens per character than Latin text
+CONTENT_PREVIEW_TOKENS = 150
+
+# Generic terms that dilute cultural authenticity in fallback scoring
+_FALLBACK_GENERIC_TERMS = ('merchandise', 'products', 'items', 'goods', 'stuff')
+_FALLBACK_GENERIC_RE = re.compile('|'.join(_FALLBACK_GENERIC_TERMS))
+
+# CJK Unified Ideographs block
+_CJK_UNIFIED_RE = re.compile('[\u4e00-\u9fff]')
+
+# Title patterns for _analyze_complexity_factors
+_CJK_RE = re.compile(r'[一-龯]')
+_LATIN_RE = re.compile(r'[a-zA-Z]')
+_SPECIAL_PUNCT_RE = re.compile(r'[！？、。]')
+
+# The flat dimension_scores object of a (possibly partial) evaluation response
+_DIMENSION_SCORES_RE = re.compile(r'"dimension_scores"\s*:\s*(\{[^{}]*\})')
+
+
+def _streamed_scores(text: str) -> Optional[Dict[str, Any]]:
+    """dimension_scores from a partial evaluation response, once that object is complete"""
+    match = _DIMENSION_SCORES_RE.search(text)
+    if match is None:
+        return None
+    try:
+        return loads(match.group(1))
+    except ValueError:
+        return None
+
 
 class SEOEvaluator:
     """Multi-dimensional SEO assessment system using LLM evaluation"""
     
+    # Fixed attribute set: no per-instance __dict__ for evaluators created per
+    # prompt version in sweeps. Subclasses adding state declare their own slots.
+    __slots__ = (
+        'client', 'model', 'api_key', 'evaluation_prompt_version', 'cache', 'retry_config',
+        'prompt_manager', 'prompt_metadata', 'scoring_dimensions',
+        'cultural_terms', 'brand_patterns',
+        '_brand_re', '_cultural_values_lower', '_cjk_cultural_keys', '_cjk_title_re',
+        '_load_prompt_template', '_pending_batches',
+        '_failure_dim_scores_template', '_neutral_dim_scores_template',
+        '_context_configured', '_current_evaluation_style', '_current_focus_areas',
+        '_current_quality_thresholds'
+    )
+    
     def __init__(
         self, 
         api_key: str, 
         model: str = DEFAULT_MODEL, 
-        evaluation_prompt_version: str = DEFAULT_EVALUATION_PROMPT_VERSION
+        evaluation_prompt_version: str = DEFAULT_EVALUATION_PROMPT_VERSION,
+        cache_dir: Optional[str] = None,
+        retry_config: Optional[RetryConfig] = None
     ):
-        """Initialize SEO evaluator with OpenAI client and configurable evaluation prompts"""
-        self.client = OpenAI(api_key=api_key)
+        """
+        Initialize SEO evaluator with OpenAI client and configurable evaluation prompts
+        
+        cache_dir enables a persistent response cache there, keyed on the full
+        request (model, prompt version text, slug, title, content preview).
+        retry_config applies to the per-dimension calls of evaluate_slug_parallel_dims.
+        """
+        self.client = OpenAI(api_key=api_key, http_client=shared_http_client())
         self.model = model
         self.api_key = api_key
         self.evaluation_prompt_version = evaluation_prompt_version
+        self.cache = ResponseCache(cache_dir) if cache_dir else None
+        self.retry_config = retry_config or RetryConfig()
         
         # Initialize evaluation prompt manager
         self.prompt_manager = EvaluationPromptManager()
@@ -72,6 +210,24 @@ class SEOEvaluator:
             r'gap'
         ]
         
+        # All brand patterns in one case-insensitive regex; each pattern is a group
+        # inside a lookahead, so one scan reports every pattern that occurs
+        self._brand_re = re.compile(
+            '(?=' + '|'.join(f'({pattern})' for pattern in self.brand_patterns) + ')',
+            re.IGNORECASE
+        )
+        self._cultural_values_lower = [term.lower() for term in self.cultural_terms.values()]
+        # Cultural terms written with CJK ideographs, the ones fallback scoring looks for in titles
+        self._cjk_cultural_keys = tuple(key for key in self.cultural_terms if _CJK_UNIFIED_RE.search(key))
+        # Any of them, so titles without one are rejected in a single scan
+        self._cjk_title_re = re.compile('|'.join(map(re.escape, self._cjk_cultural_keys)))
+        
+        # Prompt templates by version; failed loads aren't cached and fall back per call
+        self._load_prompt_template = lru_cache(maxsize=4)(self.prompt_manager.load_prompt_template)
+        
+        # Items of submitted Batch API jobs by batch id, until polled to completion
+        self._pending_batches = {}
+        
         # Initialize context configuration for enhanced API
         self._initialize_context_configuration()
 
@@ -156,6 +312,10 @@ class SEOEvaluator:
             logger.warning(f"Failed to load prompt configuration for {self.evaluation_prompt_version}: {e}")
             self.scoring_dimensions = DEFAULT_SCORING_DIMENSIONS
             self.prompt_metadata = self.prompt_manager.get_default_metadata(self.evaluation_prompt_version)
+        
+        # Score skeletons copied per result instead of rebuilt from the dimensions
+        self._failure_dim_scores_template = {dim: 0.1 for dim in self.scoring_dimensions}
+        self._neutral_dim_scores_template = {dim: 0.5 for dim in self.scoring_dimensions}
 
     def evaluate_slug(self, slug: str, title: str, content: str) -> Dict[str, Any]:
         """
@@ -170,35 +330,555 @@ class SEOEvaluator:
             Dict with overall_score, dimension_scores, qualitative_feedback, confidence
         """
         
-        # Create evaluation prompt
-        prompt = self._create_evaluation_prompt(slug, title, content)
+        request = self._evaluation_request(slug, title, content)
+        key = self._cache_key(request)
         
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert SEO analyst specializing in cross-border e-commerce and Asian market awareness. Provide detailed multi-dimensional slug evaluation."
-                    },
-                    {
-                        "role": "user", 
-                        "content": prompt
-                    }
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.3
-            )
+            raw = self._cached_content(key)
+            cached = raw is not None
+            if not cached:
+                response = self.client.chat.completions.create(**request)
+                raw = response.choices[0].message.content
             
-            result = json.loads(response.choices[0].message.content)
+            result = loads(raw)
             
             # Validate and structure response
-            return self._validate_evaluation_result(result, slug, title, content)
+            evaluation = self._validate_evaluation_result(result, slug, title, content)
+            if key is not None and not cached:
+                self.cache.set(key, raw)
+            return evaluation
             
         except Exception as e:
             # Fallback evaluation for failed API calls
             return self._create_fallback_evaluation(slug, title, content, str(e))
 
+    async def evaluate_slug_async(
+        self,
+        slug: str,
+        title: str,
+        content: str,
+        client: Optional[AsyncOpenAI] = None
+    ) -> Dict[str, Any]:
+        """
+        Async version of evaluate_slug
+        
+        Args:
+            slug: The slug to evaluate
+            title: Original title
+            content: Original content
+            client: AsyncOpenAI client to send the request with (a temporary one if None)
+            
+        Returns:
+            Dict with overall_score, dimension_scores, qualitative_feedback, confidence
+        """
+        
+        if client is None:
+            async with AsyncOpenAI(api_key=self.api_key) as client:
+                return await self.evaluate_slug_async(slug, title, content, client)
+        
+        request = self._evaluation_request(slug, title, content)
+        key = self._cache_key(request)
+        
+        try:
+            raw = self._cached_content(key)
+            cached = raw is not None
+            if not cached:
+                response = await client.chat.completions.create(**request)
+                raw = response.choices[0].message.content
+            
+            result = loads(raw)
+            
+            evaluation = self._validate_evaluation_result(result, slug, title, content)
+            if key is not None and not cached:
+                self.cache.set(key, raw)
+            return evaluation
+            
+        except Exception as e:
+            return self._create_fallback_evaluation(slug, title, content, str(e))
+
+    def evaluate_slug_stream(self, slug: str, title: str, content: str, scores_only: bool = False) -> Dict[str, Any]:
+        """
+        Evaluate a slug over a streamed response
+        
+        With scores_only, the stream is closed as soon as dimension_scores is
+        complete, so callers that only rank or filter by score don't wait for
+        the qualitative feedback to be generated. Overall score, feedback and
+        confidence are then filled in locally, and the partial response is
+        not cached.
+        
+        Args:
+            slug: The slug to evaluate
+            title: Original title
+            content: Original content
+            scores_only: Stop reading once the dimension scores are known
+            
+        Returns:
+            Dict with overall_score, dimension_scores, qualitative_feedback, confidence
+        """
+        
+        request = self._evaluation_request(slug, title, content)
+        
+        try:
+            cached = self.cached_evaluation(request, slug, title, content)
+            if cached is not None:
+                return cached
+            
+            stream = self.client.chat.completions.create(**request, stream=True)
+            parts = []
+            try:
+                for chunk in stream:
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if not delta:
+                        continue
+                    parts.append(delta)
+                    if scores_only and '}' in delta:
+                        scores = _streamed_scores(''.join(parts))
+                        if scores is not None:
+                            return self._validate_evaluation_result({'dimension_scores': scores}, slug, title, content)
+            finally:
+                stream.close()
+            
+            return self.parse_evaluation_response(''.join(parts), request, slug, title, content)
+            
+        except Exception as e:
+            return self._create_fallback_evaluation(slug, title, content, str(e))
+
+    async def aevaluate_slug_stream(
+        self,
+        slug: str,
+        title: str,
+        content: str,
+        scores_only: bool = False,
+        client: Optional[AsyncOpenAI] = None
+    ) -> Dict[str, Any]:
+        """
+        Async version of evaluate_slug_stream
+        
+        Args:
+            slug: The slug to evaluate
+            title: Original title
+            content: Original content
+            scores_only: Stop reading once the dimension scores are known
+            client: AsyncOpenAI client to send the request with (a temporary one if None)
+            
+        Returns:
+            Dict with overall_score, dimension_scores, qualitative_feedback, confidence
+        """
+        
+        if client is None:
+            async with AsyncOpenAI(api_key=self.api_key) as client:
+                return await self.aevaluate_slug_stream(slug, title, content, scores_only, client)
+        
+        request = self._evaluation_request(slug, title, content)
+        
+        try:
+            cached = self.cached_evaluation(request, slug, title, content)
+            if cached is not None:
+                return cached
+            
+            stream = await client.chat.completions.create(**request, stream=True)
+            parts = []
+            try:
+                async for chunk in stream:
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if not delta:
+                        continue
+                    parts.append(delta)
+                    if scores_only and '}' in delta:
+                        scores = _streamed_scores(''.join(parts))
+                        if scores is not None:
+                            return self._validate_evaluation_result({'dimension_scores': scores}, slug, title, content)
+            finally:
+                await stream.close()
+            
+            return self.parse_evaluation_response(''.join(parts), request, slug, title, content)
+            
+        except Exception as e:
+            return self._create_fallback_evaluation(slug, title, content, str(e))
+
+    def build_evaluation_request(self, slug: str, title: str, content: str) -> Dict[str, Any]:
+        """
+        Chat completion arguments for evaluating one slug
+        
+        For callers that send requests themselves, such as
+        AsyncRateLimitedEvaluator; pair with cached_evaluation,
+        parse_evaluation_response and fallback_evaluation.
+        """
+        return self._evaluation_request(slug, title, content)
+
+    def cached_evaluation(self, request: Dict[str, Any], slug: str, title: str, content: str) -> Optional[Dict[str, Any]]:
+        """Validated evaluation for request from the response cache, or None on a miss"""
+        
+        raw = self._cached_content(self._cache_key(request))
+        if raw is None:
+            return None
+        return self._validate_evaluation_result(loads(raw), slug, title, content)
+
+    def parse_evaluation_response(self, raw: str, request: Dict[str, Any], slug: str, title: str, content: str) -> Dict[str, Any]:
+        """
+        Validate the response content for request, caching it once it parses
+        
+        Raises:
+            ValueError: If raw is not valid JSON
+        """
+        
+        evaluation = self._validate_evaluation_result(loads(raw), slug, title, content)
+        key = self._cache_key(request)
+        if key is not None:
+            self.cache.set(key, raw)
+        return evaluation
+
+    def fallback_evaluation(self, slug: str, title: str, content: str, error: str) -> Dict[str, Any]:
+        """Rule-based evaluation for a slug whose API request failed"""
+        return self._create_fallback_evaluation(slug, title, content, error)
+
+    async def evaluate_batch(
+        self,
+        items: List[Tuple[str, str, str]],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY
+    ) -> List[Dict[str, Any]]:
+        """
+        Evaluate many slugs concurrently
+        
+        Args:
+            items: (slug, title, content) tuples
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            List of evaluate_slug results in input order
+        """
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        # One client per batch, so its connections never outlive the event loop
+        async with AsyncOpenAI(api_key=self.api_key) as client:
+            async def bounded(slug: str, title: str, content: str) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self.evaluate_slug_async(slug, title, content, client)
+            
+            return list(await asyncio.gather(*(bounded(*item) for item in items)))
+
+    def evaluate_batch_sync(
+        self,
+        items: List[Tuple[str, str, str]],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY
+    ) -> List[Dict[str, Any]]:
+        """Run evaluate_batch from synchronous code"""
+        return asyncio.run(self.evaluate_batch(items, concurrency))
+
+    async def evaluate_slug_parallel_dims(
+        self,
+        slug: str,
+        title: str,
+        content: str,
+        client: Optional[AsyncOpenAI] = None
+    ) -> Dict[str, Any]:
+        """
+        Evaluate each scoring dimension with its own concurrent LLM call
+        
+        Wall-clock time is that of the slowest call rather than one large
+        response, at a higher token cost, so this is opt-in for
+        latency-sensitive callers. Each call retries independently; a
+        dimension that still fails gets the neutral score.
+        
+        Args:
+            slug: The slug to evaluate
+            title: Original title
+            content: Original content
+            client: AsyncOpenAI client to send the requests with (a temporary one if None)
+            
+        Returns:
+            Dict in the evaluate_slug format, plus dimension_rationales
+        """
+        
+        if client is None:
+            async with AsyncOpenAI(api_key=self.api_key) as client:
+                return await self.evaluate_slug_parallel_dims(slug, title, content, client)
+        
+        fields = {'slug': slug, 'title': title, 'content': self._truncate_content(content)}
+        
+        async def ask(prompt: str) -> Dict[str, Any]:
+            request = {
+                'model': self.model,
+                'messages': [
+                    {"role": "system", "content": EVALUATION_SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt}
+                ],
+                'response_format': {"type": "json_object"},
+                'temperature': 0.3
+            }
+            response = await self.retry_config.aexecute_with_retry(
+                lambda: client.chat.completions.create(**request)
+            )
+            return loads(response.choices[0].message.content)
+        
+        dimensions = list(self.scoring_dimensions)
+        answers = await asyncio.gather(
+            *(ask(DIMENSION_PROMPT_TEMPLATE.format_map({**fields, 'dimension': dim})) for dim in dimensions),
+            ask(SUMMARY_PROMPT_TEMPLATE.format_map(fields)),
+            return_exceptions=True
+        )
+        
+        result = {'dimension_scores': {}, 'dimension_rationales': {}}
+        errors = []
+        for dim, answer in zip(dimensions, answers):
+            if isinstance(answer, BaseException):
+                errors.append(f"{dim}: {answer}")
+                continue
+            try:
+                result['dimension_scores'][dim] = float(answer['score'])
+            except (KeyError, TypeError, ValueError) as e:
+                errors.append(f"{dim}: {e}")
+                continue
+            result['dimension_rationales'][dim] = answer.get('rationale', '')
+        
+        if not result['dimension_scores']:
+            return self._create_fallback_evaluation(slug, title, content, '; '.join(errors))
+        
+        summary = answers[-1]
+        if not isinstance(summary, BaseException):
+            for key in ('qualitative_feedback', 'confidence'):
+                if key in summary:
+                    result[key] = summary[key]
+        
+        return self._validate_evaluation_result(result, slug, title, content)
+
+    def evaluate_slugs_marshaled(
+        self,
+        items: List[Tuple[str, str, str]],
+        rows_per_call: int = DEFAULT_ROWS_PER_CALL,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY
+    ) -> List[Dict[str, Any]]:
+        """
+        Evaluate many slugs with several rows packed into each request
+        
+        Amortizes per-request overhead and request-rate limits across
+        rows_per_call slugs, at the cost of a longer response per call.
+        
+        Args:
+            items: (slug, title, content) tuples
+            rows_per_call: Slugs per request
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            List of evaluate_slug-style results in input order
+        """
+        
+        return asyncio.run(self.aevaluate_slugs_marshaled(items, rows_per_call, concurrency))
+
+    async def aevaluate_slugs_marshaled(
+        self,
+        items: List[Tuple[str, str, str]],
+        rows_per_call: int = DEFAULT_ROWS_PER_CALL,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY
+    ) -> List[Dict[str, Any]]:
+        """Async version of evaluate_slugs_marshaled; chunks are requested concurrently"""
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        chunks = [items[start:start + rows_per_call] for start in range(0, len(items), rows_per_call)]
+        
+        async with AsyncOpenAI(api_key=self.api_key) as client:
+            async def evaluate_chunk(chunk: List[Tuple[str, str, str]]) -> List[Dict[str, Any]]:
+                try:
+                    async with semaphore:
+                        response = await client.chat.completions.create(**self._marshaled_request(chunk))
+                    rows = loads(response.choices[0].message.content)['results']
+                    by_id = {row['id']: row for row in rows if isinstance(row, dict) and 'id' in row}
+                    error = "No result returned for this row"
+                except Exception as e:
+                    by_id, error = {}, str(e)
+                
+                results = []
+                for i, (slug, title, content) in enumerate(chunk):
+                    row = by_id.get(i)
+                    if row is None:
+                        results.append(self._create_fallback_evaluation(slug, title, content, error))
+                        continue
+                    row = {key: value for key, value in row.items() if key != 'id'}
+                    try:
+                        results.append(self._validate_evaluation_result(row, slug, title, content))
+                    except Exception as e:
+                        results.append(self._create_fallback_evaluation(slug, title, content, str(e)))
+                return results
+            
+            chunk_results = await asyncio.gather(*(evaluate_chunk(chunk) for chunk in chunks))
+        
+        return [result for results in chunk_results for result in results]
+
+    def _marshaled_request(self, chunk: List[Tuple[str, str, str]]) -> Dict[str, Any]:
+        """Chat completion arguments evaluating every slug of a chunk, with row ids 0..n-1"""
+        
+        rows = json.dumps([
+            {'id': i, 'slug': slug, 'title': title,
+             'content': self._content_prefix(content, MARSHALED_CONTENT_CHARS, MARSHALED_CONTENT_TOKENS)}
+            for i, (slug, title, content) in enumerate(chunk)
+        ], ensure_ascii=False, indent=2)
+        prompt = MARSHALED_PROMPT_TEMPLATE.format_map({
+            'rows': rows,
+            'dimensions': ', '.join(self.scoring_dimensions)
+        })
+        
+        return {
+            'model': self.model,
+            'messages': [
+                {"role": "system", "content": EVALUATION_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            'response_format': {"type": "json_object"},
+            'temperature': 0.3
+        }
+
+    def submit_batch(self, items: List[Tuple[str, str, str]]) -> str:
+        """
+        Submit evaluations as one OpenAI Batch API job for offline processing
+        
+        Args:
+            items: (slug, title, content) tuples; item i gets custom_id "slug-{i}"
+            
+        Returns:
+            Batch id to pass to poll_batch
+        """
+        
+        lines = [
+            json.dumps({
+                "custom_id": f"slug-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._evaluation_request(slug, title, content)
+            }, ensure_ascii=False)
+            for i, (slug, title, content) in enumerate(items)
+        ]
+        batch_file = io.BytesIO('\n'.join(lines).encode('utf-8'))
+        uploaded = self.client.files.create(file=("seo-evaluation-batch.jsonl", batch_file), purpose="batch")
+        
+        batch = self.client.batches.create(
+            input_file_id=uploaded.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        self._pending_batches[batch.id] = list(items)
+        return batch.id
+
+    def poll_batch(self, batch_id: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Collect the results of a submitted batch
+        
+        Args:
+            batch_id: Id returned by submit_batch
+            
+        Returns:
+            None while the batch is still running, otherwise evaluation results
+            keyed by custom_id. Failed rows get a fallback evaluation whose
+            api_error/error_type come from classify_api_error.
+            
+        Raises:
+            ValueError: If the batch was not submitted by this evaluator
+        """
+        
+        if batch_id not in self._pending_batches:
+            raise ValueError(f"Unknown batch '{batch_id}'")
+        
+        batch = self.client.batches.retrieve(batch_id)
+        if batch.status not in BATCH_TERMINAL_STATES:
+            return None
+        
+        items = self._pending_batches.pop(batch_id)
+        errors = {}
+        results = {}
+        
+        if batch.output_file_id:
+            for record in self._read_batch_file(batch.output_file_id):
+                custom_id = record['custom_id']
+                response = record.get('response') or {}
+                if response.get('status_code') != 200:
+                    errors[custom_id] = (response.get('body') or {}).get('error') or record.get('error')
+                    continue
+                slug, title, content = items[int(custom_id.rsplit('-', 1)[1])]
+                try:
+                    result = loads(response['body']['choices'][0]['message']['content'])
+                    results[custom_id] = self._validate_evaluation_result(result, slug, title, content)
+                except Exception as e:
+                    errors[custom_id] = str(e)
+        
+        if getattr(batch, 'error_file_id', None):
+            for record in self._read_batch_file(batch.error_file_id):
+                response = record.get('response') or {}
+                errors[record['custom_id']] = record.get('error') or (response.get('body') or {}).get('error')
+        
+        # Rows without output (including every row of a failed or expired batch) fall back too
+        for i, (slug, title, content) in enumerate(items):
+            custom_id = f"slug-{i}"
+            if custom_id in results:
+                continue
+            error = errors.get(custom_id) or f"Batch {batch.status}: no output for request"
+            if isinstance(error, dict):
+                error = error.get('message') or json.dumps(error)
+            classified = classify_api_error(error)
+            fallback = self._create_fallback_evaluation(slug, title, content, str(classified))
+            fallback['error_type'] = type(classified).__name__
+            results[custom_id] = fallback
+        
+        return results
+
+    @staticmethod
+    def retryable_batch_items(
+        results: Dict[str, Dict[str, Any]],
+        items: List[Tuple[str, str, str]]
+    ) -> List[Tuple[str, str, str]]:
+        """Items whose batch rows failed with a rate limit or temporary error, for resubmission"""
+        
+        retryable = {APIRateLimitError.__name__, TemporaryAPIError.__name__}
+        return [
+            item for i, item in enumerate(items)
+            if results.get(f"slug-{i}", {}).get('error_type') in retryable
+        ]
+
+    def _cache_key(self, request: Dict[str, Any]) -> Optional[str]:
+        """Cache key for an evaluation request, or None when caching is disabled"""
+        return ResponseCache.make_key(request) if self.cache is not None else None
+
+    def _cached_content(self, key: Optional[str]) -> Optional[str]:
+        """Cached raw response content for key, or None on a miss"""
+        return self.cache.get(key) if key is not None else None
+
+    def _truncate_content(self, content: str) -> str:
+        """Content preview for evaluation prompts, marked with ... when cut"""
+        
+        preview = self._content_prefix(content, CONTENT_PREVIEW_CHARS, CONTENT_PREVIEW_TOKENS)
+        return preview if len(preview) == len(content) else preview + "..."
+
+    def _content_prefix(self, content: str, max_chars: int, max_tokens: int) -> str:
+        """Leading max_tokens tokens of content with tiktoken, otherwise its leading max_chars characters"""
+        
+        encoding = get_encoding(self.model)
+        if encoding is None:
+            return content[:max_chars]
+        
+        tokens = encoding.encode(content)
+        if len(tokens) <= max_tokens:
+            return content
+        # A cut inside a multi-byte character decodes to a replacement character
+        return encoding.decode(tokens[:max_tokens]).rstrip('\ufffd')
+
+    def _read_batch_file(self, file_id: str) -> List[Dict[str, Any]]:
+        """Parse a Batch API output or error JSONL file"""
+        
+        text = self.client.files.content(file_id).text
+        return [loads(line) for line in text.splitlines() if line.strip()]
+
+    def _evaluation_request(self, slug: str, title: str, content: str) -> Dict[str, Any]:
+        """Chat completion arguments for evaluating one slug"""
+        
+        return {
+            'model': self.model,
+            'messages': [
+                {"role": "system", "content": EVALUATION_SYSTEM_PROMPT},
+                {"role": "user", "content": self._create_evaluation_prompt(slug, title, content)}
+            ],
+            'response_format': {"type": "json_object"},
+            'temperature': 0.3
+        }
+
     def evaluate_failure_case(self, title: str, content: str, failure_reason: str) -> Dict[str, Any]:
         """
         Evaluate failure cases where no slug was generated
@@ -214,7 +894,7 @@ class SEOEvaluator:
         
         return {
             'overall_score': 0.1,
-            'dimension_scores': {dim: 0.1 for dim in self.scoring_dimensions},
+            'dimension_scores': self._failure_dim_scores_template.copy(),
             'qualitative_feedback': f'Complete failure: {failure_reason}. Unable to generate slug for "{title[:100]}..."',
             'confidence': 0.9,
             'failure_analysis': {
@@ -229,15 +909,15 @@ class SEOEvaluator:
         """Create evaluation prompt using configurable template with context modifications"""
         
         try:
-            # Load prompt template from configuration
-            prompt_template = self.prompt_manager.load_prompt_template(self.evaluation_prompt_version)
+            # Load prompt template from configuration (read once per version)
+            prompt_template = self._load_prompt_template(self.evaluation_prompt_version)
             
             # Format the template with the provided values
-            base_prompt = prompt_template.format(
-                slug=slug,
-                title=title,
-                content=content[:500] + "..." if len(content) > 500 else content
-            )
+            base_prompt = prompt_template.format_map({
+                'slug': slug,
+                'title': title,
+                'content': self._truncate_content(content)
+            })
             
             # Apply context configuration modifications
             if self._context_configured:
@@ -314,19 +994,44 @@ Return JSON format:
     def _validate_evaluation_result(self, result: Dict, slug: str, title: str, content: str) -> Dict[str, Any]:
         """Validate and enhance evaluation result"""
         
+        if self._is_complete_evaluation(result):
+            # Schema-complete response, the usual case: only the ranges need checking
+            return self._clamp_scores(result)
+        return self._complete_evaluation_result(result, slug, title, content)
+
+    def _is_complete_evaluation(self, result: Dict) -> bool:
+        """Whether result has every field and dimension _complete_evaluation_result would fill in"""
+        
+        try:
+            return (
+                'overall_score' in result
+                and 'confidence' in result
+                and len(result['qualitative_feedback']) >= 50
+                and result['dimension_scores'].keys() >= self._neutral_dim_scores_template.keys()
+            )
+        except (KeyError, TypeError, AttributeError):
+            # Missing or malformed fields; the defensive path handles or reports them
+            return False
+
+    def _complete_evaluation_result(self, result: Dict, slug: str, title: str, content: str) -> Dict[str, Any]:
+        """Fill in whatever fields and dimensions the response left out, then clamp"""
+        
         # Ensure all required fields exist
         if 'dimension_scores' not in result:
             result['dimension_scores'] = {}
         
-        # Fill missing dimensions with neutral scores
-        for dim in self.scoring_dimensions:
-            if dim not in result['dimension_scores']:
-                result['dimension_scores'][dim] = 0.5
+        # Fill missing dimensions with neutral scores, keeping the model's key order
+        dimension_scores = result['dimension_scores']
+        if not dimension_scores:
+            result['dimension_scores'] = self._neutral_dim_scores_template.copy()
+        else:
+            for dim in self.scoring_dimensions:
+                dimension_scores.setdefault(dim, 0.5)
         
         # Calculate overall score if missing
         if 'overall_score' not in result:
-            scores = list(result['dimension_scores'].values())
-            result['overall_score'] = sum(scores) / len(scores)
+            scores = result['dimension_scores']
+            result['overall_score'] = sum(scores.values()) / len(scores)
         
         # Ensure qualitative feedback exists
         if 'qualitative_feedback' not in result or len(result['qualitative_feedback']) < 50:
@@ -347,10 +1052,14 @@ Return JSON format:
         # Basic rule-based evaluation
         scores = {}
         
-        # Technical SEO (rule-based) - reward quality slugs more
-        word_count = len(slug.split('-'))
+        # Slug features shared by the checks below; counting separators
+        # gives the word count without building the split list
+        slug_lower = slug.lower()
+        word_count = slug.count('-') + 1
         char_count = len(slug)
         
+        # Technical SEO (rule-based) - reward quality slugs more
+        
         # Better scoring for V8 breakthrough case (6 words, 45 chars)
         word_score = 1.0 - abs(word_count - 5) * 0.08  # Optimal around 5 words
         char_score = 1.0 - max(0, char_count - 50) * 0.02  # Penalty after 50 chars
@@ -358,8 +1067,7 @@ Return JSON format:
         scores['technical_seo'] = min(1.0, max(0.4, (word_score + char_score) / 2))
         
         # Brand hierarchy (pattern matching) - reward multi-brand handling
-        brands_found = sum(1 for pattern in self.brand_patterns 
-                          if re.search(pattern, slug, re.IGNORECASE))
+        brands_found = len({match.lastindex for match in self._brand_re.finditer(slug)})
         
         if brands_found >= 3:  # V8 breakthrough case (skinniydip-iface-rhinoshield)
             scores['brand_hierarchy'] = 0.95
@@ -371,13 +1079,14 @@ Return JSON format:
             scores['brand_hierarchy'] = 0.3
         
         # Cultural authenticity (term matching) - distinguish between preserved vs generic
-        cultural_terms_in_slug = sum(1 for term in self.cultural_terms.values() if term.lower() in slug.lower())
-        original_cultural_terms = sum(1 for key in self.cultural_terms.keys() 
-                                    if any(char >= '\u4e00' and char <= '\u9fff' for char in key) and key in title)
+        cultural_terms_in_slug = sum(1 for term in self._cultural_values_lower if term in slug_lower)
+        original_cultural_terms = (
+            sum(1 for key in self._cjk_cultural_keys if key in title)
+            if self._cjk_title_re.search(title) else 0
+        )
         
         # Check for generic alternatives that reduce cultural authenticity
-        generic_terms = ['merchandise', 'products', 'items', 'goods', 'stuff']
-        has_generic = any(term in slug.lower() for term in generic_terms)
+        has_generic = _FALLBACK_GENERIC_RE.search(slug_lower) is not None
         
         if original_cultural_terms > 0:
             # Score based on preservation rate, penalize generic terms
@@ -391,7 +1100,7 @@ Return JSON format:
             scores['cultural_authenticity'] = min(1.0, base_score)
         else:
             # No cultural terms in original, score neutrally
-            cultural_found = any(term.lower() in slug.lower() for term in self.cultural_terms.values())
+            cultural_found = cultural_terms_in_slug > 0
             scores['cultural_authenticity'] = 0.9 if cultural_found else 0.5
         
         # Default scores for other dimensions - boost for quality slugs
@@ -442,20 +1151,35 @@ Return JSON format:
             'api_error': error
         }
 
+    def fallback_evaluate_batch(self, items: List[Tuple[str, str, str]], error: str) -> List[Dict[str, Any]]:
+        """
+        Rule-based fallback evaluations for many slugs, e.g. to backfill after an API outage
+        
+        Args:
+            items: (slug, title, content) tuples
+            error: Error recorded as api_error on every result
+            
+        Returns:
+            List of fallback evaluations in input order
+        """
+        
+        evaluate = self._create_fallback_evaluation
+        return [evaluate(slug, title, content, error) for slug, title, content in items]
+
     def _generate_basic_feedback(self, slug: str, title: str, scores: Dict) -> str:
         """Generate basic qualitative feedback"""
         
         feedback = []
         
-        # Identify best and worst dimensions
-        best_dim = max(scores.keys(), key=lambda k: scores[k])
-        worst_dim = min(scores.keys(), key=lambda k: scores[k])
+        # Identify best and worst dimensions (first in key order on ties)
+        best_dim, best_score = max(scores.items(), key=itemgetter(1))
+        worst_dim, worst_score = min(scores.items(), key=itemgetter(1))
         
-        feedback.append(f"Slug '{slug}' performs best in {best_dim.replace('_', ' ')} ({scores[best_dim]:.2f})")
-        feedback.append(f"Needs improvement in {worst_dim.replace('_', ' ')} ({scores[worst_dim]:.2f})")
+        feedback.append(f"Slug '{slug}' performs best in {best_dim.replace('_', ' ')} ({best_score:.2f})")
+        feedback.append(f"Needs improvement in {worst_dim.replace('_', ' ')} ({worst_score:.2f})")
         
         # Technical observations
-        word_count = len(slug.split('-'))
+        word_count = slug.count('-') + 1
         char_count = len(slug)
         feedback.append(f"Technical: {word_count} words, {char_count} characters")
         
@@ -477,11 +1201,11 @@ Return JSON format:
             factors.append('multiple_entities')
         
         # Check for mixed languages
-        if re.search(r'[一-龯]', title) and re.search(r'[a-zA-Z]', title):
+        if _CJK_RE.search(title) and _LATIN_RE.search(title):
             factors.append('mixed_languages')
         
         # Check for special characters
-        if re.search(r'[！？、。]', title):
+        if _SPECIAL_PUNCT_RE.search(title):
             factors.append('special_punctuation')
         
         return factors
@@ -489,9 +1213,11 @@ Return JSON format:
     def _clamp_scores(self, result: Dict) -> Dict:
         """Ensure all scores are within 0.0-1.0 range"""
         
-        # Clamp dimension scores
-        for dim in result['dimension_scores']:
-            result['dimension_scores'][dim] = max(0.0, min(1.0, result['dimension_scores'][dim]))
+        # Clamp dimension scores in place with comparisons instead of min/max calls;
+        # written so NaN clamps to 1.0 and exact 0/1 become floats, as min/max did
+        dimension_scores = result['dimension_scores']
+        for dim, score in dimension_scores.items():
+            dimension_scores[dim] = 0.0 if score <= 0 else score if score < 1 else 1.0
         
         # Clamp overall score
         result['overall_score'] = max(0.0, min(1.0, result['overall_score']))
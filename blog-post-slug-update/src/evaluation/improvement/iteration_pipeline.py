@@ -5,19 +5,231 @@ Orchestrates complete iteration cycles from evaluation to improvement
 to validation with breakthrough detection.
 """
 
-from typing import Dict, List, Any, Optional
+import asyncio
+import copy
+import hashlib
+import itertools
+import json
+from dataclasses import asdict, dataclass, replace
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Any, Optional, Tuple
+
+from openai import AsyncOpenAI
+
 from .prompt_optimizer import PromptOptimizer
 from .weakness_analyzer import WeaknessAnalyzer
 
+# Default number of iteration cycles with an improvement request in flight
+DEFAULT_CYCLE_CONCURRENCY = 4
+
+# Candidate values swept by tune_breakthrough_thresholds
+_TUNING_GRID = {
+    'success_delta': (0.05, 0.1, 0.15, 0.2, 0.25, 0.3),
+    'failure_resolution_frac': (0.25, 0.5, 0.75, 1.0),
+    'bonus': (0.0, 0.1, 0.2, 0.3)
+}
+
+
+@dataclass(frozen=True, slots=True)
+class PipelineThresholds:
+    """Decision thresholds for breakthrough detection and recommendations"""
+    # Predicted success rate gain that counts as significant
+    success_delta: float = 0.15
+    # Share of persistent failures that counts as substantial resolution
+    failure_resolution_frac: float = 0.5
+    # Probability bonus when every persistent failure is resolved
+    bonus: float = 0.2
+    # Minimum success prediction and confidence to deploy
+    deploy_sp: float = 0.8
+    deploy_cf: float = 0.7
+    # Minimum success prediction and confidence to test further
+    test_sp: float = 0.6
+    test_cf: float = 0.6
+    
+    @classmethod
+    def from_file(cls, path: str) -> 'PipelineThresholds':
+        """Load thresholds saved by to_file; missing fields keep their defaults"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(**json.load(f))
+    
+    def to_file(self, path: str) -> None:
+        """Save thresholds as JSON"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(asdict(self), f, indent=2)
+
+
+DEFAULT_THRESHOLDS = PipelineThresholds()
+
+# Rationale given with each recommended action
+_RECOMMENDATION_RATIONALES = {
+    'deploy': 'High success probability with acceptable risk',
+    'test_further': 'Promising but needs additional validation',
+    'iterate': 'Needs more development before deployment'
+}
+
+
+def _recommendation_action(
+    success_prediction: float,
+    confidence: float,
+    risk_level: str,
+    thresholds: PipelineThresholds = DEFAULT_THRESHOLDS
+) -> str:
+    """Recommended action for a validated improvement"""
+    
+    if (
+        success_prediction > thresholds.deploy_sp
+        and confidence > thresholds.deploy_cf
+        and risk_level in ('low', 'medium')
+    ):
+        return 'deploy'
+    if success_prediction > thresholds.test_sp and confidence > thresholds.test_cf:
+        return 'test_further'
+    return 'iterate'
+
+
+def _breakthrough_signals(
+    breakthrough_scenario: Dict,
+    thresholds: PipelineThresholds
+) -> Tuple[List[str], float, float, float, float]:
+    """Breakthrough indicators and probability with the inputs they were derived from"""
+    
+    current_perf = breakthrough_scenario.get('current_performance', {})
+    proposed_perf = breakthrough_scenario.get('proposed_improvements', {})
+    
+    # Calculate breakthrough indicators
+    breakthrough_indicators = []
+    
+    # Success rate improvement
+    current_success = current_perf.get('success_rate', 0)
+    proposed_success = proposed_perf.get('predicted_success_rate', 0)
+    if proposed_success - current_success > thresholds.success_delta:
+        breakthrough_indicators.append('significant_success_rate_improvement')
+    
+    # Failure resolution
+    current_failures = current_perf.get('persistent_failures', 0)
+    predicted_resolution = proposed_perf.get('predicted_failure_resolution', 0)
+    if predicted_resolution >= current_failures * thresholds.failure_resolution_frac:
+        breakthrough_indicators.append('substantial_failure_resolution')
+    
+    # Constraint breakthrough
+    if proposed_perf.get('constraint_relaxation', False):
+        breakthrough_indicators.append('constraint_breakthrough')
+    
+    # Calculate breakthrough probability
+    breakthrough_probability = len(breakthrough_indicators) / 4.0  # Max 4 indicators
+    
+    # Add bonus for complete failure resolution
+    if predicted_resolution >= current_failures:
+        breakthrough_probability += thresholds.bonus
+    
+    breakthrough_probability = min(1.0, breakthrough_probability)
+    
+    return (breakthrough_indicators, breakthrough_probability,
+            current_success, proposed_success, predicted_resolution / max(1, current_failures))
+
+
+def tune_breakthrough_thresholds(
+    labeled_scenarios: Iterable[Tuple[Dict, bool]],
+    base: PipelineThresholds = DEFAULT_THRESHOLDS
+) -> PipelineThresholds:
+    """
+    Sweep the breakthrough thresholds against historical outcomes
+    
+    Every combination in _TUNING_GRID is scored by the mean squared error
+    between breakthrough_probability and the 0/1 label. Ties keep the
+    earlier candidate, starting with base, so reruns on the same data
+    return the same thresholds.
+    
+    Args:
+        labeled_scenarios: (breakthrough_scenario, was_breakthrough) pairs
+        base: Thresholds supplying the starting point and untuned fields
+        
+    Returns:
+        base with the best success_delta, failure_resolution_frac and bonus
+    """
+    
+    labeled_scenarios = list(labeled_scenarios)
+    if not labeled_scenarios:
+        return base
+    
+    def error(candidate: PipelineThresholds) -> float:
+        return sum(
+            (_breakthrough_signals(scenario, candidate)[1] - float(label)) ** 2
+            for scenario, label in labeled_scenarios
+        ) / len(labeled_scenarios)
+    
+    best, best_error = base, error(base)
+    names = tuple(_TUNING_GRID)
+    for values in itertools.product(*_TUNING_GRID.values()):
+        candidate = replace(base, **dict(zip(names, values)))
+        candidate_error = error(candidate)
+        if candidate_error < best_error:
+            best, best_error = candidate, candidate_error
+    return best
+
+
+@lru_cache(maxsize=512)
+def _breakthrough_precedent(indicators: FrozenSet[str]) -> Tuple[str, ...]:
+    """Historical precedents for a set of breakthrough indicators"""
+    
+    precedents = []
+    
+    if 'significant_success_rate_improvement' in indicators:
+        precedents.append('V6 cultural enhancement breakthrough (+20% success rate)')
+    
+    if 'substantial_failure_resolution' in indicators:
+        precedents.append('V8 constraint relaxation (solved persistent multi-brand failures)')
+    
+    if 'constraint_breakthrough' in indicators:
+        precedents.append('V8 Enhanced Constraints historic breakthrough')
+    
+    return tuple(precedents) or ('No direct historical precedent - novel breakthrough potential',)
+
+
+@lru_cache(maxsize=512)
+def _mitigation_strategies(risk_factors: FrozenSet[str], risk_level: str) -> Tuple[str, ...]:
+    """Mitigation strategies for a set of risk factors at a risk level"""
+    
+    strategies = []
+    
+    if risk_level == 'high':
+        strategies.extend([
+            'Implement gradual rollout with A/B testing',
+            'Maintain rollback capability to current version',
+            'Monitor key metrics closely during deployment'
+        ])
+    
+    if 'major_change_risk' in risk_factors:
+        strategies.append('Consider phased implementation of major changes')
+    
+    if 'multiple_change_complexity' in risk_factors:
+        strategies.append('Test individual changes separately before combining')
+    
+    return tuple(strategies) or ('Standard validation and monitoring procedures',)
+
 
 class IterationPipeline:
     """Orchestrate automated improvement cycles with breakthrough detection"""
     
-    def __init__(self, api_key: str):
-        """Initialize pipeline with optimizer and analyzer"""
-        self.optimizer = PromptOptimizer(api_key)
+    def __init__(
+        self,
+        api_key: str,
+        cache_dir: Optional[str] = None,
+        thresholds: Optional[PipelineThresholds] = None
+    ):
+        """
+        Initialize pipeline with optimizer and analyzer
+        
+        cache_dir caches improvement responses there. thresholds replaces the
+        default decision thresholds, e.g. PipelineThresholds.from_file() on
+        the output of tune_breakthrough_thresholds.
+        """
+        self.optimizer = PromptOptimizer(api_key, cache_dir=cache_dir)
         self.analyzer = WeaknessAnalyzer()
         self.api_key = api_key
+        self.thresholds = thresholds or DEFAULT_THRESHOLDS
+        # Analysis phases by digest of the state fields they depend on
+        self._analysis_cache: Dict[str, Dict[str, Any]] = {}
 
     def run_iteration_cycle(self, current_state: Dict, target_version: str, iteration_goals: List[str]) -> Dict[str, Any]:
         """
@@ -38,6 +250,83 @@ class IterationPipeline:
         # Phase 2: Improvement Generation
         improvement_phase = self._run_improvement_phase(analysis_phase, target_version)
         
+        return self._complete_cycle(analysis_phase, improvement_phase, current_state, target_version, iteration_goals)
+
+    async def arun_iteration_cycle(
+        self,
+        current_state: Dict,
+        target_version: str,
+        iteration_goals: List[str],
+        client: Optional[AsyncOpenAI] = None
+    ) -> Dict[str, Any]:
+        """
+        Async version of run_iteration_cycle
+        
+        Analysis and validation are local rule-based work; only the
+        improvement phase waits on the API.
+        
+        Args:
+            current_state: Current prompt performance state
+            target_version: Target version identifier (e.g., 'v9')
+            iteration_goals: List of goals (e.g., ['solve_constraint_failures'])
+            client: AsyncOpenAI client to send the request with (a temporary one if None)
+            
+        Returns:
+            Dict with analysis_phase, improvement_phase, validation_phase, recommendation
+        """
+        
+        analysis_phase = self._run_analysis_phase(current_state)
+        
+        current_prompt, weakness_analysis = self._improvement_inputs(analysis_phase)
+        improvements = await self.optimizer.agenerate_improvements(current_prompt, weakness_analysis, target_version, client)
+        improvement_phase = self._improvement_phase_result(improvements)
+        
+        return self._complete_cycle(analysis_phase, improvement_phase, current_state, target_version, iteration_goals)
+
+    async def arun_iteration_cycles(
+        self,
+        cycles: List[Tuple[Dict, str, List[str]]],
+        concurrency: int = DEFAULT_CYCLE_CONCURRENCY
+    ) -> List[Dict[str, Any]]:
+        """
+        Run many iteration cycles concurrently
+        
+        Args:
+            cycles: (current_state, target_version, iteration_goals) tuples
+            concurrency: Maximum number of improvement requests in flight
+            
+        Returns:
+            List of run_iteration_cycle results in input order
+        """
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        # One client for all cycles, so its connections never outlive the event loop
+        async with AsyncOpenAI(api_key=self.api_key) as client:
+            async def bounded(current_state: Dict, target_version: str, iteration_goals: List[str]) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self.arun_iteration_cycle(current_state, target_version, iteration_goals, client)
+            
+            return list(await asyncio.gather(*(bounded(*cycle) for cycle in cycles)))
+
+    def run_iteration_cycles(
+        self,
+        cycles: List[Tuple[Dict, str, List[str]]],
+        concurrency: int = DEFAULT_CYCLE_CONCURRENCY
+    ) -> List[Dict[str, Any]]:
+        """Run arun_iteration_cycles from synchronous code"""
+        return asyncio.run(self.arun_iteration_cycles(cycles, concurrency))
+
+    def _complete_cycle(
+        self,
+        analysis_phase: Dict,
+        improvement_phase: Dict,
+        current_state: Dict,
+        target_version: str,
+        iteration_goals: List[str]
+    ) -> Dict[str, Any]:
+        """Validate proposed improvements and assemble the cycle result"""
+        
         # Phase 3: Validation
         validation_phase = self._run_validation_phase(improvement_phase, current_state)
         
@@ -67,36 +356,10 @@ class IterationPipeline:
             Dict with breakthrough_probability, breakthrough_indicators, historical_precedent
         """
         
-        current_perf = breakthrough_scenario.get('current_performance', {})
-        proposed_perf = breakthrough_scenario.get('proposed_improvements', {})
-        
-        # Calculate breakthrough indicators
-        breakthrough_indicators = []
-        
-        # Success rate improvement
-        current_success = current_perf.get('success_rate', 0)
-        proposed_success = proposed_perf.get('predicted_success_rate', 0)
-        if proposed_success - current_success > 0.15:  # >15% improvement
-            breakthrough_indicators.append('significant_success_rate_improvement')
-        
-        # Failure resolution
-        current_failures = current_perf.get('persistent_failures', 0)
-        predicted_resolution = proposed_perf.get('predicted_failure_resolution', 0)
-        if predicted_resolution >= current_failures * 0.5:  # Resolves 50%+ of failures
-            breakthrough_indicators.append('substantial_failure_resolution')
-        
-        # Constraint breakthrough
-        if proposed_perf.get('constraint_relaxation', False):
-            breakthrough_indicators.append('constraint_breakthrough')
-        
-        # Calculate breakthrough probability
-        breakthrough_probability = len(breakthrough_indicators) / 4.0  # Max 4 indicators
-        
-        # Add bonus for complete failure resolution
-        if predicted_resolution >= current_failures:
-            breakthrough_probability += 0.2
-        
-        breakthrough_probability = min(1.0, breakthrough_probability)
+        (breakthrough_indicators, breakthrough_probability,
+         current_success, proposed_success, failure_resolution_rate) = _breakthrough_signals(
+            breakthrough_scenario, self.thresholds
+        )
         
         # Find historical precedent
         historical_precedent = self._find_breakthrough_precedent(breakthrough_indicators)
@@ -106,9 +369,22 @@ class IterationPipeline:
             'breakthrough_indicators': breakthrough_indicators,
             'historical_precedent': historical_precedent,
             'improvement_magnitude': proposed_success - current_success,
-            'failure_resolution_rate': predicted_resolution / max(1, current_failures)
+            'failure_resolution_rate': failure_resolution_rate
         }
 
+    def detect_breakthrough_potential_batch(self, breakthrough_scenarios: List[Dict]) -> List[Dict[str, Any]]:
+        """
+        Detect breakthrough potential for many scenarios, e.g. in an iteration sweep
+        
+        Args:
+            breakthrough_scenarios: Scenario dicts as taken by detect_breakthrough_potential
+            
+        Returns:
+            List of detect_breakthrough_potential results in input order
+        """
+        detect = self.detect_breakthrough_potential
+        return [detect(scenario) for scenario in breakthrough_scenarios]
+
     def assess_regression_risk(self, improvement_proposal: Dict) -> Dict[str, Any]:
         """
         Assess regression risk in improvement proposals
@@ -136,7 +412,7 @@ class IterationPipeline:
                     regression_risk = 'medium'
         
         # Check for risky change types
-        if any('major' in str(change).lower() or 'rewrite' in str(change).lower() for change in changes):
+        if any('major' in lowered or 'rewrite' in lowered for lowered in (str(change).lower() for change in changes)):
             risk_factors.append('major_change_risk')
             regression_risk = 'high' if regression_risk != 'high' else regression_risk
         
@@ -156,12 +432,64 @@ class IterationPipeline:
             'risk_score': self._calculate_risk_score(risk_factors, regression_risk)
         }
 
+    def assess_regression_risk_batch(self, improvement_proposals: List[Dict]) -> List[Dict[str, Any]]:
+        """
+        Assess regression risk for many improvement proposals
+        
+        Args:
+            improvement_proposals: Proposal dicts as taken by assess_regression_risk
+            
+        Returns:
+            List of assess_regression_risk results in input order
+        """
+        assess = self.assess_regression_risk
+        return [assess(proposal) for proposal in improvement_proposals]
+
+    def recommend_actions_batch(self, predictions: List[Tuple[float, float, str]]) -> List[str]:
+        """
+        Recommended actions for many hypothetical validation outcomes, e.g. in an autotuning sweep
+        
+        Args:
+            predictions: (success_prediction, confidence, regression_risk) rows
+            
+        Returns:
+            List of 'deploy', 'test_further' or 'iterate' in input order
+        """
+        action = _recommendation_action
+        thresholds = self.thresholds
+        return [
+            action(success_prediction, confidence, risk_level, thresholds)
+            for success_prediction, confidence, risk_level in predictions
+        ]
+
+    def clear_analysis_cache(self) -> None:
+        """Forget cached analysis phases, e.g. after the analyzers' rules change"""
+        self._analysis_cache.clear()
+
     def _run_analysis_phase(self, current_state: Dict) -> Dict[str, Any]:
-        """Run comprehensive analysis phase"""
+        """
+        Run comprehensive analysis phase
+        
+        The analysis depends only on the success rate and known failures, so
+        sweeps re-analyzing one state reuse the first result. Each call gets
+        its own copy, keeping cycle results independent.
+        """
         
         performance_metrics = current_state.get('performance_metrics', {})
         known_failures = current_state.get('known_failures', [])
         
+        key = hashlib.blake2b(
+            json.dumps([performance_metrics.get('success_rate'), known_failures], default=str).encode('utf-8'),
+            digest_size=16
+        ).hexdigest()
+        cached = self._analysis_cache.get(key)
+        if cached is None:
+            cached = self._analysis_cache[key] = self._analyze_state(performance_metrics, known_failures)
+        return copy.deepcopy(cached)
+
+    def _analyze_state(self, performance_metrics: Dict, known_failures: List[str]) -> Dict[str, Any]:
+        """Weakness and failure-pattern analysis behind _run_analysis_phase"""
+        
         # Analyze weaknesses using mock evaluation results
         weakness_areas = []
         if performance_metrics.get('success_rate', 1.0) < 1.0:
@@ -195,6 +523,13 @@ class IterationPipeline:
     def _run_improvement_phase(self, analysis_phase: Dict, target_version: str) -> Dict[str, Any]:
         """Run improvement generation phase"""
         
+        current_prompt, weakness_analysis = self._improvement_inputs(analysis_phase)
+        improvements = self.optimizer.generate_improvements(current_prompt, weakness_analysis, target_version)
+        return self._improvement_phase_result(improvements)
+
+    def _improvement_inputs(self, analysis_phase: Dict) -> Tuple[str, Dict[str, Any]]:
+        """Current prompt and weakness analysis to generate improvements from"""
+        
         # Create mock current prompt for demonstration
         current_prompt = "Generate SEO slug with 3-6 words, under 60 characters"
         
@@ -206,7 +541,10 @@ class IterationPipeline:
             'constraint_issues': analysis_phase.get('constraint_issues', [])
         }
         
-        improvements = self.optimizer.generate_improvements(current_prompt, weakness_analysis, target_version)
+        return current_prompt, weakness_analysis
+
+    def _improvement_phase_result(self, improvements: Dict[str, Any]) -> Dict[str, Any]:
+        """Improvement phase summary of generated improvements"""
         
         return {
             'proposed_changes': improvements['key_changes'],
@@ -248,20 +586,11 @@ class IterationPipeline:
         confidence = validation.get('confidence', 0)
         risk_level = validation.get('risk_assessment', {}).get('regression_risk', 'medium')
         
-        # Decision logic
-        if success_prediction > 0.8 and confidence > 0.7 and risk_level in ['low', 'medium']:
-            action = 'deploy'
-            rationale = 'High success probability with acceptable risk'
-        elif success_prediction > 0.6 and confidence > 0.6:
-            action = 'test_further'
-            rationale = 'Promising but needs additional validation'
-        else:
-            action = 'iterate'
-            rationale = 'Needs more development before deployment'
+        action = _recommendation_action(success_prediction, confidence, risk_level, self.thresholds)
         
         return {
             'action': action,
-            'rationale': rationale,
+            'rationale': _RECOMMENDATION_RATIONALES[action],
             'confidence': confidence,
             'success_factors': improvement.get('expected_benefits', []),
             'risk_mitigation': validation.get('risk_assessment', {}).get('mitigation_strategies', [])
@@ -270,38 +599,13 @@ class IterationPipeline:
     def _find_breakthrough_precedent(self, indicators: List[str]) -> List[str]:
         """Find historical precedent for breakthrough indicators"""
         
-        precedents = []
-        
-        if 'significant_success_rate_improvement' in indicators:
-            precedents.append('V6 cultural enhancement breakthrough (+20% success rate)')
-        
-        if 'substantial_failure_resolution' in indicators:
-            precedents.append('V8 constraint relaxation (solved persistent multi-brand failures)')
-        
-        if 'constraint_breakthrough' in indicators:
-            precedents.append('V8 Enhanced Constraints historic breakthrough')
-        
-        return precedents or ['No direct historical precedent - novel breakthrough potential']
+        # Sweeps repeat the same few indicator sets; results are cached per set
+        return list(_breakthrough_precedent(frozenset(indicators)))
 
     def _generate_mitigation_strategies(self, risk_factors: List[str], risk_level: str) -> List[str]:
         """Generate risk mitigation strategies"""
         
-        strategies = []
-        
-        if risk_level == 'high':
-            strategies.extend([
-                'Implement gradual rollout with A/B testing',
-                'Maintain rollback capability to current version',
-                'Monitor key metrics closely during deployment'
-            ])
-        
-        if 'major_change_risk' in risk_factors:
-            strategies.append('Consider phased implementation of major changes')
-        
-        if 'multiple_change_complexity' in risk_factors:
-            strategies.append('Test individual changes separately before combining')
-        
-        return strategies or ['Standard validation and monitoring procedures']
+        return list(_mitigation_strategies(frozenset(risk_factors), risk_level))
 
     def _calculate_risk_score(self, risk_factors: List[str], risk_level: str) -> float:
         """Calculate numerical risk score"""
@@ -6,17 +6,51 @@ validate enhancement strategies.
 """
 
 import json
+import re
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
+
+from ..utils.json_utils import aread_json_stream, read_json_stream
+from ..utils.response_cache import ResponseCache
+
+OPTIMIZATION_SYSTEM_PROMPT = "You are an expert prompt engineer specializing in SEO slug generation. Analyze weaknesses and generate improved prompts."
+
+# Validation weight of each recognised change, keyed on its space-separated form
+_IMPROVEMENT_WEIGHTS = (
+    ('relaxed constraints', 0.3),
+    ('enhanced brand detection', 0.25),
+    ('improved cultural preservation', 0.25),
+    ('better multi brand handling', 0.2)
+)
+
+# Brands whose presence in a title makes brand-handling changes likely to help
+_PREDICTION_BRANDS = ('jojo', 'skinniydip', 'daikoku')
+
+# One pass over the title instead of a substring scan per brand
+_PREDICTION_BRAND_RE = re.compile('|'.join(map(re.escape, _PREDICTION_BRANDS)))
+
+
+@lru_cache(maxsize=64)
+def _indented_json(compact: str) -> str:
+    """Two-space indented form of a compact JSON document"""
+    return json.dumps(json.loads(compact), indent=2)
 
 
 class PromptOptimizer:
     """LLM-driven prompt enhancement and optimization system"""
     
-    def __init__(self, api_key: str, model: str = "gpt-4o-mini"):
-        """Initialize prompt optimizer with OpenAI client"""
+    def __init__(self, api_key: str, model: str = "gpt-4o-mini", cache_dir: Optional[str] = None):
+        """
+        Initialize prompt optimizer with OpenAI client
+        
+        cache_dir enables a persistent response cache there, keyed on the full
+        improvement request (model, current prompt, weaknesses, target version).
+        """
         self.client = OpenAI(api_key=api_key)
         self.model = model
+        self.api_key = api_key
+        self.cache = ResponseCache(cache_dir) if cache_dir else None
 
     def analyze_weaknesses(self, evaluation_results: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -56,7 +90,13 @@ class PromptOptimizer:
             'constraint_issues': constraint_issues
         }
 
-    def generate_improvements(self, current_prompt: str, weakness_analysis: Dict, target_version: str) -> Dict[str, Any]:
+    def generate_improvements(
+        self,
+        current_prompt: str,
+        weakness_analysis: Dict,
+        target_version: str,
+        bypass_cache: bool = False
+    ) -> Dict[str, Any]:
         """
         Generate specific prompt enhancement recommendations
         
@@ -64,32 +104,79 @@ class PromptOptimizer:
             current_prompt: Current prompt text
             weakness_analysis: Results from analyze_weaknesses()
             target_version: Target version (e.g., 'v9')
+            bypass_cache: Request fresh improvements, replacing any cached response
+            
+        Returns:
+            Dict with enhanced_prompt, key_changes, rationale, expected_improvements
+        """
+        
+        request = self._improvement_request(current_prompt, weakness_analysis, target_version)
+        key = self._cache_key(request)
+        
+        try:
+            raw = None if bypass_cache else self._cached_content(key)
+            cached = raw is not None
+            if not cached:
+                # Streamed, so reading stops at the end of the JSON object rather than the response
+                stream = self.client.chat.completions.create(**request, stream=True)
+                raw, _ = read_json_stream(stream)
+            
+            result = json.loads(raw)
+            improvements = self._validate_improvement_result(result, current_prompt, weakness_analysis)
+            if key is not None and not cached:
+                self.cache.set(key, raw)
+            return improvements
+            
+        except Exception as e:
+            return self._create_fallback_improvement(current_prompt, weakness_analysis, str(e))
+
+    async def agenerate_improvements(
+        self,
+        current_prompt: str,
+        weakness_analysis: Dict,
+        target_version: str,
+        client: Optional[AsyncOpenAI] = None,
+        bypass_cache: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Async version of generate_improvements
+        
+        Args:
+            current_prompt: Current prompt text
+            weakness_analysis: Results from analyze_weaknesses()
+            target_version: Target version (e.g., 'v9')
+            client: AsyncOpenAI client to send the request with (a temporary one if None)
+            bypass_cache: Request fresh improvements, replacing any cached response
             
         Returns:
             Dict with enhanced_prompt, key_changes, rationale, expected_improvements
         """
         
-        prompt = self._create_optimization_prompt(current_prompt, weakness_analysis, target_version)
+        request = self._improvement_request(current_prompt, weakness_analysis, target_version)
+        key = self._cache_key(request)
+        raw = None if bypass_cache else self._cached_content(key)
+        
+        if raw is not None:
+            # Cache hits need no client
+            try:
+                return self._validate_improvement_result(json.loads(raw), current_prompt, weakness_analysis)
+            except Exception as e:
+                return self._create_fallback_improvement(current_prompt, weakness_analysis, str(e))
+        
+        if client is None:
+            async with AsyncOpenAI(api_key=self.api_key) as client:
+                return await self.agenerate_improvements(
+                    current_prompt, weakness_analysis, target_version, client, bypass_cache=True
+                )
         
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert prompt engineer specializing in SEO slug generation. Analyze weaknesses and generate improved prompts."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.4
-            )
+            stream = await client.chat.completions.create(**request, stream=True)
             
-            result = json.loads(response.choices[0].message.content)
-            return self._validate_improvement_result(result, current_prompt, weakness_analysis)
+            raw, _ = await aread_json_stream(stream)
+            improvements = self._validate_improvement_result(json.loads(raw), current_prompt, weakness_analysis)
+            if key is not None:
+                self.cache.set(key, raw)
+            return improvements
             
         except Exception as e:
             return self._create_fallback_improvement(current_prompt, weakness_analysis, str(e))
@@ -113,9 +200,10 @@ class PromptOptimizer:
         validation_score = self._calculate_improvement_score(key_changes)
         
         # Predict success likelihood for target cases
+        changes_text = ' '.join(key_changes).lower()
         likely_successes = []
         for case in target_cases:
-            if self._predict_case_success(case, key_changes):
+            if self._predict_case_success(case, key_changes, changes_text):
                 likely_successes.append(case['title'])
         
         # Check for potential regressions
@@ -151,6 +239,27 @@ class PromptOptimizer:
         
         return suggestions
 
+    def _improvement_request(self, current_prompt: str, weakness_analysis: Dict, target_version: str) -> Dict[str, Any]:
+        """Chat completion arguments for generating prompt improvements"""
+        
+        return {
+            'model': self.model,
+            'messages': [
+                {"role": "system", "content": OPTIMIZATION_SYSTEM_PROMPT},
+                {"role": "user", "content": self._create_optimization_prompt(current_prompt, weakness_analysis, target_version)}
+            ],
+            'response_format': {"type": "json_object"},
+            'temperature': 0.4
+        }
+
+    def _cache_key(self, request: Dict[str, Any]) -> Optional[str]:
+        """Cache key for an improvement request, or None when caching is disabled"""
+        return ResponseCache.make_key(request) if self.cache is not None else None
+
+    def _cached_content(self, key: Optional[str]) -> Optional[str]:
+        """Cached raw response content for key, or None on a miss"""
+        return self.cache.get(key) if key is not None else None
+
     def _create_optimization_prompt(self, current_prompt: str, weakness_analysis: Dict, target_version: str) -> str:
         """Create optimization prompt for LLM"""
         
@@ -158,6 +267,10 @@ class PromptOptimizer:
         failures = weakness_analysis.get('specific_failures', [])
         suggestions = weakness_analysis.get('improvement_suggestions', [])
         
+        # Indented dumps run the pure-Python encoder; sweeps over target versions
+        # repeat the same failures, so only the C-encoded compact form is built per call
+        failures_json = _indented_json(json.dumps(failures[:3]))
+        
         return f"""
 Optimize this SEO slug generation prompt to address identified weaknesses:
 
@@ -170,10 +283,10 @@ IDENTIFIED WEAKNESSES:
 {', '.join(weaknesses)}
 
 FAILURE CASES:
-{json.dumps(failures[:3], indent=2)}
+{failures_json}
 
 IMPROVEMENT SUGGESTIONS:
-{chr(10).join(f'- {s}' for s in suggestions)}
+{chr(10).join([f'- {s}' for s in suggestions])}
 
 Generate an enhanced prompt that:
 1. Addresses the identified weaknesses
@@ -258,35 +371,38 @@ ENHANCED INSTRUCTIONS:
     def _calculate_improvement_score(self, key_changes: List[str]) -> float:
         """Calculate validation score based on key changes"""
         
-        improvement_weights = {
-            'relaxed_constraints': 0.3,
-            'enhanced_brand_detection': 0.25,
-            'improved_cultural_preservation': 0.25,
-            'better_multi_brand_handling': 0.2
-        }
-        
-        score = 0.0
-        for change in key_changes:
-            for pattern, weight in improvement_weights.items():
-                if pattern.replace('_', ' ') in change.lower().replace('_', ' '):
-                    score += weight
+        # Normalize each change once; a change earns every weight whose pattern it contains
+        score = sum(
+            (weight
+             for normalized in (change.lower().replace('_', ' ') for change in key_changes)
+             for pattern, weight in _IMPROVEMENT_WEIGHTS
+             if pattern in normalized),
+            0.0
+        )
         
         return min(1.0, score)
 
-    def _predict_case_success(self, case: Dict, key_changes: List[str]) -> bool:
-        """Predict if case will succeed with proposed changes"""
+    def _predict_case_success(self, case: Dict, key_changes: List[str], changes_text: Optional[str] = None) -> bool:
+        """
+        Predict if case will succeed with proposed changes
+        
+        changes_text is the lowercased space-joined key_changes; callers
+        checking many cases against the same changes pass it in once.
+        """
         
+        if changes_text is None:
+            changes_text = ' '.join(key_changes).lower()
         title = case.get('title', '').lower()
         expected_improvement = case.get('expected_improvement', '')
         
         # If changes address constraint issues and case involves complex titles
-        if ('constraint' in ' '.join(key_changes).lower() and 
+        if ('constraint' in changes_text and 
             (len(title) > 80 or '/' in title or '&' in title)):
             return True
         
         # If changes improve brand handling and title contains brands
-        if ('brand' in ' '.join(key_changes).lower() and
-            any(brand in title for brand in ['jojo', 'skinniydip', 'daikoku'])):
+        if ('brand' in changes_text and
+            _PREDICTION_BRAND_RE.search(title)):
             return True
         
         return expected_improvement == 'should_now_succeed'
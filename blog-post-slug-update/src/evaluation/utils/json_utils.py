@@ -0,0 +1,115 @@
+"""
+JSON Helpers
+
+Response decoding and streamed JSON reading shared by the evaluation
+modules, using orjson when it is installed.
+"""
+
+import json
+from typing import Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    # Stdlib fallback; orjson only speeds up response decoding
+    orjson = None
+
+
+def loads(raw: Any) -> Any:
+    """Decode a JSON document (str or bytes), with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+class JSONObjectEnd:
+    """
+    Incremental detector for the end of a streamed top-level JSON value.
+    
+    Tracks bracket depth outside string literals, so the stream can be
+    closed as soon as the object is complete instead of waiting for the
+    end of the response (JSON mode may pad with whitespace).
+    """
+    
+    def __init__(self):
+        self.depth = 0
+        self.started = False
+        self.in_string = False
+        self.escaped = False
+    
+    def feed(self, text: str) -> int:
+        """Consume a chunk; return the offset just past the closing bracket, or -1"""
+        for i, ch in enumerate(text):
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif ch == '\\':
+                    self.escaped = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"':
+                self.in_string = True
+            elif ch in '{[':
+                self.depth += 1
+                self.started = True
+            elif ch in '}]':
+                self.depth -= 1
+                if self.started and self.depth == 0:
+                    return i + 1
+        return -1
+
+
+def read_json_stream(stream: Any) -> Tuple[str, Optional[str]]:
+    """
+    Collect a streamed JSON completion, closing the stream once the object is complete
+    
+    Returns:
+        The content, and the finish reason seen before the stream ended
+        (None when it was closed at the end of the object)
+    """
+    
+    tracker = JSONObjectEnd()
+    parts = []
+    finish_reason = None
+    try:
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            choice = chunk.choices[0]
+            finish_reason = choice.finish_reason or finish_reason
+            delta = choice.delta.content
+            if not delta:
+                continue
+            end = tracker.feed(delta)
+            if end >= 0:
+                parts.append(delta[:end])
+                return ''.join(parts), None
+            parts.append(delta)
+    finally:
+        stream.close()
+    return ''.join(parts), finish_reason
+
+
+async def aread_json_stream(stream: Any) -> Tuple[str, Optional[str]]:
+    """Async version of read_json_stream"""
+    
+    tracker = JSONObjectEnd()
+    parts = []
+    finish_reason = None
+    try:
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            choice = chunk.choices[0]
+            finish_reason = choice.finish_reason or finish_reason
+            delta = choice.delta.content
+            if not delta:
+                continue
+            end = tracker.feed(delta)
+            if end >= 0:
+                parts.append(delta[:end])
+                return ''.join(parts), None
+            parts.append(delta)
+    finally:
+        await stream.close()
+    return ''.join(parts), finish_reason
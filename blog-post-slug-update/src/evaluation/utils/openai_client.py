@@ -0,0 +1,61 @@
+"""
+OpenAI Client Helpers
+
+Pooled httpx transports for OpenAI clients (multiplexed over HTTP/2 when
+the h2 package is installed) and Batch API constants shared by the
+evaluation modules.
+"""
+
+from functools import lru_cache
+from typing import Any, Optional
+
+try:
+    import httpx
+except ImportError:
+    # Installed with openai; without it clients keep the SDK's default pool
+    httpx = None
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Batch job states after which no further polling is needed
+BATCH_TERMINAL_STATES = frozenset({'completed', 'failed', 'expired', 'cancelled'})
+
+
+@lru_cache(maxsize=1)
+def shared_http_client() -> Optional[Any]:
+    """
+    Process-wide pooled httpx client for synchronous OpenAI clients.
+    
+    Evaluators and extractors created per run or per configuration reuse
+    warm connections instead of each paying TCP and TLS setup. The API key
+    travels in request headers, so one pool serves every key.
+    """
+    if httpx is None:
+        return None
+    
+    return httpx.Client(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        timeout=httpx.Timeout(60.0, connect=5.0)
+    )
+
+
+def new_async_http_client(max_connections: int = 64, max_keepalive_connections: int = 32) -> Optional[Any]:
+    """
+    Pooled httpx client for one AsyncOpenAI client, or None without httpx
+    
+    Async clients are bound to the event loop they first run on, so unlike
+    shared_http_client a fresh one is built per run.
+    """
+    if httpx is None:
+        return None
+    
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive_connections),
+        timeout=httpx.Timeout(60.0, connect=5.0)
+    )
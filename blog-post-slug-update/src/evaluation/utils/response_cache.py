@@ -0,0 +1,68 @@
+"""
+LLM Response Cache
+
+Persistent exact-match cache of chat completion contents, so repeated
+evaluation requests skip the API call entirely.
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, Optional
+
+try:
+    import diskcache
+except ImportError:
+    # ResponseCache falls back to one JSON file per entry
+    diskcache = None
+
+
+class ResponseCache:
+    """
+    Exact-match cache of raw response contents keyed on the full request.
+    
+    Keys are BLAKE2b digests of the model, temperature and messages, so any
+    change to the prompt text produces a miss. Backed by diskcache when
+    installed, otherwise by one JSON file per key.
+    """
+    
+    def __init__(self, directory: str):
+        self.directory = directory
+        if diskcache is not None:
+            self._store = diskcache.Cache(directory)
+        else:
+            self._store = None
+            os.makedirs(directory, exist_ok=True)
+    
+    @staticmethod
+    def make_key(request: Dict[str, Any]) -> str:
+        """Build the cache key for one chat completion request"""
+        return hashlib.blake2b(json.dumps({
+            "model": request.get("model"),
+            "temperature": request.get("temperature"),
+            "messages": request.get("messages")
+        }, sort_keys=True, ensure_ascii=False).encode("utf-8"), digest_size=32).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response content, or None on a miss"""
+        if self._store is not None:
+            return self._store.get(key)
+        
+        try:
+            with open(os.path.join(self.directory, f"{key}.json"), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+    
+    def set(self, key: str, content: str) -> None:
+        """Store response content under key"""
+        if self._store is not None:
+            self._store.set(key, content)
+            return
+        
+        # Write-then-rename so concurrent readers never see a partial entry
+        path = os.path.join(self.directory, f"{key}.json")
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(content, f, ensure_ascii=False)
+        os.replace(temp_path, path)
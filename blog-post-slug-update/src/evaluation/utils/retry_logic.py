@@ -5,9 +5,10 @@ Provides intelligent retry logic with error classification for API calls.
 Distinguishes between temporary and permanent failures.
 """
 
+import asyncio
 import time
 import random
-from typing import Callable, Any, Optional, Type, List
+from typing import Awaitable, Callable, Any, Optional, Type, List
 from .exceptions import (
     LLMUnavailableError, InvalidAPIKeyError, APIRateLimitError, 
     TemporaryAPIError, APIQuotaExceededError, classify_api_error
@@ -48,43 +49,91 @@ def smart_api_retry(
         try:
             return func()
         except Exception as e:
-            # Classify the error
-            classified_error = classify_api_error(e)
-            last_exception = classified_error
-            
-            # Permanent errors - don't retry
-            if isinstance(classified_error, (InvalidAPIKeyError, APIQuotaExceededError)):
-                raise classified_error
-            
-            # Rate limit errors - only retry if enabled
-            if isinstance(classified_error, APIRateLimitError):
-                if not retry_on_rate_limit or attempt == max_retries:
-                    raise classified_error
-                # Use longer delays for rate limits
-                delay = min(base_delay * (backoff_multiplier ** (attempt + 2)), max_delay)
-            
-            # Temporary errors - retry with exponential backoff
-            elif isinstance(classified_error, TemporaryAPIError):
-                if attempt == max_retries:
-                    raise classified_error
-                delay = min(base_delay * (backoff_multiplier ** attempt), max_delay)
-            
-            # Unknown errors - classify as temporary and retry
-            else:
-                if attempt == max_retries:
-                    raise TemporaryAPIError(f"Unknown error after {max_retries} retries: {e}")
-                delay = min(base_delay * (backoff_multiplier ** attempt), max_delay)
-            
-            # Add jitter to prevent thundering herd
-            if jitter:
-                delay *= (0.5 + random.random() * 0.5)  # 50-100% of calculated delay
-            
+            last_exception = classify_api_error(e)
+            delay = _retry_delay(
+                e, last_exception, attempt, max_retries, base_delay, max_delay,
+                backoff_multiplier, jitter, retry_on_rate_limit
+            )
             time.sleep(delay)
     
     # Should never reach here, but just in case
     raise last_exception or TemporaryAPIError("Retry logic failed unexpectedly")
 
 
+async def async_smart_api_retry(
+    func: Callable[[], Awaitable[Any]],
+    max_retries: int = 3,
+    base_delay: float = 1.0,
+    max_delay: float = 60.0,
+    backoff_multiplier: float = 2.0,
+    jitter: bool = True,
+    retry_on_rate_limit: bool = True
+) -> Any:
+    """
+    Async counterpart of smart_api_retry; func returns a fresh awaitable per attempt
+    
+    Backoff sleeps with asyncio.sleep so other requests keep running meanwhile.
+    """
+    
+    last_exception = None
+    
+    for attempt in range(max_retries + 1):
+        try:
+            return await func()
+        except Exception as e:
+            last_exception = classify_api_error(e)
+            delay = _retry_delay(
+                e, last_exception, attempt, max_retries, base_delay, max_delay,
+                backoff_multiplier, jitter, retry_on_rate_limit
+            )
+            await asyncio.sleep(delay)
+    
+    raise last_exception or TemporaryAPIError("Retry logic failed unexpectedly")
+
+
+def _retry_delay(
+    error: Exception,
+    classified_error: LLMUnavailableError,
+    attempt: int,
+    max_retries: int,
+    base_delay: float,
+    max_delay: float,
+    backoff_multiplier: float,
+    jitter: bool,
+    retry_on_rate_limit: bool
+) -> float:
+    """Return the delay before the next attempt, or raise if the error should not be retried"""
+    
+    # Permanent errors - don't retry
+    if isinstance(classified_error, (InvalidAPIKeyError, APIQuotaExceededError)):
+        raise classified_error
+    
+    # Rate limit errors - only retry if enabled
+    if isinstance(classified_error, APIRateLimitError):
+        if not retry_on_rate_limit or attempt == max_retries:
+            raise classified_error
+        # Use longer delays for rate limits
+        delay = min(base_delay * (backoff_multiplier ** (attempt + 2)), max_delay)
+    
+    # Temporary errors - retry with exponential backoff
+    elif isinstance(classified_error, TemporaryAPIError):
+        if attempt == max_retries:
+            raise classified_error
+        delay = min(base_delay * (backoff_multiplier ** attempt), max_delay)
+    
+    # Unknown errors - classify as temporary and retry
+    else:
+        if attempt == max_retries:
+            raise TemporaryAPIError(f"Unknown error after {max_retries} retries: {error}")
+        delay = min(base_delay * (backoff_multiplier ** attempt), max_delay)
+    
+    # Add jitter to prevent thundering herd
+    if jitter:
+        delay *= (0.5 + random.random() * 0.5)  # 50-100% of calculated delay
+    
+    return delay
+
+
 class RetryConfig:
     """Configuration for retry behavior"""
     
@@ -114,4 +163,16 @@ class RetryConfig:
             backoff_multiplier=self.backoff_multiplier,
             jitter=self.jitter,
             retry_on_rate_limit=self.retry_on_rate_limit
+        )
+    
+    async def aexecute_with_retry(self, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Await func() with this retry configuration"""
+        return await async_smart_api_retry(
+            func=func,
+            max_retries=self.max_retries,
+            base_delay=self.base_delay,
+            max_delay=self.max_delay,
+            backoff_multiplier=self.backoff_multiplier,
+            jitter=self.jitter,
+            retry_on_rate_limit=self.retry_on_rate_limit
         )
\ No newline at end of file
@@ -0,0 +1,44 @@
+"""
+Token Estimation
+
+Prompt token counts for quota reservation, batch packing and content
+previews, using tiktoken when it is installed and a character ratio
+otherwise.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+try:
+    import tiktoken
+except ImportError:
+    # Token counts fall back to a character-based estimate
+    tiktoken = None
+
+# Rough characters-per-token ratio used when tiktoken is unavailable
+CHARS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=None)
+def get_encoding(model: str) -> Optional[Any]:
+    """tiktoken encoding for model (o200k_base if unknown), or None without tiktoken"""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding('o200k_base')
+
+
+def count_tokens(text: str, model: str) -> int:
+    """Tokens in text for model, estimated from its length without tiktoken"""
+    
+    encoding = get_encoding(model)
+    if encoding is None:
+        return len(text) // CHARS_PER_TOKEN + 1
+    return len(encoding.encode(text))
+
+
+def estimate_prompt_tokens(request: Dict[str, Any]) -> int:
+    """Prompt tokens of one chat completion request"""
+    return count_tokens(''.join(message['content'] for message in request['messages']), request['model'])
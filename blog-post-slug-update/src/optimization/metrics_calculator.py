@@ -11,6 +11,9 @@ import statistics
 from typing import List, Dict, Any, Optional
 from contextlib import contextmanager
 
+# Allowed slug characters; used with fullmatch so a trailing newline is rejected
+_SLUG_CHARS = re.compile(r'[a-z0-9-]+')
+
 
 class DurationTimer:
     """Context manager for measuring execution duration"""
@@ -147,7 +150,7 @@ class MetricsCalculator:
             'has_hyphens': '-' in text,
             'no_spaces': ' ' not in text,
             'lowercase': text.islower(),
-            'no_special_chars': bool(re.match(r'^[a-z0-9-]+$', text)),
+            'no_special_chars': _SLUG_CHARS.fullmatch(text) is not None,
             'seo_compliant': (
                 3 <= len(words) <= 6 and 
                 len(text) <= 60 and
@@ -9,12 +9,15 @@ import os
 import pytest
 import json
 import time
-from unittest.mock import Mock, patch, MagicMock
+import asyncio
+from unittest.mock import Mock, AsyncMock, patch, MagicMock
 
 # Add src directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
 from core import SlugGenerator
+from core.slug_generator import RateLimitedDispatcher
+from config.settings import SlugGeneratorConfig
 
 
 class TestKeywordFallbackElimination:
@@ -260,6 +263,98 @@ class TestStructuredResponse:
         assert call_kwargs['model'] == 'gpt-4o-mini'
         assert call_kwargs['response_format'] == {"type": "json_object"}
 
+    @patch('openai.OpenAI')
+    def test_count_uses_n_choices_in_one_request(self, mock_openai):
+        """Should request count alternatives via n and merge the choices by rank"""
+        def choice(*slugs):
+            content = json.dumps({"slugs": [
+                {"slug": slug, "confidence": 0.9, "reasoning": "test"} for slug in slugs
+            ]})
+            return Mock(message=Mock(content=content))
+
+        mock_client = Mock()
+        mock_openai.return_value = mock_client
+        mock_client.chat.completions.create.return_value = Mock(choices=[
+            choice("uk-fashion-guide", "uk-style-shopping"),
+            choice("british-style-shopping", "uk-fashion-guide")
+        ])
+
+        generator = SlugGenerator(api_key="test-key")
+        result = generator.generate_slug_from_content("Test Title", "Test content", count=3)
+
+        assert mock_client.chat.completions.create.call_count == 1
+        call_kwargs = mock_client.chat.completions.create.call_args[1]
+        assert call_kwargs['n'] == 3
+        assert "Generate 1 different slug options" in call_kwargs['messages'][1]['content']
+        assert result['primary'] == "uk-fashion-guide"
+        assert result['alternatives'] == ["british-style-shopping", "uk-style-shopping"]
+
+    @patch('openai.OpenAI')
+    def test_repeated_choices_are_topped_up_with_one_list_completion(self, mock_openai):
+        """Choices that repeat the same slug get one list completion to fill count"""
+        def response(*slugs, choices=1):
+            content = json.dumps({"slugs": [
+                {"slug": slug, "confidence": 0.9, "reasoning": "test"} for slug in slugs
+            ]})
+            return Mock(choices=[Mock(message=Mock(content=content)) for _ in range(choices)])
+
+        mock_client = Mock()
+        mock_openai.return_value = mock_client
+        mock_client.chat.completions.create.side_effect = [
+            response("uk-fashion-guide", choices=3),
+            response("uk-fashion-guide", "british-style-shopping", "uk-clothing-deals")
+        ]
+
+        generator = SlugGenerator(api_key="test-key")
+        result = generator.generate_slug_from_content("Test Title", "Test content", count=3)
+
+        first_call, top_up_call = mock_client.chat.completions.create.call_args_list
+        assert first_call[1]['n'] == 3
+        assert 'n' not in top_up_call[1]
+        assert "Generate 3 different slug options" in top_up_call[1]['messages'][1]['content']
+        assert [result['primary']] + result['alternatives'] == [
+            "uk-fashion-guide", "british-style-shopping", "uk-clothing-deals"
+        ]
+
+    @patch('openai.OpenAI')
+    def test_n_rejected_falls_back_to_list_prompt(self, mock_openai):
+        """Should retry without n when the endpoint answers 400 for the n parameter"""
+        valid_response = json.dumps({"slugs": [
+            {"slug": "uk-fashion-guide", "confidence": 0.95, "reasoning": "Clear topic"},
+            {"slug": "british-style-shopping", "confidence": 0.88, "reasoning": "Alternative angle"}
+        ]})
+
+        mock_client = Mock()
+        mock_openai.return_value = mock_client
+        mock_client.chat.completions.create.side_effect = [
+            Exception("OpenAI API error 400: 'n' is not supported"),
+            Mock(choices=[Mock(message=Mock(content=valid_response))])
+        ]
+
+        generator = SlugGenerator(api_key="test-key")
+        result = generator.generate_slug_from_content("Test Title", "Test content", count=2)
+
+        assert 'n' not in mock_client.chat.completions.create.call_args[1]
+        assert generator._supports_n is False
+        assert result['alternatives'] == ["british-style-shopping"]
+
+    @patch('time.sleep')
+    @patch('openai.OpenAI')
+    def test_other_bad_requests_keep_n_enabled(self, mock_openai, mock_sleep):
+        """A 400 unrelated to n (e.g. context length) is raised without turning n off"""
+        mock_client = Mock()
+        mock_openai.return_value = mock_client
+        mock_client.chat.completions.create.side_effect = Exception(
+            "OpenAI API error 400: This model's maximum context length is 128000 tokens"
+        )
+
+        generator = SlugGenerator(api_key="test-key", max_retries=0)
+        with pytest.raises(Exception, match="maximum context length"):
+            generator.generate_slug_from_content("Test Title", "Test content", count=2)
+
+        assert mock_client.chat.completions.create.call_count == 1
+        assert generator._supports_n is True
+
 
 class TestLLMFirstErrorHandling:
     """Test proper error handling without fallbacks"""
@@ -309,6 +404,373 @@ class TestLLMFirstErrorHandling:
             generator.generate_slug_from_content("Test Title", "Test content")
 
 
+
+class TestAsyncBatchGeneration:
+    """Test concurrent slug generation through the AsyncOpenAI client"""
+    
+    @patch('core.slug_generator.aiohttp', None)
+    @patch('core.slug_generator.extract_title_and_content')
+    @patch('openai.AsyncOpenAI')
+    def test_batch_returns_results_in_input_order(self, mock_async_openai, mock_extract):
+        """Batch results keep URL order and report failures per URL"""
+        mock_client = Mock()
+        mock_async_openai.return_value = mock_client
+        mock_client.chat.completions.create = AsyncMock(return_value=Mock(
+            choices=[Mock(message=Mock(content='{"slugs": [{"slug": "test-slug-generator", "confidence": 0.9, "reasoning": "test"}]}'))]
+        ))
+        mock_extract.return_value = ("Test Title", "Test content")
+        
+        generator = SlugGenerator(api_key="test-key")
+        urls = ["https://example.com/a", "not-a-url", "https://example.com/b"]
+        results = asyncio.run(generator.generate_slugs_batch(urls, max_concurrency=2))
+        
+        assert [r['url'] for r in results] == urls
+        assert results[0]['primary'] == "test-slug-generator"
+        assert "Invalid URL format" in results[1]['error']
+        assert results[2]['primary'] == "test-slug-generator"
+        assert mock_client.chat.completions.create.await_count == 2
+    
+    @patch('core.slug_generator.aiohttp', None)
+    @patch('core.slug_generator.extract_title_and_content')
+    @patch('openai.AsyncOpenAI')
+    def test_batch_respects_max_concurrency(self, mock_async_openai, mock_extract):
+        """No more than max_concurrency requests are in flight at once"""
+        in_flight = 0
+        peak = 0
+        
+        async def fake_create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return Mock(choices=[Mock(message=Mock(content='{"slugs": [{"slug": "test-slug-generator", "confidence": 0.9, "reasoning": "test"}]}'))])
+        
+        mock_client = Mock()
+        mock_async_openai.return_value = mock_client
+        mock_client.chat.completions.create = fake_create
+        mock_extract.return_value = ("Test Title", "Test content")
+        
+        generator = SlugGenerator(api_key="test-key")
+        urls = [f"https://example.com/{i}" for i in range(10)]
+        results = asyncio.run(generator.generate_slugs_batch(urls, max_concurrency=3))
+        
+        assert all('primary' in r for r in results)
+        assert peak == 3
+    
+    @patch('core.slug_generator.aiohttp', None)
+    @patch('core.slug_generator.extract_title_and_content')
+    @patch('openai.AsyncOpenAI')
+    def test_batch_bounds_page_fetches(self, mock_async_openai, mock_extract):
+        """Page fetches are bounded by max_concurrency instead of all starting at once"""
+        import threading
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def slow_extract(url):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return ("Test Title", "Test content")
+
+        mock_client = Mock()
+        mock_async_openai.return_value = mock_client
+        mock_client.chat.completions.create = AsyncMock(return_value=Mock(
+            choices=[Mock(message=Mock(content='{"slugs": [{"slug": "test-slug-generator", "confidence": 0.9, "reasoning": "test"}]}'))]
+        ))
+        mock_extract.side_effect = slow_extract
+
+        generator = SlugGenerator(api_key="test-key")
+        urls = [f"https://example.com/{i}" for i in range(10)]
+        results = asyncio.run(generator.generate_slugs_batch(urls, max_concurrency=3))
+
+        assert all('primary' in r for r in results)
+        assert peak <= 3
+
+    @patch('core.slug_generator.aiohttp', None)
+    @patch('core.slug_generator.extract_title_and_content')
+    @patch('openai.AsyncOpenAI')
+    def test_async_client_rebuilt_for_each_event_loop(self, mock_async_openai, mock_extract):
+        """A second asyncio.run gets a fresh client instead of one bound to the closed loop"""
+        clients = []
+
+        def make_client(**kwargs):
+            client = Mock()
+            client.chat.completions.create = AsyncMock(return_value=Mock(
+                choices=[Mock(message=Mock(content='{"slugs": [{"slug": "test-slug-generator", "confidence": 0.9, "reasoning": "test"}]}'))]
+            ))
+            clients.append(client)
+            return client
+
+        mock_async_openai.side_effect = make_client
+        mock_extract.return_value = ("Test Title", "Test content")
+
+        generator = SlugGenerator(api_key="test-key")
+        urls = ["https://example.com/a", "https://example.com/b"]
+        first = asyncio.run(generator.generate_slugs_batch(urls))
+        second = asyncio.run(generator.generate_slugs_batch(urls))
+
+        assert all('primary' in r for r in first + second)
+        assert len(clients) == 2
+        assert clients[0].chat.completions.create.await_count == 2
+        assert clients[1].chat.completions.create.await_count == 2
+
+    @patch('core.slug_generator.extract_title_and_content')
+    def test_async_extraction_parses_fetched_html(self, mock_extract):
+        """Pages fetched through the shared session are parsed without the blocking extractor"""
+        class FakeResponse:
+            headers = {'content-type': 'text/html; charset=utf-8'}
+            async def __aenter__(self):
+                return self
+            async def __aexit__(self, *exc):
+                return False
+            def raise_for_status(self):
+                pass
+            async def read(self):
+                return b"<html><title>UK Fashion Guide</title><body><nav>menu</nav><p>Shop UK brands</p></body></html>"
+        
+        session = Mock()
+        session.get.return_value = FakeResponse()
+        
+        generator = SlugGenerator(api_key="test-key")
+        title, content = asyncio.run(generator._extract_async("https://example.com/a", session))
+        
+        assert title == "UK Fashion Guide"
+        assert "Shop UK brands" in content
+        assert "menu" not in content
+        mock_extract.assert_not_called()
+    
+    @patch('openai.AsyncOpenAI')
+    def test_async_client_uses_tuned_connection_pool(self, mock_async_openai):
+        """AsyncOpenAI gets a dedicated httpx client instead of the SDK default pool"""
+        import httpx
+        
+        SlugGenerator(api_key="test-key")
+        
+        assert isinstance(mock_async_openai.call_args[1]['http_client'], httpx.AsyncClient)
+    
+    @patch('core.slug_generator.aiohttp', None)
+    def test_aiohttp_transport_requires_aiohttp(self):
+        """Opting into the aiohttp transport without aiohttp fails at construction"""
+        from core.exceptions import ConfigurationError
+        
+        with pytest.raises(ConfigurationError, match="aiohttp"):
+            SlugGenerator(api_key="test-key", use_aiohttp_transport=True)
+
+
+
+class TestBatchAPIGeneration:
+    """Test archive-scale slug generation through the OpenAI Batch API"""
+    
+    @patch('core.slug_generator.extract_title_and_content')
+    @patch('openai.OpenAI')
+    def test_submit_builds_jsonl_per_url(self, mock_openai, mock_extract):
+        """Each extracted URL becomes one chat completion line keyed by its index"""
+        mock_client = Mock()
+        mock_openai.return_value = mock_client
+        mock_client.files.create.return_value = Mock(id="file-123")
+        mock_client.batches.create.return_value = Mock(id="batch-456")
+        
+        def extract(url):
+            if url.endswith("/broken"):
+                raise Exception("Failed to connect")
+            return ("Title for " + url, "content")
+        mock_extract.side_effect = extract
+        
+        generator = SlugGenerator(api_key="test-key")
+        urls = ["https://example.com/a", "https://example.com/broken", "https://example.com/b",
+                "https://example.com/a"]
+        batch_id = generator.generate_slugs_via_batch(urls)
+        
+        assert batch_id == "batch-456"
+        _, payload = mock_client.files.create.call_args[1]['file']
+        lines = [json.loads(line) for line in payload.decode('utf-8').splitlines()]
+        # Duplicate URLs still get unique custom_ids
+        assert [line['custom_id'] for line in lines] == ["req-0", "req-2", "req-3"]
+        assert lines[0]['body']['response_format'] == {"type": "json_object"}
+        assert "https://example.com/broken" in generator.batch_extraction_errors
+        assert mock_client.batches.create.call_args[1]['completion_window'] == "24h"
+    
+    @patch('openai.OpenAI')
+    def test_collect_parses_output_and_errors(self, mock_openai):
+        """Completed batches map back to per-URL results in submission order"""
+        ok_line = json.dumps({
+            "custom_id": "req-1",
+            "response": {"status_code": 200, "body": {"choices": [{"message": {"content": '{"slugs": [{"slug": "test-slug-generator", "confidence": 0.9}]}'}}]}},
+            "error": None
+        })
+        error_line = json.dumps({
+            "custom_id": "req-0",
+            "response": None,
+            "error": {"message": "Request timed out"}
+        })
+        
+        mock_client = Mock()
+        mock_openai.return_value = mock_client
+        mock_client.batches.retrieve.return_value = Mock(status="completed", output_file_id="out-1", error_file_id="err-1")
+        mock_client.files.content.side_effect = lambda file_id: Mock(text=ok_line if file_id == "out-1" else error_line)
+        
+        generator = SlugGenerator(api_key="test-key")
+        generator._pending_batches["batch-456"] = {"req-0": "https://example.com/b", "req-1": "https://example.com/a"}
+        results = generator.collect_batch("batch-456", poll_interval=0)
+        
+        assert results[0] == {'url': 'https://example.com/b', 'error': 'Request timed out'}
+        assert results[1] == {'primary': 'test-slug-generator', 'alternatives': [], 'url': 'https://example.com/a'}
+        
+        # A batch submitted elsewhere maps back through the original URL list
+        other = SlugGenerator(api_key="test-key")
+        results = other.collect_batch("batch-456", poll_interval=0, urls=["https://example.com/x", "https://example.com/y"])
+        assert [r['url'] for r in results] == ["https://example.com/x", "https://example.com/y"]
+
+
+class TestResponseCache:
+    """Test the persistent exact-match response cache"""
+    
+    def _cached_config(self, tmp_path, temperature=0):
+        config = SlugGeneratorConfig()
+        config.CACHE_ENABLED = True
+        config.CACHE_DIR = str(tmp_path)
+        config.TEMPERATURE = temperature
+        return config
+    
+    @patch('openai.OpenAI')
+    def test_repeat_request_is_served_from_cache(self, mock_openai, tmp_path):
+        """Identical inputs at temperature 0 should hit the API only once"""
+        mock_client = Mock()
+        mock_openai.return_value = mock_client
+        mock_client.chat.completions.create.return_value = Mock(
+            choices=[Mock(message=Mock(content='{"slugs": [{"slug": "uk-fashion-guide", "confidence": 0.9, "reasoning": "test"}]}'))]
+        )
+        
+        first = SlugGenerator(api_key="test-key", config=self._cached_config(tmp_path))
+        first.generate_slug_from_content("Test Title", "Test content")
+        second = SlugGenerator(api_key="test-key", config=self._cached_config(tmp_path))
+        result = second.generate_slug_from_content("Test Title", "Test content")
+        
+        assert result['primary'] == "uk-fashion-guide"
+        assert mock_client.chat.completions.create.call_count == 1
+        
+        second.generate_slug_from_content("Test Title", "Other content")
+        assert mock_client.chat.completions.create.call_count == 2
+    
+    @patch('openai.OpenAI')
+    def test_cache_disabled_for_nonzero_temperature(self, mock_openai, tmp_path):
+        """Sampled output is not deterministic, so it must not be cached"""
+        generator = SlugGenerator(api_key="test-key", config=self._cached_config(tmp_path, temperature=0.3))
+        assert generator.cache is None
+
+
+class TestRateLimitedDispatcher:
+    """Test client-side RPM/TPM limiting for async requests"""
+    
+    def test_capacity_is_charged_per_request(self):
+        """Each launch consumes one request and its estimated tokens"""
+        dispatcher = RateLimitedDispatcher(max_requests_per_minute=10, max_tokens_per_minute=1000)
+        
+        async def request(value):
+            return value
+        
+        result = asyncio.run(dispatcher.submit(request, "ok", token_estimate=300))
+        
+        assert result == "ok"
+        assert dispatcher.available_request_capacity == pytest.approx(9, abs=0.01)
+        assert dispatcher.available_token_capacity == pytest.approx(700, abs=1)
+    
+    def test_rate_limit_pauses_then_retries(self):
+        """A 429 pauses new launches and the request is retried"""
+        dispatcher = RateLimitedDispatcher(
+            max_requests_per_minute=100, max_tokens_per_minute=10000,
+            max_attempts=3, rate_limit_pause=0.05
+        )
+        attempts = []
+        
+        async def request():
+            attempts.append(time.monotonic())
+            if len(attempts) == 1:
+                raise Exception("Error code: 429 - Rate limit reached")
+            return "recovered"
+        
+        result = asyncio.run(dispatcher.submit(request, token_estimate=10))
+        
+        assert result == "recovered"
+        assert len(attempts) == 2
+        assert attempts[1] - attempts[0] >= 0.05
+    
+    def test_gives_up_after_max_attempts(self):
+        """Persistent failures surface after the configured attempts"""
+        dispatcher = RateLimitedDispatcher(
+            max_requests_per_minute=100, max_tokens_per_minute=10000, max_attempts=2, retry_delay=0.01
+        )
+        
+        async def request():
+            raise Exception("API Error")
+        
+        with pytest.raises(Exception, match="Failed after 2 attempts"):
+            asyncio.run(dispatcher.submit(request))
+    
+    def test_transient_errors_back_off_exponentially(self):
+        """Non-rate-limit failures wait retry_delay * 2**attempt before retrying"""
+        dispatcher = RateLimitedDispatcher(
+            max_requests_per_minute=1000, max_tokens_per_minute=10000, max_attempts=3, retry_delay=0.05
+        )
+        attempts = []
+        
+        async def request():
+            attempts.append(time.monotonic())
+            if len(attempts) < 3:
+                raise Exception("Error code: 503 - Service unavailable")
+            return "recovered"
+        
+        result = asyncio.run(dispatcher.submit(request))
+        
+        assert result == "recovered"
+        assert attempts[1] - attempts[0] >= 0.05
+        assert attempts[2] - attempts[1] >= 0.1
+
+    
+    def test_empty_bucket_waits_for_exact_refill(self):
+        """An empty request bucket is waited out with one sleep sized to the refill rate"""
+        dispatcher = RateLimitedDispatcher(max_requests_per_minute=600, max_tokens_per_minute=10000)
+        dispatcher.available_request_capacity = 0
+        real_sleep = asyncio.sleep
+        waits = []
+        
+        async def sleep(delay):
+            waits.append(delay)
+            await real_sleep(delay)
+        
+        async def request():
+            return "ok"
+        
+        with patch('core.slug_generator.asyncio.sleep', sleep):
+            result = asyncio.run(dispatcher.submit(request, token_estimate=10))
+        
+        # One request refills in 0.1s at 600 RPM; at most one follow-up for clock rounding
+        assert result == "ok"
+        assert 1 <= len(waits) <= 2
+        assert waits[0] == pytest.approx(0.1, abs=0.01)
+    
+    def test_bad_request_and_auth_errors_fail_fast(self):
+        """400 and 401 responses are raised without retrying"""
+        for message in ("OpenAI API error 400: invalid request", "OpenAI API error 401: invalid key"):
+            dispatcher = RateLimitedDispatcher(
+                max_requests_per_minute=100, max_tokens_per_minute=10000, max_attempts=3, retry_delay=0.01
+            )
+            attempts = []
+            
+            async def request():
+                attempts.append(1)
+                raise Exception(message)
+            
+            with pytest.raises(Exception, match=message):
+                asyncio.run(dispatcher.submit(request))
+            assert len(attempts) == 1
+
 if __name__ == "__main__":
     # Run tests with verbose output
     pytest.main([__file__, "-v", "-s"])
\ No newline at end of file
@@ -17,7 +17,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
 
 from evaluation.improvement.prompt_optimizer import PromptOptimizer
 from evaluation.improvement.weakness_analyzer import WeaknessAnalyzer  
-from evaluation.improvement.iteration_pipeline import IterationPipeline
+from evaluation.improvement.iteration_pipeline import IterationPipeline, PipelineThresholds, tune_breakthrough_thresholds
 from evaluation.integration.ab_testing_bridge import ABTestingBridge
 
 
@@ -95,6 +95,52 @@ class TestPromptOptimizer:
         rationale = improvements['rationale']
         assert 'brand' in rationale.lower() or 'cultural' in rationale.lower()
 
+    def test_streamed_improvements_stop_at_end_of_json(self):
+        """Test improvement responses are read only up to the end of the JSON object"""
+        
+        content = json.dumps({
+            'enhanced_prompt': 'Generate SEO slugs with relaxed constraints ' + 'x' * 200,
+            'key_changes': ['relaxed_constraints', 'enhanced_brand_detection'],
+            'rationale': 'Addresses brand and constraint failures',
+            'expected_improvements': ['Higher success rate']
+        })
+        # JSON mode may pad the object with whitespace
+        stream = ChunkStream([content[i:i + 40] for i in range(0, len(content), 40)] + ['\n'] * 50)
+        self.optimizer.client = Mock()
+        self.optimizer.client.chat.completions.create.return_value = stream
+        
+        improvements = self.optimizer.generate_improvements("Current prompt", self.mock_evaluation_results, "v9")
+        
+        assert self.optimizer.client.chat.completions.create.call_args.kwargs['stream'] is True
+        assert stream.closed
+        assert stream.consumed < len(stream.pieces)
+        assert improvements['key_changes'] == ['relaxed_constraints', 'enhanced_brand_detection']
+        assert 'api_error' not in improvements
+
+    def test_cached_improvements_skip_api(self):
+        """Test repeated improvement requests are served from the response cache"""
+        
+        content = json.dumps({
+            'enhanced_prompt': 'Generate SEO slugs with relaxed constraints',
+            'key_changes': ['relaxed_constraints'],
+            'rationale': 'Addresses constraint failures',
+            'expected_improvements': ['Higher success rate']
+        })
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            optimizer = PromptOptimizer(api_key="test-key", cache_dir=cache_dir)
+            optimizer.client = Mock()
+            optimizer.client.chat.completions.create.side_effect = lambda **kwargs: ChunkStream([content])
+            
+            first = optimizer.generate_improvements("Current prompt", self.mock_evaluation_results, "v9")
+            second = optimizer.generate_improvements("Current prompt", self.mock_evaluation_results, "v9")
+            assert optimizer.client.chat.completions.create.call_count == 1
+            assert second == first
+            
+            optimizer.generate_improvements("Current prompt", self.mock_evaluation_results, "v10")
+            optimizer.generate_improvements("Current prompt", self.mock_evaluation_results, "v9", bypass_cache=True)
+            assert optimizer.client.chat.completions.create.call_count == 3
+
     def test_validate_improvement_suggestions(self):
         """Test validation of proposed improvements against known cases"""
         
@@ -221,6 +267,39 @@ class TestWeaknessAnalyzer:
         assert expected_metrics['success_rate'] >= 0.9
 
 
+def _chunk(content):
+    """Streamed chat completion chunk carrying content"""
+    return Mock(choices=[Mock(delta=Mock(content=content))])
+
+
+class ChunkStream:
+    """Minimal synchronous completion stream over content pieces"""
+    
+    def __init__(self, pieces):
+        self.pieces = pieces
+        self.consumed = 0
+        self.closed = False
+    
+    def __iter__(self):
+        for piece in self.pieces:
+            self.consumed += 1
+            yield _chunk(piece)
+    
+    def close(self):
+        self.closed = True
+
+
+class AsyncChunkStream(ChunkStream):
+    """Minimal asynchronous completion stream over content pieces"""
+    
+    async def __aiter__(self):
+        for chunk in ChunkStream.__iter__(self):
+            yield chunk
+    
+    async def close(self):
+        self.closed = True
+
+
 class TestIterationPipeline:
     """Test automated improvement cycle orchestration"""
     
@@ -333,6 +412,139 @@ class TestIterationPipeline:
         mitigations = regression_analysis['mitigation_strategies']
         assert len(mitigations) > 0
 
+    def test_analysis_phase_is_cached_per_state(self):
+        """Test repeated analysis of one state reuses the first result until the cache is cleared"""
+        
+        current_state = {'performance_metrics': {'success_rate': 0.9}, 'known_failures': ['Complex multi-brand title']}
+        
+        with patch.object(self.pipeline.analyzer, 'analyze_failure_cases',
+                          wraps=self.pipeline.analyzer.analyze_failure_cases) as analyze:
+            first = self.pipeline._run_analysis_phase(current_state)
+            second = self.pipeline._run_analysis_phase(dict(current_state))
+            assert analyze.call_count == 1
+        
+            self.pipeline._run_analysis_phase({**current_state, 'known_failures': []})
+            assert analyze.call_count == 2
+        
+            self.pipeline.clear_analysis_cache()
+            self.pipeline._run_analysis_phase(current_state)
+            assert analyze.call_count == 3
+        
+        assert first == second
+        first['weakness_areas'].append('mutated')
+        assert 'mutated' not in self.pipeline._run_analysis_phase(current_state)['weakness_areas']
+
+    def test_batch_detection_matches_single_scenarios(self):
+        """Test batch breakthrough and risk entry points match per-item results in order"""
+        
+        scenarios = [
+            {
+                'current_performance': {'success_rate': 0.9, 'persistent_failures': failures},
+                'proposed_improvements': {'constraint_relaxation': failures > 1,
+                                          'predicted_success_rate': 0.9 + failures * 0.05,
+                                          'predicted_failure_resolution': 2}
+            }
+            for failures in range(5)
+        ]
+        proposals = [
+            {'changes': ['major_prompt_rewrite'] * n, 'predicted_impact': {'success_rate': 0.6 + n * 0.1}}
+            for n in range(5)
+        ]
+        
+        assert self.pipeline.detect_breakthrough_potential_batch(scenarios) == [
+            self.pipeline.detect_breakthrough_potential(scenario) for scenario in scenarios
+        ]
+        assert self.pipeline.assess_regression_risk_batch(proposals) == [
+            self.pipeline.assess_regression_risk(proposal) for proposal in proposals
+        ]
+
+    def test_batch_recommendations_match_single_decisions(self):
+        """Test batch recommended actions match the per-cycle recommendation"""
+        
+        predictions = [
+            (success, confidence, risk)
+            for success in (0.5, 0.7, 0.81, 0.95)
+            for confidence in (0.6, 0.65, 0.75)
+            for risk in ('low', 'medium', 'high')
+        ]
+        
+        actions = self.pipeline.recommend_actions_batch(predictions)
+        
+        assert actions == [
+            self.pipeline._generate_recommendation({}, {}, {
+                'success_prediction': success,
+                'confidence': confidence,
+                'risk_assessment': {'regression_risk': risk}
+            }, [])['action']
+            for success, confidence, risk in predictions
+        ]
+        assert actions[predictions.index((0.95, 0.75, 'medium'))] == 'deploy'
+        assert actions[predictions.index((0.95, 0.75, 'high'))] == 'test_further'
+        assert actions[predictions.index((0.5, 0.75, 'low'))] == 'iterate'
+
+    def test_tuned_thresholds_round_trip_and_apply(self):
+        """Test tuned thresholds fit labeled scenarios, save, and drive detection when loaded"""
+        
+        def scenario(gain):
+            return {
+                'current_performance': {'success_rate': 0.6, 'persistent_failures': 4},
+                'proposed_improvements': {'predicted_success_rate': 0.6 + gain, 'predicted_failure_resolution': 0}
+            }
+        
+        # Gains of 0.1 were historically breakthroughs, which the default 0.15 misses
+        labeled = [(scenario(0.1), True), (scenario(0.12), True), (scenario(0.02), False)]
+        tuned = tune_breakthrough_thresholds(labeled)
+        assert tuned.success_delta < 0.1
+        assert (tuned.deploy_sp, tuned.deploy_cf) == (PipelineThresholds().deploy_sp, PipelineThresholds().deploy_cf)
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'thresholds.json')
+            tuned.to_file(path)
+            pipeline = IterationPipeline(api_key="test-key", thresholds=PipelineThresholds.from_file(path))
+        
+        assert pipeline.thresholds == tuned
+        assert 'significant_success_rate_improvement' in pipeline.detect_breakthrough_potential(scenario(0.1))['breakthrough_indicators']
+        assert 'significant_success_rate_improvement' not in self.pipeline.detect_breakthrough_potential(scenario(0.1))['breakthrough_indicators']
+
+    @patch('evaluation.improvement.iteration_pipeline.AsyncOpenAI')
+    def test_iteration_cycles_run_concurrently_in_order(self, mock_async_openai):
+        """Test several iteration cycles share one client with bounded concurrent improvement requests"""
+        
+        import asyncio
+        
+        in_flight = 0
+        max_in_flight = 0
+        
+        async def create(**request):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            target = request['messages'][1]['content'].split('TARGET VERSION: ')[1].split()[0]
+            content = json.dumps({
+                'enhanced_prompt': f'{target} prompt ' + 'x' * 200,
+                'key_changes': ['relaxed_constraints', 'enhanced_brand_detection'],
+                'rationale': 'Addresses constraint failures',
+                'expected_improvements': ['Higher success rate']
+            })
+            return AsyncChunkStream([content[i:i + 50] for i in range(0, len(content), 50)])
+        
+        client = Mock()
+        client.chat.completions.create = create
+        mock_async_openai.return_value.__aenter__ = Mock(return_value=asyncio.sleep(0, client))
+        mock_async_openai.return_value.__aexit__ = Mock(return_value=asyncio.sleep(0, False))
+        
+        current_state = {'performance_metrics': {'success_rate': 0.9}, 'known_failures': ['Complex multi-brand title']}
+        cycles = [(current_state, f'v{i}', ['solve_constraint_failures']) for i in range(9, 14)]
+        results = self.pipeline.run_iteration_cycles(cycles, concurrency=2)
+        
+        assert max_in_flight == 2
+        assert [r['iteration_metadata']['target_version'] for r in results] == ['v9', 'v10', 'v11', 'v12', 'v13']
+        assert all(r['improvement_phase']['enhanced_prompt'].startswith(r['iteration_metadata']['target_version'])
+                   for r in results)
+        assert 'relaxed_constraints' in results[0]['improvement_phase']['proposed_changes']
+
 
 class TestABTestingBridge:
     """Test integration with existing A/B testing framework"""
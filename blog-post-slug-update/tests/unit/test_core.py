@@ -14,12 +14,15 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
 # Import modules from new structure
 try:
-    from core import SlugGenerator, fetch_url_content, is_url
+    from core import SlugGenerator, fetch_url_content, is_url, check_slug, clean_slug, validate_slug
 except ImportError:
     # Modules don't exist yet - this is expected during test-first development
     SlugGenerator = None
     fetch_url_content = None
     is_url = None
+    check_slug = None
+    clean_slug = None
+    validate_slug = None
 
 
 class TestSlugGenerator(unittest.TestCase):
@@ -187,6 +190,39 @@ class TestSlugValidation(unittest.TestCase):
                 self.skipTest("SlugGenerator not available")
         except Exception as e:
             self.skipTest(f"SlugGenerator validation not working: {e}")
+    
+    def test_clean_slug_collapses_separator_runs(self):
+        """Test that each run of separators becomes exactly one hyphen"""
+        if not clean_slug:
+            self.skipTest("clean_slug function not available")
+        
+        self.assertEqual(clean_slug('a!!!b'), 'a-b')
+        self.assertEqual(clean_slug('a - -- b'), 'a-b')
+        self.assertEqual(clean_slug('--UK Fashion: Guide!--'), 'uk-fashion-guide')
+    
+    def test_validate_slug_rejects_oversized_input_on_length(self):
+        """Test that inputs far over the character limit fail without a full scan"""
+        if not validate_slug:
+            self.skipTest("validate_slug function not available")
+        
+        result = validate_slug('a-' * 500000)
+        
+        self.assertFalse(result['is_valid'])
+        self.assertEqual(len(result['reasons']), 1)
+        self.assertIn("Too many characters", result['reasons'][0])
+    
+    def test_check_slug_matches_validate_slug(self):
+        """Test that the dataclass result carries the same data as the dict result"""
+        if not check_slug:
+            self.skipTest("check_slug function not available")
+        
+        for slug in ['uk-fashion-guide', '', 'Bad--Slug-', 'one']:
+            result = check_slug(slug)
+            self.assertEqual(result.to_dict(), validate_slug(slug))
+        
+        result = check_slug('Bad--Slug-')
+        self.assertFalse(result.is_valid)
+        self.assertIn("Contains consecutive hyphens", result.reasons)
 
 
 class TestErrorHandling(unittest.TestCase):
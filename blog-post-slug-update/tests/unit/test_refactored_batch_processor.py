@@ -294,6 +294,38 @@ class TestRefactoredBatchProcessor(unittest.TestCase):
             for result in results:
                 self.assertTrue(result.success)
 
+    @unittest.skipIf(RefactoredBatchProcessor is None, "RefactoredBatchProcessor not implemented yet")
+    def test_owned_progress_tracker_closed_on_failure(self):
+        """TEST: A tracker created for the run is closed even when processing raises"""
+        processor = RefactoredBatchProcessor(self.output_dir)
+
+        with patch.object(processor.strategy, '_save_checkpoint') as mock_checkpoint:
+            mock_checkpoint.side_effect = Exception("Simulated checkpoint failure")
+
+            processor.process_urls(self.sample_urls)
+
+        # Writer thread stopped and the closed tracker is no longer offered for reuse
+        self.assertIsNone(processor.progress_tracker._writer_thread)
+        self.assertNotIn('progress_tracker', processor.context.components)
+        self.assertNotIn('progress_tracker', processor.processing_context.components)
+
+        with open(os.path.join(self.output_dir, 'live_progress.json'), 'r') as f:
+            self.assertEqual(json.load(f)['processed'], 1)
+
+    @unittest.skipIf(RefactoredBatchProcessor is None, "RefactoredBatchProcessor not implemented yet")
+    def test_injected_progress_tracker_left_open(self):
+        """TEST: A caller-supplied tracker stays open and registered after processing"""
+        processor = RefactoredBatchProcessor(self.output_dir)
+        tracker = Mock()
+        processor.context.components['progress_tracker'] = tracker
+        processor.processing_context.components['progress_tracker'] = tracker
+
+        processor.process_urls(self.sample_urls)
+
+        self.assertEqual(tracker.update_progress.call_count, len(self.sample_urls))
+        tracker.close.assert_not_called()
+        self.assertIs(processor.processing_context.components['progress_tracker'], tracker)
+
 
 class TestBatchProcessingContext(unittest.TestCase):
     """Test suite for BatchProcessingContext - TDD approach"""
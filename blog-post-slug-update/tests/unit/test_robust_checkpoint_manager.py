@@ -200,6 +200,39 @@ class TestRobustCheckpointManager(unittest.TestCase):
             self.assertEqual(loaded_data['resume_index'], 500)
             self.assertTrue(loaded_data['metadata']['backup_test'])
     
+    @unittest.skipIf(RobustCheckpointManager is None, "RobustCheckpointManager not implemented yet")
+    def test_backup_recovery_defers_main_rewrite_to_next_save(self):
+        """TEST: Backup recovery does not rewrite main; next save heals it and keeps backup"""
+        manager = RobustCheckpointManager(self.test_dir)
+
+        base = {
+            'version': 'v1.0',
+            'processed_count': 0,
+            'failed_count': 0,
+            'timestamp': time.time(),
+            'metadata': {}
+        }
+        manager.save_checkpoint({**base, 'resume_index': 100})
+        manager.save_checkpoint({**base, 'resume_index': 200})
+
+        # Schema-invalid main checkpoint forces backup recovery
+        with open(self.checkpoint_file, 'w') as f:
+            json.dump({'version': 'v1.0'}, f)
+
+        loaded_data = manager.load_checkpoint()
+        self.assertEqual(loaded_data['resume_index'], 100)
+
+        # Main file is left alone until the next save
+        with open(self.checkpoint_file) as f:
+            self.assertEqual(json.load(f), {'version': 'v1.0'})
+
+        self.assertTrue(manager.save_checkpoint({**base, 'resume_index': 300}))
+        self.assertEqual(manager.load_checkpoint()['resume_index'], 300)
+
+        # Corrupt main must not have overwritten the good backup
+        with open(f"{self.checkpoint_file}.backup") as f:
+            self.assertEqual(json.load(f)['resume_index'], 100)
+
     @unittest.skipIf(RobustCheckpointManager is None, "RobustCheckpointManager not implemented yet")
     def test_no_checkpoint_file_returns_none(self):
         """TEST: Loading non-existent checkpoint returns None gracefully"""
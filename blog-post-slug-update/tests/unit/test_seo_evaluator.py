@@ -15,7 +15,8 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
 
 from evaluation.core.seo_evaluator import SEOEvaluator
-from evaluation.core.feedback_extractor import FeedbackExtractor
+from evaluation.core.rate_limited_evaluator import AsyncRateLimitedEvaluator
+from evaluation.core.feedback_extractor import FeedbackExtractor, IMPROVEMENT_MAX_TOKENS
 from evaluation.validation.ground_truth_validator import GroundTruthValidator
 
 
@@ -190,12 +191,316 @@ class TestSEOEvaluator:
         assert good_result['overall_score'] > bad_result['overall_score']
 
 
+    @patch('evaluation.core.seo_evaluator.AsyncOpenAI')
+    def test_evaluate_batch_runs_concurrently_in_order(self, mock_async_openai):
+        """Test batch evaluation bounds concurrency and keeps input order"""
+        
+        import asyncio
+        
+        state = {'in_flight': 0, 'peak': 0}
+        
+        async def create(**request):
+            state['in_flight'] += 1
+            state['peak'] = max(state['peak'], state['in_flight'])
+            await asyncio.sleep(0.01)
+            state['in_flight'] -= 1
+            slug = request['messages'][1]['content']
+            score = 0.9 if 'brand-0' in slug else 0.2
+            body = {'dimension_scores': {}, 'overall_score': score, 'qualitative_feedback': 'x' * 60, 'confidence': 0.8}
+            return Mock(choices=[Mock(message=Mock(content=json.dumps(body)))])
+        
+        client = Mock()
+        client.chat.completions.create = create
+        mock_async_openai.return_value.__aenter__ = Mock(return_value=asyncio.sleep(0, client))
+        mock_async_openai.return_value.__aexit__ = Mock(return_value=asyncio.sleep(0, False))
+        
+        items = [(f'brand-{i}-guide', 'Title', 'Content') for i in range(6)]
+        results = self.evaluator.evaluate_batch_sync(items, concurrency=2)
+        
+        assert len(results) == 6
+        assert results[0]['overall_score'] == 0.9
+        assert all(result['overall_score'] == 0.2 for result in results[1:])
+        assert state['peak'] == 2
+
+    def test_batch_api_round_trip_classifies_failed_rows(self):
+        """Test Batch API submission maps rows back by custom_id and only retries transient failures"""
+        
+        items = [(f'brand-{i}-guide', 'Title', 'Content') for i in range(3)]
+        body = {'dimension_scores': {}, 'overall_score': 0.8, 'qualitative_feedback': 'x' * 60, 'confidence': 0.9}
+        output = json.dumps({
+            'custom_id': 'slug-0',
+            'response': {'status_code': 200, 'body': {'choices': [{'message': {'content': json.dumps(body)}}]}}
+        })
+        errors = '\n'.join([
+            json.dumps({'custom_id': 'slug-1', 'response': {'status_code': 429, 'body': {'error': {'message': 'Rate limit reached'}}}}),
+            json.dumps({'custom_id': 'slug-2', 'response': {'status_code': 401, 'body': {'error': {'message': 'Incorrect API key provided'}}}})
+        ])
+        
+        client = Mock()
+        client.files.create.return_value = Mock(id='file-in')
+        client.batches.create.return_value = Mock(id='batch-1')
+        client.batches.retrieve.side_effect = [
+            Mock(status='in_progress'),
+            Mock(status='completed', output_file_id='file-out', error_file_id='file-err')
+        ]
+        client.files.content.side_effect = lambda file_id: Mock(text=output if file_id == 'file-out' else errors)
+        self.evaluator.client = client
+        
+        batch_id = self.evaluator.submit_batch(items)
+        assert self.evaluator.poll_batch(batch_id) is None
+        results = self.evaluator.poll_batch(batch_id)
+        
+        assert results['slug-0']['overall_score'] == 0.8
+        assert results['slug-1']['error_type'] == 'APIRateLimitError'
+        assert results['slug-2']['error_type'] == 'InvalidAPIKeyError'
+        assert self.evaluator.retryable_batch_items(results, items) == [items[1]]
+
+    def test_evaluation_cache_skips_repeat_requests(self, tmp_path):
+        """Test identical evaluations are served from the persistent cache across instances"""
+        
+        body = {'dimension_scores': {}, 'overall_score': 0.8, 'qualitative_feedback': 'x' * 60, 'confidence': 0.9}
+        evaluator = SEOEvaluator(api_key="test-key", cache_dir=str(tmp_path))
+        evaluator.client = Mock()
+        evaluator.client.chat.completions.create.return_value = Mock(choices=[Mock(message=Mock(content=json.dumps(body)))])
+        
+        first = evaluator.evaluate_slug('jojo-maman-bebe-guide', 'Title', 'Content')
+        
+        second_evaluator = SEOEvaluator(api_key="test-key", cache_dir=str(tmp_path))
+        second_evaluator.client = Mock()
+        second = second_evaluator.evaluate_slug('jojo-maman-bebe-guide', 'Title', 'Content')
+        
+        assert evaluator.client.chat.completions.create.call_count == 1
+        second_evaluator.client.chat.completions.create.assert_not_called()
+        assert first == second
+
+    def test_parallel_dimension_evaluation_isolates_failures(self):
+        """Test per-dimension calls retry independently and a failed dimension gets the neutral score"""
+        
+        import asyncio
+        from evaluation.utils.retry_logic import RetryConfig
+        
+        evaluator = SEOEvaluator(api_key="test-key", retry_config=RetryConfig(max_retries=1, base_delay=0.0))
+        flaky, broken = evaluator.scoring_dimensions[0], evaluator.scoring_dimensions[-1]
+        attempts = {}
+        
+        async def create(**request):
+            prompt = request['messages'][1]['content']
+            if 'DIMENSION:' not in prompt:
+                body = {'qualitative_feedback': 'Strong brand-first slug. ' * 3, 'confidence': 0.85}
+            else:
+                dimension = prompt.split('DIMENSION: ')[1].split('\n')[0]
+                attempts[dimension] = attempts.get(dimension, 0) + 1
+                if dimension == broken or (dimension == flaky and attempts[dimension] == 1):
+                    raise ConnectionError('connection reset')
+                body = {'score': 0.9, 'rationale': f'{dimension} looks good'}
+            return Mock(choices=[Mock(message=Mock(content=json.dumps(body)))])
+        
+        client = Mock()
+        client.chat.completions.create = create
+        
+        result = asyncio.run(evaluator.evaluate_slug_parallel_dims('jojo-maman-bebe-guide', 'Title', 'Content', client))
+        
+        assert attempts[flaky] == 2
+        assert result['dimension_scores'][flaky] == 0.9
+        assert result['dimension_scores'][broken] == 0.5
+        assert broken not in result['dimension_rationales']
+        assert result['confidence'] == 0.85
+        assert set(result['dimension_scores']) == set(evaluator.scoring_dimensions)
+
+    @patch('evaluation.core.seo_evaluator.AsyncOpenAI')
+    def test_marshaled_evaluation_maps_rows_by_id(self, mock_async_openai):
+        """Test several slugs share one request and rows map back by id, with fallbacks for missing rows"""
+        
+        import asyncio
+        
+        requests = []
+        
+        async def create(**request):
+            requests.append(request)
+            rows = json.loads(request['messages'][1]['content'].split('\n\n')[1])
+            # Answer out of order and drop the last row
+            results = [
+                {'id': row['id'], 'dimension_scores': {}, 'overall_score': 0.5 + row['id'] / 10,
+                 'qualitative_feedback': 'x' * 60, 'confidence': 0.8}
+                for row in reversed(rows[:-1])
+            ]
+            return Mock(choices=[Mock(message=Mock(content=json.dumps({'results': results})))])
+        
+        client = Mock()
+        client.chat.completions.create = create
+        mock_async_openai.return_value.__aenter__ = Mock(return_value=asyncio.sleep(0, client))
+        mock_async_openai.return_value.__aexit__ = Mock(return_value=asyncio.sleep(0, False))
+        
+        items = [(f'brand-{i}-guide', 'Title', 'Content') for i in range(5)]
+        results = self.evaluator.evaluate_slugs_marshaled(items, rows_per_call=3)
+        
+        assert len(requests) == 2
+        assert [round(r['overall_score'], 2) for r in results[:2]] == [0.5, 0.6]
+        assert 'api_error' in results[2]
+        assert round(results[3]['overall_score'], 2) == 0.5
+        assert 'api_error' in results[4]
+
+    def test_scores_only_stream_closes_after_dimension_scores(self):
+        """Test a scores-only streamed evaluation stops reading once dimension_scores is complete"""
+        
+        dims = self.evaluator.scoring_dimensions
+        body = json.dumps({
+            'dimension_scores': {dim: 0.8 for dim in dims},
+            'overall_score': 0.8,
+            'qualitative_feedback': 'x' * 60,
+            'confidence': 0.9
+        })
+        pieces = [body[i:i + 7] for i in range(0, len(body), 7)]
+        consumed = []
+        
+        def chunks():
+            for piece in pieces:
+                consumed.append(piece)
+                yield Mock(choices=[Mock(delta=Mock(content=piece))])
+        
+        stream = Mock()
+        stream.__iter__ = Mock(side_effect=chunks)
+        self.evaluator.client = Mock()
+        self.evaluator.client.chat.completions.create.return_value = stream
+        
+        result = self.evaluator.evaluate_slug_stream('a-b', 'Title', 'Content', scores_only=True)
+        
+        stream.close.assert_called_once()
+        assert len(consumed) < len(pieces)
+        assert result['dimension_scores'] == {dim: 0.8 for dim in dims}
+        assert round(result['overall_score'], 2) == 0.8
+        
+        result = self.evaluator.evaluate_slug_stream('a-b', 'Title', 'Content')
+        
+        assert len(consumed) > len(pieces)
+        assert result['confidence'] == 0.9
+
+    def test_content_preview_is_cut_by_tokens_when_tiktoken_is_available(self):
+        """Test content previews are cut at a token count with tiktoken and a character count without"""
+        
+        from evaluation.core import seo_evaluator
+        from evaluation.utils import tokens
+        
+        content = 'word ' * 400
+        with patch.object(tokens, 'tiktoken', None):
+            tokens.get_encoding.cache_clear()
+            assert self.evaluator._truncate_content(content) == content[:seo_evaluator.CONTENT_PREVIEW_CHARS] + '...'
+        
+        # One token per word
+        encoding = Mock()
+        encoding.encode = lambda text: text.split()
+        encoding.decode = lambda tokens: ' '.join(tokens)
+        try:
+            with patch.object(tokens, 'tiktoken') as mock_tiktoken:
+                mock_tiktoken.encoding_for_model.return_value = encoding
+                tokens.get_encoding.cache_clear()
+                preview = self.evaluator._truncate_content(content)
+                short = self.evaluator._truncate_content('a few words')
+        finally:
+            tokens.get_encoding.cache_clear()
+        
+        assert preview.count('word') == seo_evaluator.CONTENT_PREVIEW_TOKENS
+        assert preview.endswith('...')
+        assert short == 'a few words'
+
+    def test_complete_evaluation_skips_field_repair(self):
+        """Test schema-complete results are only clamped, while incomplete ones are filled in"""
+        
+        dims = self.evaluator.scoring_dimensions
+        complete = {
+            'dimension_scores': {dim: 1.5 for dim in dims},
+            'overall_score': 0.8,
+            'qualitative_feedback': 'x' * 60,
+            'confidence': 0.9
+        }
+        
+        with patch.object(SEOEvaluator, '_generate_basic_feedback') as generate:
+            result = self.evaluator._validate_evaluation_result(complete, 'a-b', 'Title', 'Content')
+            generate.assert_not_called()
+        assert result['dimension_scores'] == {dim: 1.0 for dim in dims}
+        
+        partial = {'dimension_scores': {dims[0]: 0.9}, 'qualitative_feedback': 'short'}
+        result = self.evaluator._validate_evaluation_result(partial, 'a-b', 'Title', 'Content')
+        assert result['dimension_scores'][dims[-1]] == 0.5
+        assert result['confidence'] == 0.7
+        assert len(result['qualitative_feedback']) >= 50
+
+
+class TestAsyncRateLimitedEvaluator:
+    """Test quota-aware dispatch of evaluation requests"""
+    
+    @patch('evaluation.core.rate_limited_evaluator.AsyncOpenAI')
+    def test_rate_limited_requests_are_retried(self, mock_async_openai):
+        """Test 429s are retried with backoff and results come back in input order"""
+        
+        import asyncio
+        import httpx
+        from openai import RateLimitError
+        
+        calls = []
+        
+        async def create(**request):
+            prompt = request['messages'][1]['content']
+            calls.append(prompt)
+            if 'brand-1-guide' in prompt and sum('brand-1-guide' in c for c in calls) == 1:
+                raise RateLimitError(
+                    'Rate limit reached',
+                    response=httpx.Response(429, request=httpx.Request('POST', 'https://api.openai.com/v1/chat/completions')),
+                    body=None
+                )
+            score = 0.9 if 'brand-1-guide' in prompt else 0.4
+            body = {'dimension_scores': {}, 'overall_score': score, 'qualitative_feedback': 'x' * 60, 'confidence': 0.8}
+            return Mock(choices=[Mock(message=Mock(content=json.dumps(body)))])
+        
+        client = Mock()
+        client.chat.completions.create = create
+        mock_async_openai.return_value.__aenter__ = Mock(return_value=asyncio.sleep(0, client))
+        mock_async_openai.return_value.__aexit__ = Mock(return_value=asyncio.sleep(0, False))
+        
+        dispatcher = AsyncRateLimitedEvaluator(SEOEvaluator(api_key="test-key"), base_delay=0.01)
+        items = [(f'brand-{i}-guide', 'Title', 'Content') for i in range(4)]
+        results = dispatcher.evaluate_all_sync(items)
+        
+        assert len(calls) == 5
+        assert results[1]['overall_score'] == 0.9
+        assert all(results[i]['overall_score'] == 0.4 for i in (0, 2, 3))
+        assert dispatcher.available_request_capacity < dispatcher.max_rpm
+
+    def test_empty_bucket_is_waited_out_without_polling(self):
+        """Test the dispatcher sleeps until capacity refills instead of polling the loop"""
+        
+        import asyncio
+        
+        dispatcher = AsyncRateLimitedEvaluator(SEOEvaluator(api_key="test-key"), max_rpm=600)
+        dispatcher.available_request_capacity = 0
+        
+        real_sleep = asyncio.sleep
+        waits = []
+        
+        async def sleep(delay):
+            waits.append(delay)
+            await real_sleep(delay)
+        
+        with patch('evaluation.core.rate_limited_evaluator.asyncio.sleep', sleep):
+            asyncio.run(dispatcher._reserve_capacity(100))
+        
+        # One request refills in 0.1s at 600 RPM; at most one follow-up for clock rounding
+        assert 1 <= len(waits) <= 2
+        assert waits[0] == pytest.approx(0.1, abs=0.01)
+        assert dispatcher.available_request_capacity < 1
+
+
 class TestFeedbackExtractor:
     """Test qualitative feedback extraction system"""
     
     def setup_method(self):
         self.extractor = FeedbackExtractor(api_key="test-key")
     
+    @staticmethod
+    def _completion_response(content, finish_reason='stop'):
+        """Chat completion response as returned by the OpenAI client"""
+        return Mock(choices=[Mock(finish_reason=finish_reason, message=Mock(content=content))])
+    
     def test_extract_improvement_suggestions(self):
         """Test extraction of actionable improvement suggestions"""
         
@@ -246,6 +551,169 @@ class TestFeedbackExtractor:
         feedback_text = str(feedback).lower()
         assert 'ichiban' in feedback_text or 'cultural' in feedback_text
 
+    def test_improvement_suggestions_batch_uses_batch_api(self):
+        """Test batched extraction submits one Batch API job and maps results back by custom_id"""
+        
+        comparisons = [
+            {'slug_a': f'slug-a-{i}', 'slug_b': f'slug-b-{i}', 'winner': 'slug_b'}
+            for i in range(8)
+        ]
+        body = {'strengths': ['brand'], 'weaknesses': [], 'specific_improvements': ['a', 'b'], 'pattern_insights': []}
+        output_lines = [
+            json.dumps({
+                'custom_id': f'imp-{i}',
+                'response': {'status_code': 200, 'body': {'choices': [{'message': {'content': json.dumps(body)}}]}}
+            })
+            for i in range(7)  # imp-7 has no output and should fall back
+        ]
+        
+        client = Mock()
+        client.files.create.return_value = Mock(id='file-in')
+        client.batches.create.return_value = Mock(id='batch-1', status='completed', output_file_id='file-out')
+        client.files.content.return_value = Mock(text='\n'.join(output_lines))
+        self.extractor.client = client
+        
+        results = self.extractor.extract_improvement_suggestions_batch(comparisons)
+        
+        assert client.batches.create.call_count == 1
+        client.chat.completions.create.assert_not_called()
+        assert len(results) == 8
+        assert results[0]['strengths'] == ['brand']
+        assert 'api_error' in results[7]
+
+    @patch('evaluation.core.feedback_extractor.BATCH_TOKEN_BUDGET', 1000)
+    def test_batch_is_split_by_token_budget(self):
+        """Test large batches are packed into several jobs that are all created before polling"""
+        
+        comparisons = [
+            {'slug_a': f'slug-a-{i}', 'slug_b': f'slug-b-{i}', 'content': 'x' * 300 * (i % 2), 'winner': 'slug_b'}
+            for i in range(8)
+        ]
+        
+        client = Mock()
+        client.files.create.return_value = Mock(id='file-in')
+        client.batches.create.return_value = Mock(id='batch-1', status='completed', output_file_id='file-out')
+        client.files.content.return_value = Mock(text='')
+        self.extractor.client = client
+        
+        groups = self.extractor._pack_by_tokens(
+            [self.extractor._improvement_request(c) for c in comparisons], list(range(8))
+        )
+        results = self.extractor.extract_improvement_suggestions_batch(comparisons)
+        
+        assert len(groups) > 1
+        assert sorted(i for group in groups for i in group) == list(range(8))
+        assert client.batches.create.call_count == len(groups)
+        assert len(results) == 8
+
+    @patch('evaluation.core.feedback_extractor.AsyncOpenAI')
+    def test_extract_many_runs_requests_concurrently(self, mock_async_openai):
+        """Test concurrent extraction keeps input order across both extraction types"""
+        
+        import asyncio
+        
+        class FakeStream:
+            """Streams content in small chunks, then pads with whitespace like JSON mode can"""
+            def __init__(self, content):
+                self.chunks = [content[i:i + 7] for i in range(0, len(content), 7)] + [' \n'] * 1000
+                self.closed = False
+            def __aiter__(self):
+                return self
+            async def __anext__(self):
+                if not self.chunks:
+                    raise StopAsyncIteration
+                return Mock(choices=[Mock(delta=Mock(content=self.chunks.pop(0)))])
+            async def close(self):
+                self.closed = True
+        
+        in_flight = 0
+        peak = 0
+        streams = []
+        
+        async def create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            prompt = kwargs['messages'][1]['content']
+            if 'cultural term preservation' in prompt:
+                content = {'cultural_preservation': 0.9, 'authenticity_score': 0.8, 'cultural_insights': ['ok']}
+            else:
+                content = {'strengths': [prompt.split('"')[1]], 'weaknesses': [], 'specific_improvements': ['a', 'b'], 'pattern_insights': []}
+            stream = FakeStream(json.dumps(content))
+            streams.append(stream)
+            return stream
+        
+        client = Mock()
+        client.chat.completions.create = create
+        mock_async_openai.return_value.__aenter__.return_value = client
+        
+        comparisons = [{'slug_a': f'slug-{i}', 'slug_b': 'other'} for i in range(5)]
+        results = self.extractor.extract_many(comparisons, [{'slug_a': 'a', 'slug_b': 'b'}], max_concurrency=3)
+        
+        assert [r['strengths'][0] for r in results['improvement_suggestions']] == [f'slug-{i}' for i in range(5)]
+        assert results['cultural_feedback'][0]['cultural_preservation'] == 0.9
+        assert 1 < peak <= 3
+        # Each stream is closed once its JSON object completes, leaving the padding unread
+        assert all(stream.closed and stream.chunks for stream in streams)
+
+    def test_response_cache_skips_repeat_requests(self, tmp_path):
+        """Test that an identical request is answered from the persistent cache"""
+        
+        extractor = FeedbackExtractor(api_key="test-key", cache_dir=str(tmp_path))
+        content = json.dumps({'strengths': ['brand'], 'weaknesses': [], 'specific_improvements': ['a', 'b'], 'pattern_insights': []})
+        extractor.client = Mock()
+        extractor.client.chat.completions.create.return_value = self._completion_response(content)
+        comparison = {'slug_a': 'generic-guide', 'slug_b': 'jojo-maman-bebe-guide', 'winner': 'slug_b'}
+        
+        first = extractor.extract_improvement_suggestions(comparison)
+        
+        # A fresh extractor sharing the directory must not call the API again
+        second_extractor = FeedbackExtractor(api_key="test-key", cache_dir=str(tmp_path))
+        second_extractor.client = Mock()
+        second = second_extractor.extract_improvement_suggestions(comparison)
+        
+        assert extractor.client.chat.completions.create.call_count == 1
+        second_extractor.client.chat.completions.create.assert_not_called()
+        assert first == second
+
+    def test_malformed_response_is_not_cached(self, tmp_path):
+        """Test that a response failing to decode falls back without being cached"""
+
+        extractor = FeedbackExtractor(api_key="test-key", cache_dir=str(tmp_path))
+        content = json.dumps({'strengths': ['brand'], 'weaknesses': [], 'specific_improvements': ['a', 'b'], 'pattern_insights': []})
+        extractor.client = Mock()
+        extractor.client.chat.completions.create.side_effect = [
+            self._completion_response(content[:20]),
+            self._completion_response(content)
+        ]
+        comparison = {'slug_a': 'generic-guide', 'slug_b': 'jojo-maman-bebe-guide', 'winner': 'slug_b'}
+
+        first = extractor.extract_improvement_suggestions(comparison)
+        second = extractor.extract_improvement_suggestions(comparison)
+
+        assert 'api_error' in first
+        assert second['strengths'] == ['brand']
+        assert extractor.client.chat.completions.create.call_count == 2
+
+    def test_truncated_response_is_retried_with_larger_cap(self):
+        """Test a response cut off at max_tokens is requested once more with twice the cap"""
+        
+        content = json.dumps({'strengths': ['brand'], 'weaknesses': [], 'specific_improvements': ['a', 'b'], 'pattern_insights': []})
+        client = Mock()
+        client.chat.completions.create.side_effect = [
+            self._completion_response(content[:20], finish_reason='length'),
+            self._completion_response(content)
+        ]
+        self.extractor.client = client
+        
+        result = self.extractor.extract_improvement_suggestions({'slug_a': 'a-b', 'slug_b': 'c-d', 'winner': 'slug_b'})
+        
+        caps = [call.kwargs['max_tokens'] for call in client.chat.completions.create.call_args_list]
+        assert caps == [IMPROVEMENT_MAX_TOKENS, IMPROVEMENT_MAX_TOKENS * 2]
+        assert result['strengths'] == ['brand']
+
 
 class TestGroundTruthValidator:
     """Test validation against known V6/V7/V8 performance data"""
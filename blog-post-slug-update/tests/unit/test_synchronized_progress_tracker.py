@@ -148,7 +148,7 @@ class TestSynchronizedProgressTracker(unittest.TestCase):
             result = tracker.update_progress(True, i)
         
         # Should be 25%
-        self.assertEqual(result['percent'], 25.0)
+        self.assertEqual(tracker.percent, 25.0)
         
         # Verify in file as well
         live_progress_file = os.path.join(self.test_dir, 'live_progress.json')
@@ -262,6 +262,19 @@ class TestSynchronizedProgressTracker(unittest.TestCase):
         self.assertEqual(file_data['processed'], 10)
         self.assertEqual(file_data['failed'], 5)
     
+    @unittest.skipIf(SynchronizedProgressTracker is None, "SynchronizedProgressTracker not implemented yet")
+    def test_recovery_rejects_incomplete_progress_file(self):
+        """TEST: A progress file missing counters is not half-applied on recovery"""
+        live_progress_file = os.path.join(self.test_dir, 'live_progress.json')
+        with open(live_progress_file, 'w') as f:
+            json.dump({'processed': 7}, f)
+        
+        tracker = SynchronizedProgressTracker(self.total_count, self.test_dir)
+        
+        self.assertEqual(tracker._memory_state['processed'], 0)
+        with open(live_progress_file, 'r') as f:
+            self.assertEqual(json.load(f)['failed'], 0)
+    
     @unittest.skipIf(SynchronizedProgressTracker is None, "SynchronizedProgressTracker not implemented yet")
     def test_file_write_failure_handling(self):
         """TEST: File write failures are handled gracefully without crashing"""
@@ -327,6 +340,39 @@ class TestSynchronizedProgressTracker(unittest.TestCase):
         self.assertGreaterEqual(file_data['percent'], 0)
         self.assertLessEqual(file_data['percent'], 100)
 
+    
+    @unittest.skipIf(SynchronizedProgressTracker is None, "SynchronizedProgressTracker not implemented yet")
+    def test_throttled_persistence_batches_writes(self):
+        """TEST: persist_every_n batches file writes and close() flushes the rest"""
+        tracker = SynchronizedProgressTracker(100, self.test_dir, persist_every_n=10, persist_interval_s=60)
+        live_progress_file = os.path.join(self.test_dir, 'live_progress.json')
+        
+        with patch.object(progress_module, '_dumps', wraps=progress_module._dumps) as encode:
+            for i in range(12):
+                tracker.update_progress(True, i)
+            tracker.close()
+        
+        # At most one batched write plus the final flush, not one per update
+        self.assertLessEqual(encode.call_count, 2)
+        
+        with open(live_progress_file, 'r') as f:
+            self.assertEqual(json.load(f)['processed'], 12)
+    
+    @unittest.skipIf(SynchronizedProgressTracker is None, "SynchronizedProgressTracker not implemented yet")
+    def test_live_slot_is_current_between_batched_writes(self):
+        """TEST: The mmap slot reflects every update even when file writes are batched"""
+        tracker = SynchronizedProgressTracker(100, self.test_dir, persist_every_n=10, persist_interval_s=60)
+        
+        for i in range(3):
+            tracker.update_progress(i != 1, i)
+        
+        slot = progress_module.read_live_slot(os.path.join(self.test_dir, 'live_progress.json'))
+        self.assertEqual(slot['processed'], 3)
+        self.assertEqual(slot['failed'], 1)
+        self.assertEqual(slot['current_index'], 2)
+        self.assertEqual(slot['percent'], 3.0)
+        tracker.close()
+
 
 class TestProgressSyncError(unittest.TestCase):
     """Test custom progress synchronization error exception"""